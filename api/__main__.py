@@ -0,0 +1,73 @@
+"""
+Command-line entry point for the API package.
+
+Usage:
+    python -m api serve --workers 4 --max-requests 2000
+    python -m api loadtest recorded.jsonl --mode inprocess -n 500 -c 16
+    python -m api bundle
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m api")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_serve = sub.add_parser("serve", help="Run the pre-forking production server.")
+    p_serve.add_argument("--host", default=os.getenv("API_HOST", "127.0.0.1"))
+    p_serve.add_argument("--port", type=int, default=int(os.getenv("API_PORT", "8000")))
+    p_serve.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)))
+    p_serve.add_argument("--max-requests", type=int, default=int(os.getenv("API_MAX_REQUESTS", "0")),
+                         help="Recycle a worker after this many requests (0 = never).")
+    p_serve.add_argument("--max-requests-jitter", type=int, default=int(os.getenv("API_MAX_REQUESTS_JITTER", "0")),
+                         help="Random extra requests per worker to stagger recycling.")
+    p_serve.add_argument("--graceful-timeout", type=float, default=30.0,
+                         help="Seconds to wait for in-flight requests on stop/reload.")
+    p_serve.add_argument("--log-level", default="info")
+
+    p_load = sub.add_parser("loadtest", help="Replay a recorded request log and report latencies.")
+    from .loadtest import add_arguments
+
+    add_arguments(p_load)
+
+    p_bundle = sub.add_parser("bundle", help="Compile fonts, icons and coverage data into the asset bundle.")
+    p_bundle.add_argument("-o", "--output", default=None,
+                          help="Bundle file (default: PDF_UTILS_BUNDLE or the pdf_utils cache directory).")
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _build_parser().parse_args(argv)
+
+    if args.command == "serve":
+        from .server import serve
+
+        serve(
+            args.host,
+            args.port,
+            workers=args.workers,
+            max_requests=args.max_requests,
+            max_requests_jitter=args.max_requests_jitter,
+            graceful_timeout=args.graceful_timeout,
+            log_level=args.log_level,
+        )
+    elif args.command == "loadtest":
+        from .loadtest import run_from_args
+
+        sys.exit(run_from_args(args))
+    elif args.command == "bundle":
+        import json
+
+        from .pdf_utils.bundle import BUNDLE_PATH, build_bundle
+
+        print(json.dumps(build_bundle(args.output or BUNDLE_PATH), indent=2))
+
+
+if __name__ == "__main__":
+    main()
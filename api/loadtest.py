@@ -0,0 +1,323 @@
+"""
+Traffic replay and load-test harness for the resume API.
+
+Replays a JSONL request log (saved profiles, or logs captured with
+API_RECORD_REQUESTS) against a running server, in-process against
+``api.main:app``, or against a local mock that isolates client overhead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import itertools
+import json
+import math
+import random
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+import httpx
+
+FORM_FIELDS = (
+    "name", "location", "phone", "email", "github", "linkedin", "birthdate",
+    "projects_text", "education_text", "sections_left_text", "sections_right_text",
+    "skills_text", "languages_text", "rtl_mode", "fit_page", "linearize", "template",
+    "structured",
+)
+
+_MOCK_PDF = b"%PDF-1.4\n%mock\n%%EOF\n"
+
+
+def load_records(path: str, limit: int = 0) -> List[dict]:
+    """
+    Reads request records from a JSONL log.
+
+    Args:
+        path (str): JSONL file; one request object per line.
+        limit (int): Maximum number of records to read (0 = all).
+
+    Returns:
+        List[dict]: Parsed records, in file order.
+    """
+    out: List[dict] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                out.append(json.loads(line))
+                if limit and len(out) >= limit:
+                    break
+    return out
+
+
+def to_multipart(rec: Mapping[str, Any]) -> Tuple[Dict[str, str], Optional[dict]]:
+    """
+    Converts a record (form-field or profile layout) into multipart data and files.
+
+    Returns:
+        Tuple[Dict[str, str], Optional[dict]]: Form fields and the optional photo file.
+    """
+    data: Dict[str, str] = {}
+    for k in FORM_FIELDS:
+        v = rec.get(k)
+        if v is None or v == "":
+            continue
+        if k == "structured" and not isinstance(v, str):
+            v = json.dumps(v, ensure_ascii=False)
+        elif k in ("rtl_mode", "fit_page", "linearize"):
+            v = "true" if (v is True or str(v).strip().lower() == "true") else "false"
+        data[k] = str(v)
+    for key, text_key in (("skills", "skills_text"), ("languages", "languages_text")):
+        if text_key not in data and rec.get(key):
+            v = rec[key]
+            data[text_key] = ", ".join(v) if isinstance(v, list) else str(v)
+
+    files = None
+    if rec.get("photo_b64"):
+        files = {
+            "photo": (
+                rec.get("photo_name") or "photo.png",
+                base64.b64decode(rec["photo_b64"]),
+                rec.get("photo_mime") or "image/png",
+            )
+        }
+    return data, files
+
+
+def parse_server_timing(header: str) -> Dict[str, float]:
+    """Parses a Server-Timing header into {stage: milliseconds}."""
+    out: Dict[str, float] = {}
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        for p in params.split(";"):
+            k, _, v = p.strip().partition("=")
+            if k == "dur" and name:
+                try:
+                    out[name] = float(v)
+                except ValueError:
+                    pass
+    return out
+
+
+def percentile(sorted_vals: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list (q in 0..100)."""
+    if not sorted_vals:
+        return 0.0
+    idx = min(len(sorted_vals) - 1, max(0, math.ceil(q / 100.0 * len(sorted_vals)) - 1))
+    return sorted_vals[idx]
+
+
+@dataclass
+class LoadReport:
+    """Aggregated results of a load run."""
+
+    wall_seconds: float = 0.0
+    latencies_ms: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+    stages_ms: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    bytes_received: int = 0
+
+    @property
+    def total(self) -> int:
+        return len(self.latencies_ms)
+
+    @property
+    def failed(self) -> int:
+        return sum(self.errors.values()) + sum(n for s, n in self.statuses.items() if s >= 400)
+
+    def as_dict(self) -> dict:
+        lat = sorted(self.latencies_ms)
+        return {
+            "requests": self.total,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "throughput_rps": round(self.total / self.wall_seconds, 2) if self.wall_seconds else 0.0,
+            "error_rate": round(self.failed / self.total, 4) if self.total else 0.0,
+            "statuses": dict(self.statuses),
+            "errors": dict(self.errors),
+            "latency_ms": {
+                "mean": round(sum(lat) / len(lat), 2) if lat else 0.0,
+                **{f"p{q}": round(percentile(lat, q), 2) for q in (50, 90, 95, 99)},
+                "max": round(lat[-1], 2) if lat else 0.0,
+            },
+            "server_stages_ms": {
+                name: {
+                    "mean": round(sum(v) / len(v), 2),
+                    "p50": round(percentile(sorted(v), 50), 2),
+                    "p99": round(percentile(sorted(v), 99), 2),
+                }
+                for name, v in self.stages_ms.items() if v
+            },
+            "mb_received": round(self.bytes_received / 1e6, 2),
+        }
+
+
+def _mock_transport(delay: float = 0.0) -> httpx.AsyncBaseTransport:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        if delay:
+            await asyncio.sleep(delay)
+        return httpx.Response(200, content=_MOCK_PDF, headers={"content-type": "application/pdf"})
+
+    return httpx.MockTransport(handler)
+
+
+def _make_client(mode: str, target: str, timeout: float, mock_delay: float) -> httpx.AsyncClient:
+    if mode == "http":
+        limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+        return httpx.AsyncClient(base_url=target, timeout=timeout, limits=limits)
+    if mode == "inprocess":
+        from .main import app
+
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://inprocess", timeout=timeout)
+    if mode == "mock":
+        return httpx.AsyncClient(transport=_mock_transport(mock_delay), base_url="http://mock", timeout=timeout)
+    raise ValueError(f"unknown mode: {mode}")
+
+
+async def run_load(
+    records: List[dict],
+    *,
+    mode: str = "http",
+    target: str = "http://127.0.0.1:8000",
+    endpoint: str = "/generate-form",
+    requests: int = 0,
+    duration: float = 0.0,
+    concurrency: int = 8,
+    rate: float = 0.0,
+    timeout: float = 60.0,
+    mock_delay: float = 0.0,
+    seed: int | None = None,
+) -> LoadReport:
+    """
+    Replays records and measures client- and server-side latencies.
+
+    Without ``rate`` the run is closed-loop: ``concurrency`` clients send
+    back-to-back requests. With ``rate`` it is open-loop: requests arrive as a
+    Poisson process at ``rate`` per second, capped at ``concurrency`` in flight.
+
+    Args:
+        records (List[dict]): Requests to replay, cycled as needed.
+        mode (str): "http", "inprocess" or "mock".
+        target (str): Base URL for http mode.
+        endpoint (str): Path to POST records to that have no ``endpoint`` of
+            their own (recorded logs carry the path each request was sent to).
+        requests (int): Total requests (0 = one pass over records unless duration is set).
+        duration (float): Stop issuing requests after this many seconds (0 = no limit).
+        concurrency (int): Maximum requests in flight.
+        rate (float): Mean arrival rate in requests/second (0 = closed loop).
+        timeout (float): Per-request timeout in seconds.
+        mock_delay (float): Artificial server time for mock mode.
+        seed (int | None): Seed for arrival jitter.
+
+    Returns:
+        LoadReport: Collected measurements.
+    """
+    if not records:
+        raise ValueError("no records to replay")
+    if not requests and not duration:
+        requests = len(records)
+
+    prepared = [(r.get("endpoint") or endpoint, *to_multipart(r)) for r in records]
+    source: Iterator[Tuple[str, Dict[str, str], Optional[dict]]] = itertools.cycle(prepared)
+    report = LoadReport()
+    rng = random.Random(seed)
+    sem = asyncio.Semaphore(max(1, concurrency))
+    issued = 0
+    t_start = time.perf_counter()
+
+    def more() -> bool:
+        if requests and issued >= requests:
+            return False
+        if duration and time.perf_counter() - t_start >= duration:
+            return False
+        return True
+
+    async with _make_client(mode, target, timeout, mock_delay) as client:
+
+        async def one(path: str, data: Dict[str, str], files: Optional[dict]) -> None:
+            t0 = time.perf_counter()
+            try:
+                resp = await client.post(path, data=data, files=files)
+                report.statuses[resp.status_code] += 1
+                report.bytes_received += len(resp.content)
+                for name, ms in parse_server_timing(resp.headers.get("server-timing", "")).items():
+                    report.stages_ms[name].append(ms)
+            except Exception as e:
+                report.errors[type(e).__name__] += 1
+            finally:
+                report.latencies_ms.append((time.perf_counter() - t0) * 1000.0)
+
+        if rate:
+            tasks = set()
+
+            async def gated(path, data, files):
+                async with sem:
+                    await one(path, data, files)
+
+            next_at = time.perf_counter()
+            while more():
+                path, data, files = next(source)
+                issued += 1
+                t = asyncio.create_task(gated(path, data, files))
+                tasks.add(t)
+                t.add_done_callback(tasks.discard)
+                next_at += rng.expovariate(rate)
+                delay = next_at - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            if tasks:
+                await asyncio.gather(*tasks)
+        else:
+
+            async def worker() -> None:
+                nonlocal issued
+                while more():
+                    issued += 1
+                    path, data, files = next(source)
+                    await one(path, data, files)
+
+            await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+
+    report.wall_seconds = time.perf_counter() - t_start
+    return report
+
+
+def add_arguments(parser) -> None:
+    """Registers the load-test options on an argparse (sub)parser."""
+    parser.add_argument("log", help="JSONL request log to replay")
+    parser.add_argument("--mode", choices=("http", "inprocess", "mock"), default="http",
+                        help="Send over HTTP, in-process against api.main:app, or to a local mock")
+    parser.add_argument("--target", default="http://127.0.0.1:8000", help="Base URL for http mode")
+    parser.add_argument("--endpoint", default="/generate-form",
+                        help="Path for records without their own 'endpoint' field")
+    parser.add_argument("-n", "--requests", type=int, default=0, help="Total requests (default: one pass)")
+    parser.add_argument("-d", "--duration", type=float, default=0.0, help="Run for this many seconds")
+    parser.add_argument("-c", "--concurrency", type=int, default=8)
+    parser.add_argument("-r", "--rate", type=float, default=0.0, help="Open-loop arrivals per second")
+    parser.add_argument("--limit", type=int, default=0, help="Only load the first N records")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--mock-delay", type=float, default=0.0, help="Simulated server time in mock mode (s)")
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def run_from_args(args) -> int:
+    """Runs a load test from parsed arguments and prints a JSON report."""
+    records = load_records(args.log, args.limit)
+    report = asyncio.run(run_load(
+        records,
+        mode=args.mode,
+        target=args.target,
+        endpoint=args.endpoint,
+        requests=args.requests,
+        duration=args.duration,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        timeout=args.timeout,
+        mock_delay=args.mock_delay,
+        seed=args.seed,
+    ))
+    print(json.dumps(report.as_dict(), indent=2))
+    return 1 if report.failed else 0
@@ -1,12 +1,65 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from .pdf_utils import warm_up
+from .utils.outputs import close_store
+from .utils.recorder import close_recorder
+from .utils.render_pool import get_executor, shutdown_executor, start_executor
 from .routes.generate_form import router as generate_form_router
+from .routes.health import router as health_router
+from .routes.outputs import router as outputs_router
+from .routes.preview import router as preview_router
+from .routes.profiles import router as profiles_router
+from .routes.resume import router as resume_router
+from .routes.templates import router as templates_router
+
+logger = logging.getLogger(__name__)
+
+
+async def _warm_up(app: FastAPI) -> None:
+    """Runs the render warm-up on the render executor and flips readiness when done."""
+    try:
+        loop = asyncio.get_running_loop()
+        app.state.warmup_seconds = await loop.run_in_executor(get_executor(), warm_up)
+        app.state.ready = True
+        logger.info("Warm-up finished in %.3fs", app.state.warmup_seconds)
+    except Exception as e:
+        app.state.warmup_error = repr(e)
+        logger.exception("Warm-up failed")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Starts the render executor, then the warm-up in the background so /healthz
+    answers immediately.
+    """
+    start_executor()
+    app.state.ready = False
+    app.state.warmup_seconds = 0.0
+    app.state.warmup_error = None
+    task = None
+    if os.getenv("API_WARMUP", "1").strip().lower() in ("0", "false", "no"):
+        app.state.ready = True
+    else:
+        task = asyncio.create_task(_warm_up(app))
+    yield
+    if task is not None and not task.done():
+        task.cancel()
+    shutdown_executor()
+    close_store()
+    close_recorder()
+
 
 # Initialize the FastAPI application
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # Add CORS middleware to allow cross-origin requests
 app.add_middleware(
@@ -19,3 +72,9 @@ app.add_middleware(
 
 # Register the routers
 app.include_router(generate_form_router)
+app.include_router(health_router)
+app.include_router(outputs_router)
+app.include_router(preview_router)
+app.include_router(profiles_router)
+app.include_router(resume_router)
+app.include_router(templates_router)
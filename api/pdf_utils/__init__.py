@@ -1,3 +1,4 @@
-from .resume import build_resume_pdf
+from .resume import build_resume_pdf, input_digest
+from .warmup import preload_assets, warm_up
 
-__all__ = ["build_resume_pdf"]
+__all__ = ["build_resume_pdf", "input_digest", "preload_assets", "warm_up"]
@@ -0,0 +1,12 @@
+"""
+Batch renderer entry point.
+
+Usage:
+    python -m api.pdf_utils requests.jsonl profiles/ -o outputs -j 8
+"""
+
+import sys
+
+from .batch import main
+
+sys.exit(main())
@@ -0,0 +1,264 @@
+"""
+Batch rendering of saved profiles and JSONL request logs into PDF files.
+
+Records are streamed lazily from their sources and rendered on a process
+pool with a bounded number of jobs in flight, so arbitrarily large inputs
+run in constant memory.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Deque, Iterable, Iterator, List, NamedTuple, Optional, Set
+
+from .resume import build_resume_pdf
+
+# Characters allowed in output file names taken from record ids.
+_UNSAFE_NAME = re.compile(r"[^\w.-]")
+
+
+class Job(NamedTuple):
+    """A single record to render."""
+
+    key: str  # Name derived from the source; names the output if the record has no id
+    source: str  # File the record came from
+    lineno: int  # 1-based line for JSONL, 0 for profile files
+    text: Optional[str]  # JSON text for JSONL records; profile files are read by the worker
+    index: int = 0  # 0-based position among all jobs of the batch
+
+
+class Result(NamedTuple):
+    """Outcome of rendering one Job."""
+
+    key: str
+    source: str
+    lineno: int
+    output: Optional[str]
+    size: int
+    seconds: float
+    error: Optional[str]
+
+
+@dataclass
+class Summary:
+    """Aggregated batch statistics."""
+
+    total: int = 0
+    ok: int = 0
+    failed: int = 0
+    bytes: int = 0
+    render_seconds: float = 0.0
+    wall_seconds: float = 0.0
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.total / self.wall_seconds if self.wall_seconds else 0.0
+
+
+def iter_jobs(sources: Iterable[str]) -> Iterator[Job]:
+    """
+    Lazily yields render jobs from JSONL files, ``-`` (stdin) or profile directories.
+
+    Args:
+        sources (Iterable[str]): Paths to ``.jsonl`` files, directories of ``.json``
+            profiles, single ``.json`` profiles, or ``-`` for stdin.
+
+    Yields:
+        Job: One job per record, numbered in order; blank JSONL lines are skipped.
+    """
+    for index, job in enumerate(_iter_sources(sources)):
+        yield job._replace(index=index)
+
+
+def _iter_sources(sources: Iterable[str]) -> Iterator[Job]:
+    for src in sources:
+        if src == "-":
+            yield from _iter_jsonl(sys.stdin, "stdin")
+            continue
+        p = Path(src)
+        if p.is_dir():
+            with os.scandir(p) as it:
+                for entry in it:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        yield Job(Path(entry.name).stem, entry.path, 0, None)
+        elif p.suffix == ".json":
+            yield Job(p.stem, str(p), 0, None)
+        else:
+            with p.open("r", encoding="utf-8") as f:
+                yield from _iter_jsonl(f, str(p))
+
+
+def _iter_jsonl(f, source: str) -> Iterator[Job]:
+    stem = Path(source).stem
+    for lineno, line in enumerate(f, 1):
+        if line.strip():
+            yield Job(f"{stem}-{lineno:06d}", source, lineno, line)
+
+
+def output_name(job: Job, record_id: object = None) -> str:
+    """
+    Returns the output file stem of a job: its index, then the record id or job key.
+
+    The id comes from the input, so anything but word characters, ``.`` and
+    ``-`` is replaced; the index keeps records that share an id apart.
+    """
+    name = _UNSAFE_NAME.sub("_", str(record_id))[:100] if record_id else job.key
+    return f"{job.index:06d}-{name}"
+
+
+def render_job(job: Job, out_dir: str) -> Result:
+    """
+    Renders a job into ``out_dir`` and reports its outcome (never raises).
+
+    Runs in pool workers; the PDF is written there so only metadata travels back.
+    """
+    from ..utils.payload import render_kwargs
+
+    t0 = time.perf_counter()
+    key = output_name(job)
+    try:
+        if job.text is not None:
+            record = json.loads(job.text)
+        else:
+            with open(job.source, "r", encoding="utf-8") as f:
+                record = json.load(f)
+        if not isinstance(record, dict):
+            raise ValueError("record is not a JSON object")
+        key = output_name(job, record.get("id") or record.get("request_id"))
+        pdf = build_resume_pdf(**render_kwargs(record))
+        out = Path(out_dir) / f"{key}.pdf"
+        tmp = out.with_suffix(".pdf.tmp")
+        tmp.write_bytes(pdf)
+        os.replace(tmp, out)
+        return Result(key, job.source, job.lineno, str(out), len(pdf), time.perf_counter() - t0, None)
+    except Exception as e:
+        return Result(key, job.source, job.lineno, None, 0, time.perf_counter() - t0, f"{type(e).__name__}: {e}")
+
+
+def _init_worker() -> None:
+    from .warmup import preload_assets
+
+    preload_assets()
+
+
+def run_batch(
+    jobs: Iterable[Job],
+    out_dir: str | Path = "outputs",
+    *,
+    workers: int = 0,
+    ordered: bool = True,
+    window: int = 0,
+    on_result: Optional[Callable[[Result], None]] = None,
+) -> Summary:
+    """
+    Renders jobs on a process pool.
+
+    Args:
+        jobs (Iterable[Job]): Lazily produced jobs.
+        out_dir (str | Path): Directory for the PDFs (created if missing).
+        workers (int): Pool size; 0 uses the CPU count, 1 renders in-process.
+        ordered (bool): Report results in input order instead of completion order.
+        window (int): Max jobs in flight; 0 means four per worker.
+        on_result (Callable | None): Called once per Result.
+
+    Returns:
+        Summary: Throughput and failure counts.
+    """
+    out_dir = str(out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    window = window or workers * 4
+    summary = Summary()
+    t0 = time.perf_counter()
+
+    def emit(res: Result) -> None:
+        summary.total += 1
+        summary.render_seconds += res.seconds
+        if res.error:
+            summary.failed += 1
+        else:
+            summary.ok += 1
+            summary.bytes += res.size
+        if on_result:
+            on_result(res)
+
+    if workers == 1:
+        _init_worker()
+        for job in jobs:
+            emit(render_job(job, out_dir))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            queue: Deque[Future] = deque()
+            pending: Set[Future] = set()
+            for job in jobs:
+                fut = pool.submit(render_job, job, out_dir)
+                pending.add(fut)
+                if ordered:
+                    queue.append(fut)
+                if len(pending) >= window:
+                    _drain(queue, pending, ordered, emit)
+            while pending:
+                _drain(queue, pending, ordered, emit)
+
+    summary.wall_seconds = time.perf_counter() - t0
+    return summary
+
+
+def _drain(queue: Deque[Future], pending: Set[Future], ordered: bool, emit) -> None:
+    """Waits for at least one result to become reportable and emits all that are."""
+    if ordered:
+        queue[0].result()
+        while queue and queue[0].done():
+            fut = queue.popleft()
+            pending.discard(fut)
+            emit(fut.result())
+        return
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for fut in done:
+        pending.discard(fut)
+        emit(fut.result())
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Command-line entry point; returns a process exit code."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m api.pdf_utils",
+        description="Render resume PDFs from JSONL files or directories of saved profiles.",
+    )
+    parser.add_argument("sources", nargs="+", help="JSONL files, profile directories, .json files, or '-' for stdin")
+    parser.add_argument("-o", "--out", default="outputs", help="Output directory (default: outputs)")
+    parser.add_argument("-j", "--jobs", type=int, default=0, help="Worker processes (0 = CPU count, 1 = in-process)")
+    parser.add_argument("--unordered", action="store_true", help="Report results as they complete")
+    parser.add_argument("--window", type=int, default=0, help="Max records in flight (default: 4 per worker)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only print the summary")
+    args = parser.parse_args(argv)
+
+    def report(res: Result) -> None:
+        if args.quiet and not res.error:
+            return
+        print(json.dumps(res._asdict(), ensure_ascii=False), flush=True)
+
+    summary = run_batch(
+        iter_jobs(args.sources),
+        args.out,
+        workers=args.jobs,
+        ordered=not args.unordered,
+        window=args.window,
+        on_result=report,
+    )
+    print(
+        f"rendered {summary.ok}/{summary.total} ({summary.failed} failed) in {summary.wall_seconds:.2f}s "
+        f"- {summary.docs_per_second:.1f} docs/s, {summary.bytes / 1e6:.1f} MB",
+        file=sys.stderr,
+    )
+    return 1 if summary.failed else 0
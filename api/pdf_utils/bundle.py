@@ -0,0 +1,371 @@
+"""
+Precompiled asset bundle: font faces, icon rasters and coverage bitmaps in one file.
+
+``python -m api bundle`` compiles what the renderer otherwise locates and
+decodes one by one at startup into a single versioned file. When the file
+exists and was built from the same sources (ReportLab version, asset
+directory, font search results, and the path, size and mtime of every
+font and icon file), the renderer memory-maps it and takes fonts, icons
+and coverage data from it without parsing fonts or decoding images.
+Otherwise the assets are loaded from the filesystem as usual.
+"""
+
+from __future__ import annotations
+
+import marshal
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from reportlab import Version as RL_VERSION
+from reportlab.lib.utils import ImageReader
+
+from .paths import ASSETS, CACHE_DIR, ICONS_DIR
+
+BUNDLE_PATH = Path(os.getenv("PDF_UTILS_BUNDLE") or CACHE_DIR / "assets.bundle")
+BUNDLE_FORMAT = 1
+
+_MAGIC = b"PDFUBNDL"
+_PREFIX = struct.Struct("<8sII")  # magic, format, header size
+# Data section and font files start on multiples of this, so fonts can be
+# mapped on their own (mmap offsets must be multiples of the allocation
+# granularity: 4 KiB on Linux and macOS, 64 KiB on Windows).
+_ALIGN = 64 * 1024
+
+Ref = Tuple[int, int]  # (offset from the data section, length)
+
+
+def bundle_stamp() -> Dict[str, Any]:
+    """
+    Returns what a bundle must have been built from to be used by this process.
+
+    Besides the format and library versions this covers the current font
+    search results and the path, size and mtime of each source file, so
+    adding, replacing or removing a font or icon invalidates the bundle.
+    Only file metadata is read.
+    """
+    from .fonts import find_arabic_font, find_symbol_font
+
+    fonts = {}
+    for role, find in (("arabic", find_arabic_font), ("symbol", find_symbol_font)):
+        name, path = find()
+        fonts[role] = (name, _file_stamp(path) if path is not None else None)
+    icons = {}
+    if ICONS_DIR.is_dir():
+        for p in sorted(ICONS_DIR.glob("*.png")):
+            icons[p.name] = _file_stamp(p)
+    return {
+        "format": BUNDLE_FORMAT,
+        "reportlab": RL_VERSION,
+        "marshal": marshal.version,
+        "assets": str(ASSETS),
+        "fonts": fonts,
+        "icons": icons,
+    }
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[str, int, int]]:
+    """Returns (resolved path, size, mtime in ns) of a file, or None if it cannot be read."""
+    try:
+        p = Path(path).resolve()
+        st = p.stat()
+    except OSError:
+        return None
+    return str(p), st.st_size, st.st_mtime_ns
+
+
+def _aligned(n: int) -> int:
+    return -(-n // _ALIGN) * _ALIGN
+
+
+class BundledImage(ImageReader):
+    """ImageReader over pixel data from the bundle; needs neither the image file nor Pillow."""
+
+    def __init__(self, name: str, size: Tuple[int, int], mode: str, data: bytes,
+                 alpha: Optional["BundledImage"] = None, transparent: Optional[tuple] = None):
+        self.fileName = name
+        self._ident = None
+        self._image = None
+        self.fp = None
+        self._width, self._height = size
+        self.mode = mode
+        self._data = data
+        self._dataA = alpha
+        self._transparent = transparent
+
+    def getTransparent(self):
+        return self._transparent
+
+
+class AssetBundle:
+    """
+    A bundle file mapped into memory.
+
+    The header (font metrics, icon and coverage tables) is decoded from the
+    mapping in one go; font files stay mapped and are handed to the font
+    faces as they are, so subsetting reads them from the page cache.
+
+    Args:
+        path (Path): Bundle file.
+
+    Raises:
+        OSError: If the file cannot be opened or mapped.
+        ValueError: If it is not a bundle or its stamp does not match bundle_stamp().
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                magic, fmt, size = _PREFIX.unpack_from(self.map, 0)
+            except struct.error:
+                raise ValueError("file too short for an asset bundle")
+            if magic != _MAGIC or fmt != BUNDLE_FORMAT:
+                raise ValueError(f"not an asset bundle of format {BUNDLE_FORMAT}")
+            try:
+                self.header: Dict[str, Any] = marshal.loads(self.map[_PREFIX.size:_PREFIX.size + size])
+            except (EOFError, TypeError) as e:
+                raise ValueError(f"corrupt bundle header: {e}")
+            built, now = self.header.get("stamp") or {}, bundle_stamp()
+            stale = [k for k in now if built.get(k) != now[k]]
+            if stale:
+                raise ValueError(f"bundle is out of date ({', '.join(stale)} changed); run 'python -m api bundle'")
+            self.base = _aligned(_PREFIX.size + size)
+            self._font_maps: Dict[str, mmap.mmap] = {}
+            for role, entry in self.header["fonts"].items():
+                if entry["data"]:
+                    off, n = entry["data"]
+                    self._font_maps[role] = mmap.mmap(f.fileno(), n, offset=self.base + off, access=mmap.ACCESS_READ)
+        self._images: Dict[str, BundledImage] = {}
+
+    def _bytes(self, ref: Ref) -> bytes:
+        off, n = ref
+        return self.map[self.base + off:self.base + off + n]
+
+    def font(self, role: str) -> Optional[dict]:
+        """
+        Returns the font recorded for ``role`` ("arabic" or "symbol").
+
+        The entry has the font ``name``, the source ``path`` and the parsed
+        ``face`` state; path and face are None if no font file was found at
+        build time.
+        """
+        return self.header["fonts"].get(role)
+
+    def font_data(self, role: str) -> Optional[mmap.mmap]:
+        """Returns the memory-mapped font file of ``role``, if it has one."""
+        return self._font_maps.get(role)
+
+    def has_image(self, name: str) -> bool:
+        """True if icon file ``name`` (e.g. ``pin.png``) is in the bundle."""
+        return name in self.header["images"]
+
+    def image(self, name: str) -> Optional[BundledImage]:
+        """Returns the decoded icon ``name`` as an image reader, or None if it is not bundled."""
+        hit = self._images.get(name)
+        if hit is None:
+            entry = self.header["images"].get(name)
+            if entry is None:
+                return None
+            alpha = None
+            if entry["alpha"] is not None:
+                alpha = BundledImage(name + "#alpha", entry["size"], "L", self._bytes(entry["alpha"]))
+            hit = BundledImage(name, entry["size"], entry["mode"], self._bytes(entry["rgb"]), alpha, entry["transparent"])
+            self._images[name] = hit
+        return hit
+
+    def coverage(self, font_name: str) -> Optional[bytes]:
+        """Returns the coverage bitmap of ``font_name``, or None if it is not bundled."""
+        ref = self.header["coverage"].get(font_name)
+        return None if ref is None else self._bytes(ref)
+
+    def info(self) -> dict:
+        """Returns the path, build time, size and contents of the bundle."""
+        return {
+            "path": str(self.path),
+            "built": self.header["built"],
+            "size": len(self.map),
+            "fonts": {role: e["path"] for role, e in self.header["fonts"].items()},
+            "images": sorted(self.header["images"]),
+            "coverage": sorted(self.header["coverage"]),
+        }
+
+
+_bundle: Optional[AssetBundle] = None
+_bundle_error: Optional[str] = None
+_bundle_loaded = False
+_bundle_lock = threading.Lock()
+
+
+def get_bundle() -> Optional[AssetBundle]:
+    """
+    Returns the process-wide asset bundle, loaded on first use.
+
+    Returns:
+        Optional[AssetBundle]: None if BUNDLE_PATH does not exist or cannot
+        be used (see bundle_info() for the reason); assets then come from
+        the filesystem as usual.
+    """
+    global _bundle, _bundle_error, _bundle_loaded
+    with _bundle_lock:
+        if not _bundle_loaded:
+            _bundle_loaded = True
+            try:
+                _bundle = AssetBundle(BUNDLE_PATH)
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                _bundle_error = str(e)
+        return _bundle
+
+
+def bundle_info() -> dict:
+    """Returns whether the asset bundle is in use, with its contents or the reason it is not."""
+    bundle = get_bundle()
+    if bundle is not None:
+        return {"loaded": True, **bundle.info()}
+    return {"loaded": False, "path": str(BUNDLE_PATH), "error": _bundle_error}
+
+
+class _Writer:
+    """Collects data blobs and lays them out after the header."""
+
+    def __init__(self) -> None:
+        self.parts: List[bytes] = []
+        self.size = 0
+
+    def add(self, data: bytes, align: bool = False) -> Ref:
+        if align and self.size % _ALIGN:
+            pad = _ALIGN - self.size % _ALIGN
+            self.parts.append(b"\0" * pad)
+            self.size += pad
+        ref = (self.size, len(data))
+        self.parts.append(data)
+        self.size += len(data)
+        return ref
+
+
+def _compile_font(w: _Writer, name: str, path: Optional[Path]) -> Tuple[dict, Any]:
+    """Parses a font file from scratch; returns its bundle entry and a font object for coverage."""
+    from .fonts import CachedTTFontFace, SharedTTFont
+
+    if path is None:
+        return {"name": name, "path": None, "face": None, "data": None}, None
+    face = CachedTTFontFace(path)
+    entry = {
+        "name": name,
+        "path": str(Path(path).resolve()),
+        "face": face.state(),
+        "data": w.add(Path(path).read_bytes(), align=True),
+    }
+    return entry, SharedTTFont(name, path, face=face)
+
+
+def _compile_image(w: _Writer, path: Path) -> dict:
+    img = ImageReader(str(path))
+    rgb = img.getRGBData()
+    alpha = img._dataA
+    return {
+        "size": tuple(img.getSize()),
+        "mode": img.mode,
+        "rgb": w.add(rgb),
+        "alpha": None if alpha is None else w.add(alpha.getRGBData()),
+        "transparent": None if alpha is not None else _transparent(img),
+    }
+
+
+def _transparent(img: ImageReader) -> Optional[tuple]:
+    tc = img.getTransparent()
+    return None if tc is None else tuple(tc)
+
+
+def build_bundle(path: Path = BUNDLE_PATH) -> dict:
+    """
+    Compiles the fonts, icons and coverage bitmaps found on this system into a bundle.
+
+    Everything is read from the asset directory and the system font paths
+    as they are now, never from an existing bundle. Bundled are: the Arabic
+    and symbol fonts (file and parsed metric tables), every PNG in ICONS_DIR
+    (decoded pixel data and alpha channel) and the coverage bitmaps of the
+    fallback and template fonts. The file is replaced atomically; running
+    processes keep using their mapping of the old one.
+
+    Args:
+        path (Path): Output file.
+
+    Returns:
+        dict: The written path, its size and what it contains.
+    """
+    from reportlab.pdfbase import pdfmetrics
+
+    from .fallback import Coverage, _font_codepoints
+    from .fonts import find_arabic_font, find_symbol_font
+    from .templates import get_template, list_templates
+
+    w = _Writer()
+    fonts: Dict[str, dict] = {}
+    fresh: Dict[str, Any] = {}
+    names = ["Helvetica"]
+    for role, find in (("arabic", find_arabic_font), ("symbol", find_symbol_font)):
+        name, font_path = find()
+        fonts[role], font = _compile_font(w, name, font_path)
+        if font is not None:
+            fresh[name] = font
+            names.append(name)
+
+    images: Dict[str, dict] = {}
+    if ICONS_DIR.is_dir():
+        for p in sorted(ICONS_DIR.glob("*.png")):
+            try:
+                images[p.name] = _compile_image(w, p)
+            except Exception:
+                continue  # Unreadable icons are skipped, as at render time.
+
+    for tname in list_templates():
+        t = get_template(tname)
+        names += [t.font, t.font_bold, t.font_italic, t.value_font]
+    coverage: Dict[str, Ref] = {}
+    for name in dict.fromkeys(names):
+        font = fresh.get(name) or pdfmetrics.getFont(name)
+        coverage[name] = w.add(Coverage.from_codepoints(_font_codepoints(font)).bits)
+
+    header = marshal.dumps({
+        "stamp": bundle_stamp(),
+        "built": time.time(),
+        "fonts": fonts,
+        "images": images,
+        "coverage": coverage,
+    })
+    prefix = _PREFIX.pack(_MAGIC, BUNDLE_FORMAT, len(header))
+    head = prefix + header
+    head += b"\0" * (_aligned(len(head)) - len(head))
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(head)
+            for part in w.parts:
+                f.write(part)
+        os.chmod(tmp, 0o644)  # mkstemp creates 0600; workers may run as another user.
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return {
+        "path": str(path),
+        "size": len(head) + w.size,
+        "fonts": {role: e["path"] for role, e in fonts.items()},
+        "images": sorted(images),
+        "coverage": sorted(coverage),
+    }
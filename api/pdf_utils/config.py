@@ -37,6 +37,7 @@ ICON_SIZE = 6 * mm
 ICON_PAD_X = 4
 ICON_TEXT_DY = -5
 ICON_VALIGN = "middle"
+ICON_STYLE = "vector"  # "vector": built-in path icons as form XObjects; "png": assets/icons only
 
 # Left inner
 LEFT_TEXT_SIZE = 12
@@ -84,4 +85,14 @@ EDU_TEXT_LEADING = 12
 # LinkedIn redirect (optional)
 LINKEDIN_REDIRECT_URL = "https://tamer.dev/in"
 USE_LINKEDIN_REDIRECT = False
-USE_MOBILE_LINKEDIN = False
\ No newline at end of file
+USE_MOBILE_LINKEDIN = False
+
+# Auto-fit (fit_page=True): smallest content scale and bisection steps
+FIT_MIN_SCALE = 0.6
+FIT_ITERATIONS = 7
+
+# Output
+# Binary (Flate-only) streams instead of ASCII85: smaller PDFs and no
+# expanded intermediate copy of every image while saving. Applied to
+# ReportLab's process-wide rl_config when the renderer is imported.
+USE_ASCII85 = False
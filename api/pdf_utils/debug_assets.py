@@ -3,6 +3,7 @@ This module provides a debug utility to print paths and font information
 related to the PDF generation assets.
 """
 
+from .bundle import bundle_info
 from .paths import ASSETS, ICONS_DIR
 from .fonts import _AR_NAME, _AR_PATH, _UI_NAME, _UI_PATH
 
@@ -12,4 +13,5 @@ def print_assets_info():
     print("ASSETS:", ASSETS)
     print("ICONS_DIR:", ICONS_DIR)
     print("Arabic font:", _AR_NAME, _AR_PATH)
-    print("Symbols font:", _UI_NAME, _UI_PATH)
\ No newline at end of file
+    print("Symbols font:", _UI_NAME, _UI_PATH)
+    print("Asset bundle:", bundle_info())
\ No newline at end of file
@@ -0,0 +1,207 @@
+"""
+Per-character font fallback for mixed-script text.
+
+Each font's character coverage is a bitmap built once from its cmap (or its
+single-byte encoding for the standard PDF fonts) and cached on disk. Text is
+split into runs that one font can render, and runs are measured and drawn
+font by font.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from functools import lru_cache
+from typing import List, Tuple
+
+from reportlab import Version as RL_VERSION
+from reportlab.pdfbase import pdfmetrics
+
+from .bundle import get_bundle
+from .fonts import AR_FONT, UI_FONT
+from .paths import CACHE_DIR
+
+# Fonts tried, in order, after the requested one.
+FALLBACK_FONTS = ("Helvetica", AR_FONT, UI_FONT)
+
+Run = Tuple[str, str]  # (font name, text)
+
+
+class Coverage:
+    """Bitmap of the code points a font can render."""
+
+    __slots__ = ("bits",)
+
+    def __init__(self, bits: bytes):
+        self.bits = bits
+
+    def __contains__(self, cp: int) -> bool:
+        i = cp >> 3
+        return i < len(self.bits) and (self.bits[i] >> (cp & 7)) & 1 == 1
+
+    @classmethod
+    def from_codepoints(cls, cps) -> "Coverage":
+        cps = list(cps)
+        bits = bytearray((max(cps) >> 3) + 1 if cps else 0)
+        for cp in cps:
+            bits[cp >> 3] |= 1 << (cp & 7)
+        return cls(bytes(bits))
+
+
+def _font_codepoints(font) -> List[int]:
+    face = getattr(font, "face", None)
+    if hasattr(face, "charToGlyph"):
+        return [cp for cp, gid in face.charToGlyph.items() if gid]
+    # Standard Type 1 fonts: whatever their single-byte encoding can express,
+    # decoded with ReportLab's codec of the same name (e.g. "winansi").
+    enc = font.encoding
+    codec = enc.name.replace("Encoding", "").lower()
+    out = []
+    for code, glyph in enumerate(enc.vector):
+        if glyph is None:
+            continue
+        try:
+            out.append(ord(bytes([code]).decode(codec)))
+        except (LookupError, UnicodeDecodeError):
+            continue
+    return out
+
+
+def _cache_key(font) -> str:
+    face = getattr(font, "face", None)
+    parts = [RL_VERSION, font.fontName]
+    path = getattr(face, "filename", None)
+    if path and os.path.isfile(path):
+        st = os.stat(path)
+        parts += [os.path.abspath(path), str(st.st_size), str(st.st_mtime_ns)]
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def coverage(font_name: str) -> Coverage:
+    """
+    Returns the coverage bitmap of a registered font, building it on first use.
+
+    Bitmaps come from the asset bundle when it has them. Otherwise they are
+    stored under ``CACHE_DIR/coverage`` keyed by font name and file identity,
+    so later processes load them instead of walking the cmap.
+    """
+    bundle = get_bundle()
+    bits = bundle.coverage(font_name) if bundle is not None else None
+    if bits is not None:
+        return Coverage(bits)
+    font = pdfmetrics.getFont(font_name)
+    path = CACHE_DIR / "coverage" / f"{_cache_key(font)}.bin"
+    try:
+        return Coverage(path.read_bytes())
+    except OSError:
+        pass
+    cov = Coverage.from_codepoints(_font_codepoints(font))
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(cov.bits)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # Read-only cache: keep the in-memory bitmap.
+    return cov
+
+
+@lru_cache(maxsize=None)
+def font_chain(font: str) -> Tuple[str, ...]:
+    """Returns ``font`` followed by the distinct fallback fonts."""
+    return tuple(dict.fromkeys((font, *FALLBACK_FONTS)))
+
+
+@lru_cache(maxsize=4096)
+def split_runs(text: str, font: str) -> Tuple[Run, ...]:
+    """
+    Splits ``text`` into runs that a single font of ``font``'s chain can render.
+
+    ASCII text, and text fully covered by ``font``, is a single run. Spaces,
+    digits and punctuation stay in the current run when its font covers them,
+    so they do not fragment runs of another script. Characters no font covers
+    are left in ``font``.
+
+    Args:
+        text (str): Text in visual order.
+        font (str): Requested font.
+
+    Returns:
+        Tuple[Run, ...]: (font name, text) pairs in drawing order.
+    """
+    chain = font_chain(font)
+    if not text or len(chain) == 1 or text.isascii():
+        return ((font, text),)
+    covs = [coverage(f) for f in chain]
+    base = covs[0]
+    if all(ord(ch) in base for ch in text):
+        return ((font, text),)
+
+    runs: List[Run] = []
+    cur_font, cur_cov, start = font, base, 0
+    for i, ch in enumerate(text):
+        cp = ord(ch)
+        if not ch.isalpha() and cp in cur_cov:
+            continue
+        k = _first(covs, cp)
+        if chain[k] != cur_font:
+            if i > start:
+                runs.append((cur_font, text[start:i]))
+            cur_font, cur_cov, start = chain[k], covs[k], i
+    runs.append((cur_font, text[start:]))
+    return tuple(runs)
+
+
+def _first(covs: List[Coverage], cp: int) -> int:
+    for k, cov in enumerate(covs):
+        if cp in cov:
+            return k
+    return 0
+
+
+def string_width(text: str, font: str, size: float) -> float:
+    """Width of ``text`` in points, measuring each fallback run in its own font."""
+    runs = split_runs(text, font)
+    if len(runs) == 1:
+        return pdfmetrics.stringWidth(text, runs[0][0], size)
+    return sum(pdfmetrics.stringWidth(t, f, size) for f, t in runs)
+
+
+def draw_string(c, x: float, y: float, text: str, font: str, size: float, align: str = "left") -> None:
+    """
+    Draws a line of text with per-run font fallback.
+
+    The canvas must already be set to ``font`` at ``size``; it is left that way.
+
+    Args:
+        c: Canvas (or DisplayList).
+        x (float): Anchor x: left edge, right edge or centre depending on ``align``.
+        y (float): Baseline.
+        text (str): Text in visual order.
+        font (str): Requested font.
+        size (float): Font size.
+        align (str): "left", "right" or "center".
+    """
+    runs = split_runs(text, font)
+    if len(runs) == 1 and runs[0][0] == font:
+        if align == "right":
+            c.drawRightString(x, y, text)
+        elif align == "center":
+            c.drawCentredString(x, y, text)
+        else:
+            c.drawString(x, y, text)
+        return
+
+    widths = [pdfmetrics.stringWidth(t, f, size) for f, t in runs]
+    if align == "right":
+        x -= sum(widths)
+    elif align == "center":
+        x -= sum(widths) / 2.0
+    for (f, t), w in zip(runs, widths):
+        c.setFont(f, size)
+        c.drawString(x, y, t)
+        x += w
+    c.setFont(font, size)
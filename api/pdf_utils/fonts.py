@@ -5,12 +5,22 @@ Includes support for registering Arabic and symbol fonts with fallback options.
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from fnmatch import fnmatch
+from functools import lru_cache
 from pathlib import Path
+from weakref import WeakKeyDictionary
+import mmap
 import platform
+import re
+import threading
+import unicodedata
 
+from reportlab import rl_config
 from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfbase.ttfonts import TTEncoding, TTFNameBytes, TTFont, TTFontFace
 
+from .bundle import get_bundle
 from .paths import ASSETS
 
 # Optional RTL support
@@ -39,6 +49,207 @@ def rtl(txt: str) -> str:
     return txt
 
 
+# Right-to-left letters (bidi classes R and AL): Hebrew through Arabic
+# Extended, the Hebrew/Arabic presentation forms and the RTL SMP blocks.
+_RTL_RE = re.compile("[\u0590-\u08ff\u200f\ufb1d-\ufdff\ufe70-\ufefc\U00010800-\U00010fff\U0001e800-\U0001efff]")
+
+
+@lru_cache(maxsize=1)
+def _bidi_table() -> bytes:
+    """Strong bidi class per BMP code point: 0 = neutral/weak, 1 = L, 2 = R/AL."""
+    table = bytearray(0x10000)
+    bidirectional = unicodedata.bidirectional
+    for cp in range(0x10000):
+        k = bidirectional(chr(cp))
+        if k == "L":
+            table[cp] = 1
+        elif k == "R" or k == "AL":
+            table[cp] = 2
+    return bytes(table)
+
+
+def has_rtl(txt: str) -> bool:
+    """True if ``txt`` contains any right-to-left letter."""
+    return bool(txt) and not txt.isascii() and _RTL_RE.search(txt) is not None
+
+
+def is_rtl_paragraph(txt: str, default: bool = False) -> bool:
+    """
+    Detects a paragraph's base direction from its first strong character (UAX #9, P2/P3).
+
+    Args:
+        txt (str): Paragraph in logical order.
+        default (bool): Direction for paragraphs without strong characters.
+
+    Returns:
+        bool: True for right-to-left.
+    """
+    if txt.isascii():
+        return False if any(ch.isalpha() for ch in txt) else default
+    table = _bidi_table()
+    for ch in txt:
+        cp = ord(ch)
+        k = table[cp] if cp < 0x10000 else (2 if _RTL_RE.match(ch) else 1 if ch.isalpha() else 0)
+        if k:
+            return k == 2
+    return default
+
+
+def shape(txt: str) -> str:
+    """Applies Arabic contextual shaping (logical order is kept)."""
+    return arabic_reshaper.reshape(txt) if AR_OK else txt
+
+
+def reorder(txt: str, rtl_base: bool) -> str:
+    """Reorders one shaped line from logical to visual order."""
+    return get_display(txt, base_dir="R" if rtl_base else "L") if AR_OK else txt
+
+
+def visual(txt: str, default_rtl: bool = False) -> tuple[str, bool]:
+    """
+    Prepares a single line for drawing.
+
+    Lines without right-to-left letters are returned unchanged and skip shaping.
+
+    Args:
+        txt (str): Line in logical order.
+        default_rtl (bool): Direction for lines without strong characters.
+
+    Returns:
+        tuple[str, bool]: Visual-order text and whether the line is right-to-left.
+    """
+    if not has_rtl(txt):
+        return txt, default_rtl and is_rtl_paragraph(txt, True)
+    rtl_base = is_rtl_paragraph(txt, default_rtl)
+    return reorder(shape(txt), rtl_base), rtl_base
+
+
+SUBSET_CACHE_SIZE = 64  # Distinct character sets kept per font face
+
+
+class _MappedFile:
+    """File-like source whose ``read()`` returns a read-only memory map."""
+
+    def __init__(self, path: Path):
+        self.name = str(path)
+
+    def read(self) -> mmap.mmap:
+        with open(self.name, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class CachedTTFontFace(TTFontFace):
+    """
+    TrueType face backed by a memory-mapped file, with memoized subsets.
+
+    The mapped pages live in the OS page cache and are shared by every process
+    that maps the same file. Subsets are keyed by their character set, so
+    documents with the same repertoire reuse the subset bytes.
+    """
+
+    def __init__(self, path: Path):
+        super().__init__(_MappedFile(path))
+        self._subsets: OrderedDict = OrderedDict()
+        self._subset_lock = threading.Lock()
+
+    # Attributes that are not parsed metrics: file data, scale function, subset cache.
+    _TRANSIENT = frozenset({"_ttf_data", "_pdfScale", "_subsets", "_subset_lock"})
+
+    def state(self) -> dict:
+        """
+        Returns the parsed tables and metrics as marshal-able plain data.
+
+        The font file itself is not included; from_state() rebuilds the face
+        from this and the file's bytes without parsing again.
+        """
+        out = {}
+        names = {}
+        for k, v in self.__dict__.items():
+            if k in self._TRANSIENT:
+                continue
+            if isinstance(v, TTFNameBytes):
+                names[k] = v.ustr
+            else:
+                out[k] = v
+        out["_names"] = names
+        return out
+
+    @classmethod
+    def from_state(cls, state: dict, data) -> "CachedTTFontFace":
+        """
+        Rebuilds a face from state() output and the font file contents.
+
+        Args:
+            state (dict): Output of state() for the same file.
+            data: The font file as bytes or a read-only memory map.
+
+        Returns:
+            CachedTTFontFace: A face equivalent to parsing the file.
+        """
+        face = cls.__new__(cls)
+        attrs = dict(state)
+        names = attrs.pop("_names")
+        face.__dict__.update(attrs)
+        for k, v in names.items():
+            setattr(face, k, TTFNameBytes(v.encode("utf-8")))
+        face._ttf_data = data
+        per_em = face.unitsPerEm
+        face._pdfScale = (lambda x: x) if per_em == 1000 else (lambda x, m=1000 / per_em: x * m)
+        face._subsets = OrderedDict()
+        face._subset_lock = threading.Lock()
+        return face
+
+    def makeSubset(self, subset):
+        key = tuple(subset)
+        # The parser keeps a read cursor on the face, so misses are serialized too.
+        with self._subset_lock:
+            data = self._subsets.get(key)
+            if data is None:
+                data = super().makeSubset(subset)
+                self._subsets[key] = data
+                if len(self._subsets) > SUBSET_CACHE_SIZE:
+                    self._subsets.popitem(last=False)
+            else:
+                self._subsets.move_to_end(key)
+            return data
+
+
+@lru_cache(maxsize=None)
+def load_face(path: str) -> CachedTTFontFace:
+    """
+    Parses a TrueType file once per process and returns the shared face.
+
+    Args:
+        path (str): Path to the font file.
+
+    Returns:
+        CachedTTFontFace: Parsed face; fonts registered under any name share it.
+    """
+    return CachedTTFontFace(Path(path))
+
+
+class SharedTTFont(TTFont):
+    """TTFont that uses the process-wide face from load_face (or a given face) instead of re-parsing."""
+
+    def __init__(self, name: str, path: Path, asciiReadable=None, shapable=True, face: TTFontFace | None = None):
+        self.fontName = name
+        self.face = face if face is not None else load_face(str(Path(path).resolve()))
+        self.encoding = TTEncoding()
+        self.state = WeakKeyDictionary()
+        if asciiReadable is None:
+            asciiReadable = rl_config.ttfAsciiReadable
+        self._asciiReadable = asciiReadable
+        self.shapable = shapable and not any(fnmatch(name, g) for g in rl_config.unShapedFontGlob)
+
+
+def _usable(p: Path) -> bool:
+    """True for existing, non-empty font files (skips placeholder assets)."""
+    try:
+        return p.is_file() and p.stat().st_size > 0
+    except OSError:
+        return False
+
+
 def register_font_safe(path: Path, name: str, fallback: str = "Helvetica") -> str:
     """
     Registers a TrueType font with a fallback in case of failure.
@@ -52,8 +263,8 @@ def register_font_safe(path: Path, name: str, fallback: str = "Helvetica") -> st
         str: Registered font name or fallback.
     """
     try:
-        if path and path.is_file():
-            pdfmetrics.registerFont(TTFont(name, str(path)))
+        if path and _usable(path):
+            pdfmetrics.registerFont(SharedTTFont(name, path))
             return name
     except Exception:
         pass
@@ -73,7 +284,7 @@ def find_arabic_font() -> tuple[str, Path | None]:
     """
     # 1) From assets
     cand = ASSETS / "NotoNaskhArabic-Regular.ttf"
-    if cand.exists():
+    if _usable(cand):
         return "NotoNaskh", cand
 
     # 2) System paths
@@ -96,7 +307,7 @@ def find_arabic_font() -> tuple[str, Path | None]:
         ]
 
     for p in candidates:
-        if p.exists():
+        if _usable(p):
             return "NotoNaskh", p
 
     return "Helvetica", None  # Fallback
@@ -122,10 +333,46 @@ def find_symbol_font() -> tuple[str, Path | None]:
     return "Helvetica", None
 
 
-# Register Arabic font
-_AR_NAME, _AR_PATH = find_arabic_font()
-AR_FONT = register_font_safe(_AR_PATH, _AR_NAME, fallback="Helvetica")
+def register_bundled_font(role: str, fallback: str = "Helvetica") -> tuple[str, str, Path | None] | None:
+    """
+    Registers the font the asset bundle recorded for ``role`` ("arabic" or "symbol").
+
+    The face is rebuilt from the bundled metric tables over the mapped font
+    file, so nothing is parsed. The bundle is only used while the font
+    search still finds the same files (see bundle_stamp).
+
+    Returns:
+        tuple[str, str, Path | None] | None: Registered font name (``fallback``
+        if no font file was found at build time), the name and path found then,
+        or None if there is no usable bundle entry.
+    """
+    bundle = get_bundle()
+    entry = bundle.font(role) if bundle is not None else None
+    if entry is None:
+        return None
+    if entry["face"] is None:
+        return fallback, entry["name"], None
+    path = Path(entry["path"])
+    try:
+        face = CachedTTFontFace.from_state(entry["face"], bundle.font_data(role))
+        pdfmetrics.registerFont(SharedTTFont(entry["name"], path, face=face))
+    except Exception:
+        return None
+    return entry["name"], entry["name"], path
+
+
+# Register Arabic font (from the asset bundle if there is one)
+_bundled = register_bundled_font("arabic")
+if _bundled is not None:
+    AR_FONT, _AR_NAME, _AR_PATH = _bundled
+else:
+    _AR_NAME, _AR_PATH = find_arabic_font()
+    AR_FONT = register_font_safe(_AR_PATH, _AR_NAME, fallback="Helvetica")
 
 # Register symbol font
-_UI_NAME, _UI_PATH = find_symbol_font()
-UI_FONT = register_font_safe(_UI_PATH, _UI_NAME, fallback="Helvetica")
+_bundled = register_bundled_font("symbol")
+if _bundled is not None:
+    UI_FONT, _UI_NAME, _UI_PATH = _bundled
+else:
+    _UI_NAME, _UI_PATH = find_symbol_font()
+    UI_FONT = register_font_safe(_UI_PATH, _UI_NAME, fallback="Helvetica")
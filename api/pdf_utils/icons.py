@@ -5,45 +5,107 @@ Includes automatic social link parsing for GitHub and LinkedIn.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from reportlab.pdfgen import canvas
-from reportlab.pdfbase import pdfmetrics
 from reportlab.lib.utils import ImageReader
-from reportlab.lib import colors
 
-from .text import wrap_text
+from .text import wrap_visual
+from .fonts import visual
+from .bundle import AssetBundle, get_bundle
 from .paths import ICONS_DIR
-from .fonts import UI_FONT  # Remove if unused
+from .vector_icons import VECTOR_ICONS, draw_vector_icon, preload_vector_icons
+from .fallback import draw_string, string_width
 from .config import (
-    LEFT_TEXT_FONT, LEFT_TEXT_FONT_BOLD, LEFT_TEXT_IS_BOLD,
     LEFT_TEXT_SIZE, LEFT_LINE_GAP,
-    ICON_SIZE, ICON_PAD_X, ICON_TEXT_DY, ICON_VALIGN,
-    HEADING_COLOR, TEXT_SIZE, LEADING_BODY,
+    ICON_SIZE, ICON_PAD_X, ICON_TEXT_DY, ICON_VALIGN, ICON_STYLE,
 )
+from .templates import Template, resolve_template
 from .social import extract_social_handle
 
 
+def _bundled(path: Path) -> AssetBundle | None:
+    """Returns the asset bundle if it covers ``path`` (the PNGs in ICONS_DIR), else None."""
+    bundle = get_bundle()
+    if bundle is None or path.parent != ICONS_DIR or path.suffix != ".png":
+        return None
+    return bundle
+
+
 def icon_path(name: str) -> Path | None:
-    """Returns the path of the icon file if it exists."""
+    """Returns the path of the icon file if it exists (or, with an asset bundle, is bundled)."""
     p = ICONS_DIR / name
+    bundle = _bundled(p)
+    if bundle is not None:
+        return p if bundle.has_image(name) else None
     return p if p.exists() else None
 
 
-ICON_PATHS: dict[str, Path | None] = {
-    "Ort": icon_path("pin.png"),
-    "Telefon": icon_path("phone.png"),
-    "E-Mail": icon_path("mail.png"),
-    "Geburtsdatum": icon_path("cake.png"),
-    "GitHub": icon_path("github.png"),
-    "LinkedIn": icon_path("linkedin.png"),
+def has_icon(path: str | Path) -> bool:
+    """True if ``path`` is a bundled icon or an existing file."""
+    bundle = _bundled(Path(path))
+    if bundle is not None:
+        return bundle.has_image(Path(path).name)
+    return Path(path).is_file()
+
+
+# Contact label -> icon name (vector icon and ``<name>.png`` in ICONS_DIR)
+ICON_NAMES: dict[str, str] = {
+    "Ort": "pin",
+    "Telefon": "phone",
+    "E-Mail": "mail",
+    "Geburtsdatum": "cake",
+    "GitHub": "github",
+    "LinkedIn": "linkedin",
 }
 
+ICON_PATHS: dict[str, Path | None] = {key: icon_path(f"{name}.png") for key, name in ICON_NAMES.items()}
+
+
+def icon_for(key: str, style: str = ICON_STYLE) -> str | Path | None:
+    """
+    Returns the icon to draw for a contact label.
+
+    With the "vector" style this is the vector icon name when one is defined;
+    otherwise (and for labels without one) the PNG path, if the file exists.
+    """
+    name = ICON_NAMES.get(key)
+    if style == "vector" and name in VECTOR_ICONS:
+        return name
+    return ICON_PATHS.get(key)
+
+
+@lru_cache(maxsize=None)
+def icon_reader(path: Path) -> ImageReader:
+    """
+    Returns a decoded, process-wide shared image reader for an icon file.
+
+    The pixel data is decoded on first use and reused by every later document;
+    icons in the asset bundle come with their pixel data already decoded.
+    """
+    bundle = _bundled(Path(path))
+    if bundle is not None:
+        img = bundle.image(Path(path).name)
+        if img is not None:
+            return img
+    img = ImageReader(str(path))
+    img.getRGBData()
+    return img
+
+
+def preload_icons() -> None:
+    """Decodes all known icons and parses the vector icons up front (e.g. before forking workers)."""
+    preload_vector_icons()
+    for p in ICON_PATHS.values():
+        if p is not None:
+            icon_reader(p)
+
 
 def draw_icon_line(
     c: canvas.Canvas,
     x: float,
     y: float,
-    icon: Path | None,
+    icon: str | Path | None,
     value: str,
     *,
     icon_w: float = ICON_SIZE,
@@ -57,21 +119,29 @@ def draw_icon_line(
     halign: str = "left",
     container_w: float | None = None,
     link_url: str | None = None,
+    template: Template | None = None,
 ) -> float:
     """
     Draws an icon followed by text, optionally wrapping and linking.
 
+    ``icon`` is a vector icon name (see vector_icons.VECTOR_ICONS) or the
+    path of an image file; a bullet is drawn if neither is usable.
+    The text font, its metrics and the default leading come from ``template``.
+
     Returns:
         float: Updated y-position after drawing.
     """
-    value_font = LEFT_TEXT_FONT_BOLD if LEFT_TEXT_IS_BOLD else LEFT_TEXT_FONT
-    asc = pdfmetrics.getAscent(value_font) / 1000.0 * size
-    dsc = abs(pdfmetrics.getDescent(value_font)) / 1000.0 * size
+    tpl = resolve_template(template)
+    value_font = tpl.value_font
+    asc = tpl.value_ascent * size
+    dsc = tpl.value_descent * size
 
     # Draw icon or fallback bullet
-    if icon and icon.is_file():
+    if isinstance(icon, str) and icon in VECTOR_ICONS:
+        draw_vector_icon(c, icon, x, y, icon_w, icon_h)
+    elif icon and has_icon(icon):
         try:
-            img = ImageReader(str(icon))
+            img = icon_reader(icon)
             c.drawImage(img, x, y - icon_h, width=icon_w, height=icon_h, mask="auto")
         except Exception:
             c.setFont(value_font, size + 2)
@@ -87,7 +157,7 @@ def draw_icon_line(
     text_y = baseline + text_dy
 
     c.setFont(value_font, size)
-    c.setFillColor(colors.black)
+    c.setFillColor(tpl.text_color)
 
     # Handle text wrapping if applicable
     if max_w is not None:
@@ -95,14 +165,14 @@ def draw_icon_line(
         if avail_w < 20:
             avail_w = max(20, avail_w)
 
-        lines = wrap_text(value, value_font, size, avail_w)
+        lines, _ = wrap_visual(value, value_font, size, avail_w)
         cur_y = text_y
         first_line_twidth = None
 
         for i, ln in enumerate(lines):
-            c.drawString(text_x, cur_y, ln)
+            draw_string(c, text_x, cur_y, ln, value_font, size)
             if i == 0 and link_url:
-                tw = pdfmetrics.stringWidth(ln, value_font, size)
+                tw = string_width(ln, value_font, size)
                 first_line_twidth = tw
                 c.linkURL(
                     link_url,
@@ -110,21 +180,22 @@ def draw_icon_line(
                     relative=0,
                     thickness=0,
                 )
-            cur_y -= (line_gap if line_gap is not None else LEADING_BODY)
+            cur_y -= (line_gap if line_gap is not None else tpl.leading_body)
 
-        block_h = (text_y - cur_y) + (line_gap if line_gap is not None else LEADING_BODY)
+        block_h = (text_y - cur_y) + (line_gap if line_gap is not None else tpl.leading_body)
         used_h = max(icon_h, block_h)
-        gap = max((line_gap or LEADING_BODY), used_h + 2)
+        gap = max((line_gap or tpl.leading_body), used_h + 2)
         return y - gap
 
     # No wrapping, single line
-    c.drawString(text_x, text_y, value)
+    value = visual(value)[0]
+    draw_string(c, text_x, text_y, value, value_font, size)
     if link_url:
-        tw = pdfmetrics.stringWidth(value, value_font, size)
+        tw = string_width(value, value_font, size)
         c.linkURL(link_url, (text_x, text_y - dsc, text_x + tw, text_y + asc * 0.2), relative=0, thickness=0)
 
     used_h = max(icon_h, asc + dsc)
-    gap = max((line_gap or LEADING_BODY), used_h + 2)
+    gap = max((line_gap or tpl.leading_body), used_h + 2)
     return y - gap
 
 
@@ -192,7 +263,7 @@ def info_line(
                 display = v
                 link = f"https://www.linkedin.com/in/{v}" if v else None
 
-    icon = ICON_PATHS.get(key)
+    icon = icon_for(key)
 
     return draw_icon_line(
         c=c, x=x, y=y, icon=icon, value=display,
@@ -0,0 +1,262 @@
+"""
+Per-section layout caching.
+
+Section renderers draw into a DisplayList with their vertical cursor at 0.
+The recorded calls are cached by a hash of the section's inputs and replayed
+onto the real canvas shifted to the current cursor, so an edit re-lays out
+only the sections whose input changed.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import json
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from .rlcompat import CANVAS_STATE_OK
+from .textbatch import FONT_FREE_OPS, PASS_OPS, TextBatch
+
+LAYOUT_CACHE_SIZE = 256  # Cached section layouts per process
+
+# Positional index and keyword name of every y-coordinate argument.
+_Y_ARGS: Dict[str, Tuple[Tuple[int, str], ...]] = {
+    "drawString": ((1, "y"),),
+    "drawCentredString": ((1, "y"),),
+    "drawRightString": ((1, "y"),),
+    "line": ((1, "y1"), (3, "y2")),
+    "circle": ((1, "y_cen"),),
+    "rect": ((1, "y"),),
+    "drawImage": ((2, "y"),),
+    "transform": ((5, "f"),),
+    "doForm": (),
+    "linkURL": (),  # rect handled in _shift
+}
+# Calls that only change graphics state.
+_STATE_OPS = frozenset({
+    "setFont", "setFillColor", "setStrokeColor", "setLineWidth", "saveState", "restoreState",
+})
+
+Op = Tuple[str, tuple, dict]
+
+
+class DisplayList:
+    """Canvas stand-in that records drawing calls for later replay."""
+
+    def __init__(self) -> None:
+        self.ops: List[Op] = []
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        if name not in _Y_ARGS and name not in _STATE_OPS:
+            raise AttributeError(f"DisplayList does not support canvas.{name}()")
+
+        def record(*args, **kwargs) -> None:
+            self.ops.append((name, args, kwargs))
+
+        return record
+
+    def replay(self, c, dy: float = 0.0, scale: float = 1.0) -> None:
+        """
+        Issues the recorded calls on ``c`` with every y-coordinate shifted by ``dy``.
+
+        With ``scale`` != 1 the calls are drawn under a uniform scale transform;
+        link rectangles, which are absolute, are scaled explicitly. On a real
+        canvas, runs of text calls are written as single text objects (see
+        TextBatch, and rlcompat for when it is used); replaying into another
+        DisplayList copies the calls as-is.
+        """
+        batch = TextBatch(c) if CANVAS_STATE_OK and not isinstance(c, DisplayList) else None
+        if scale != 1.0:
+            c.saveState()
+            c.scale(scale, scale)
+        for name, args, kwargs in self.ops:
+            if dy:
+                args, kwargs = _shift(name, args, kwargs, dy)
+            if scale != 1.0 and name == "linkURL":
+                args = (args[0], tuple(v * scale for v in args[1]), *args[2:])
+            if batch is not None:
+                if batch.handles(name, kwargs):
+                    getattr(batch, name)(*args)
+                    continue
+                if name not in PASS_OPS:
+                    batch.flush(font=name not in FONT_FREE_OPS)
+            getattr(c, name)(*args, **kwargs)
+        if batch is not None:
+            batch.flush()
+        if scale != 1.0:
+            c.restoreState()
+
+
+def _shift(name: str, args: tuple, kwargs: dict, dy: float) -> Tuple[tuple, dict]:
+    if name == "linkURL":
+        args = list(args)
+        x1, y1, x2, y2 = args[1] if len(args) > 1 else kwargs["rect"]
+        rect = (x1, y1 + dy, x2, y2 + dy)
+        if len(args) > 1:
+            args[1] = rect
+        else:
+            kwargs = {**kwargs, "rect": rect}
+        return tuple(args), kwargs
+    spec = _Y_ARGS.get(name)
+    if not spec:
+        return args, kwargs
+    args = list(args)
+    kwargs = dict(kwargs)
+    for idx, key in spec:
+        if idx < len(args):
+            args[idx] += dy
+        elif key in kwargs:
+            kwargs[key] += dy
+    return tuple(args), kwargs
+
+
+def fit_scale(
+    layout: Callable[[Any, float], Tuple[float, ...]],
+    floors: Tuple[float, ...],
+    min_scale: float,
+    iterations: int,
+) -> Tuple[float, DisplayList]:
+    """
+    Finds the largest scale at which a layout stays above its floors.
+
+    ``layout(target, s)`` must lay out onto ``target`` with coordinates and
+    widths divided by ``s`` and return the resulting bottoms in page units.
+    Every pass records into a fresh DisplayList, so nothing is drawn. Only the
+    pass at scale 1.0 uses the layout cache; trial scales are one-off and
+    would only evict layouts that get reused.
+
+    Args:
+        layout (Callable): Layout function as described above.
+        floors (Tuple[float, ...]): Lowest allowed bottom for each returned value.
+        min_scale (float): Smallest scale to try; used if nothing fits.
+        iterations (int): Bisection steps below 1.0.
+
+    Returns:
+        Tuple[float, DisplayList]: The chosen scale and its recorded layout.
+    """
+
+    def measure(s: float) -> Tuple[DisplayList, bool]:
+        dl = DisplayList()
+        if s == 1.0:
+            ends = layout(dl, s)
+        else:
+            with uncached():
+                ends = layout(dl, s)
+        return dl, all(e >= f for e, f in zip(ends, floors))
+
+    dl, ok = measure(1.0)
+    if ok:
+        return 1.0, dl
+    dl, ok = measure(min_scale)
+    best = (min_scale, dl)
+    if not ok:
+        return best
+    lo, hi = min_scale, 1.0
+    for _ in range(iterations):
+        mid = (lo + hi) / 2.0
+        dl, ok = measure(mid)
+        if ok:
+            lo, best = mid, (mid, dl)
+        else:
+            hi = mid
+    return best
+
+
+_cache: "OrderedDict[str, Tuple[DisplayList, float]]" = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "bypassed": 0}
+_local = threading.local()
+
+
+@contextmanager
+def uncached() -> Iterator[None]:
+    """Lays out sections in this thread without reading or filling the layout cache."""
+    prev = getattr(_local, "bypass", False)
+    _local.bypass = True
+    try:
+        yield
+    finally:
+        _local.bypass = prev
+
+
+def cached_layout(y_param: str):
+    """
+    Decorator caching a section renderer's output relative to its y-cursor.
+
+    The wrapped function must draw only through the canvas calls a DisplayList
+    supports and return the updated y-position. Its arguments other than the
+    canvas and ``y_param`` form the cache key, so they must be JSON-like data
+    (or objects with a ``cache_key``, such as templates).
+
+    Args:
+        y_param (str): Name of the parameter holding the starting y-position.
+    """
+
+    def deco(fn):
+        sig = inspect.signature(fn)
+        name = f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(c, *args, **kwargs):
+            bound = sig.bind(c, *args, **kwargs)
+            bound.apply_defaults()
+            y = bound.arguments[y_param]
+            bypass = getattr(_local, "bypass", False)
+            hit = key = None
+            if bypass:
+                with _lock:
+                    _stats["bypassed"] += 1
+            else:
+                inputs = {k: v for k, v in bound.arguments.items() if k not in ("c", y_param)}
+                blob = json.dumps([name, inputs], sort_keys=True, ensure_ascii=False, default=_key_default)
+                key = hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
+                with _lock:
+                    hit = _cache.get(key)
+                    if hit is not None:
+                        _cache.move_to_end(key)
+                        _stats["hits"] += 1
+                    else:
+                        _stats["misses"] += 1
+            if hit is None:
+                # Laid out at y=0 and replayed even when bypassing, so output
+                # does not depend on whether the cache was used.
+                dl = DisplayList()
+                bound.arguments["c"] = dl
+                bound.arguments[y_param] = 0.0
+                hit = (dl, fn(*bound.args, **bound.kwargs))
+                if key is not None:
+                    with _lock:
+                        _cache[key] = hit
+                        if len(_cache) > LAYOUT_CACHE_SIZE:
+                            _cache.popitem(last=False)
+
+            dl, end = hit
+            dl.replay(c, y)
+            return y + end
+
+        return wrapper
+
+    return deco
+
+
+def _key_default(o: Any) -> Any:
+    """JSON fallback for cache keys: objects exposing ``cache_key`` (templates) use it."""
+    key = getattr(o, "cache_key", None)
+    return key if key is not None else list(o)
+
+
+def layout_cache_info() -> dict:
+    """Returns hit/miss/bypass counters and the current number of cached layouts."""
+    with _lock:
+        return {**_stats, "size": len(_cache), "maxsize": LAYOUT_CACHE_SIZE}
+
+
+def clear_layout_cache() -> None:
+    """Drops all cached layouts (e.g. after fonts or styling change at runtime)."""
+    with _lock:
+        _cache.clear()
+        _stats.update(hits=0, misses=0, bypassed=0)
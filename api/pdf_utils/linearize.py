@@ -0,0 +1,299 @@
+"""
+Linearization ("fast web view") of single-page PDFs, in pure Python.
+
+The document is rewritten so that the linearization dictionary, the first
+page's cross-reference section, the catalog, the hint stream and every
+object of page one come first. A viewer reading the file progressively can
+show the page before the rest has arrived (PDF 1.7, Annex F).
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+_XREF_ENTRY = re.compile(rb"(\d{10}) (\d{5}) ([nf])")
+_REF = re.compile(rb"(?<![\w.])(\d+) 0 R(?!\w)")
+_PARENT = re.compile(rb"/Parent\s+(\d+) 0 R")
+_TRAILER_REF = re.compile(rb"/(Root|Info)\s+(\d+) 0 R")
+_TRAILER_ID = re.compile(rb"/ID\s*(\[[^\]]*\])")
+_WS = b" \t\r\n\f\x00"
+
+
+class _Obj:
+    """An object of the source file: its header segments and raw stream part."""
+
+    __slots__ = ("num", "parts", "stream")
+
+    def __init__(self, num: int, parts: List[Tuple[bool, bytes]], stream: bytes):
+        self.num = num
+        self.parts = parts  # (is_string, bytes): literal/hex strings are kept verbatim
+        self.stream = stream  # b"" or everything from the "stream" keyword on
+
+    def refs(self, skip_parent: bool = False) -> List[int]:
+        out: List[int] = []
+        for is_str, seg in self.parts:
+            if is_str:
+                continue
+            parents = {m.start(1) for m in _PARENT.finditer(seg)} if skip_parent else ()
+            out += [int(m.group(1)) for m in _REF.finditer(seg) if m.start(1) not in parents]
+        return out
+
+    def entry(self, key: bytes) -> List[int]:
+        """Returns the object numbers referenced by dictionary entry ``key`` (a reference or an array)."""
+        for is_str, seg in self.parts:
+            m = None if is_str else re.search(rb"/" + key + rb"\s*(\d+ 0 R|\[[^\]]*\])", seg)
+            if m:
+                return [int(r.group(1)) for r in _REF.finditer(m.group(1))]
+        return []
+
+    def render(self, new_num: int, renum: Dict[int, int]) -> bytes:
+        def ref(m: re.Match) -> bytes:
+            n = int(m.group(1))
+            return b"%d 0 R" % renum[n] if n in renum else b"null"  # Dangling references read as null.
+
+        head = b"".join(seg if is_str else _REF.sub(ref, seg) for is_str, seg in self.parts)
+        body = head.strip(_WS)
+        if self.stream:
+            body += b"\n" + self.stream
+        return b"%d 0 obj\n%s\nendobj\n" % (new_num, body)
+
+
+def _split(body: bytes) -> Tuple[List[Tuple[bool, bytes]], bytes]:
+    """Splits an object body into plain/string segments and its stream part."""
+    parts: List[Tuple[bool, bytes]] = []
+    i = start = 0
+    n = len(body)
+    while i < n:
+        ch = body[i:i + 1]
+        if ch == b"(":
+            parts.append((False, body[start:i]))
+            depth, j = 0, i
+            while j < n:
+                c = body[j:j + 1]
+                if c == b"\\":
+                    j += 2
+                    continue
+                if c == b"(":
+                    depth += 1
+                elif c == b")":
+                    depth -= 1
+                    if depth == 0:
+                        break
+                j += 1
+            parts.append((True, body[i:j + 1]))
+            i = start = j + 1
+        elif ch == b"<" and body[i + 1:i + 2] != b"<" and (i == 0 or body[i - 1:i] != b"<"):
+            j = body.index(b">", i)
+            parts.append((False, body[start:i]))
+            parts.append((True, body[i:j + 1]))
+            i = start = j + 1
+        elif body.startswith(b"stream", i) and (i == 0 or body[i - 1] in b" \t\r\n>") and body[i + 6:i + 7] in (b"\r", b"\n"):
+            parts.append((False, body[start:i]))
+            return parts, body[i:].rstrip(_WS)
+        else:
+            i += 1
+    parts.append((False, body[start:]))
+    return parts, b""
+
+
+def _parse(data: bytes) -> Tuple[bytes, Dict[int, _Obj], int, Optional[int], bytes]:
+    """Reads a classic-xref PDF; returns header, objects, root, info and the /ID array."""
+    sx = data.rindex(b"startxref")
+    xref = int(data[sx + 9:].split()[0])
+    tpos = data.index(b"trailer", xref)
+    trailer = data[tpos:sx]
+    offsets: Dict[int, int] = {}
+    lines = data[xref:tpos].split(b"\n")[1:]
+    num = 0
+    for line in lines:
+        m = _XREF_ENTRY.match(line.strip())
+        if m:
+            if m.group(3) == b"n":
+                offsets[num] = int(m.group(1))
+            num += 1
+        elif line.strip():
+            num = int(line.split()[0])
+    refs = dict((k.decode(), int(v)) for k, v in _TRAILER_REF.findall(trailer))
+    if "Root" not in refs:
+        raise ValueError("PDF trailer has no /Root")
+    m = _TRAILER_ID.search(trailer)
+    ids = m.group(1) if m else b""
+
+    order = sorted(offsets, key=offsets.get)
+    ends = [offsets[k] for k in order[1:]] + [xref]
+    objs: Dict[int, _Obj] = {}
+    for k, end in zip(order, ends):
+        chunk = data[offsets[k]:end]
+        body = chunk[chunk.index(b"obj") + 3:chunk.rindex(b"endobj")]
+        parts, stream = _split(body)
+        objs[k] = _Obj(k, parts, stream)
+    header = data[:offsets[order[0]]]
+    return header, objs, refs["Root"], refs.get("Info"), ids
+
+
+class _Bits:
+    """Big-endian bit writer for hint tables."""
+
+    def __init__(self) -> None:
+        self.out = bytearray()
+        self.acc = 0
+        self.n = 0
+
+    def put(self, value: int, bits: int) -> None:
+        for i in range(bits - 1, -1, -1):
+            self.acc = (self.acc << 1) | ((value >> i) & 1)
+            self.n += 1
+            if self.n == 8:
+                self.out.append(self.acc)
+                self.acc = self.n = 0
+
+    def align(self) -> None:
+        if self.n:
+            self.put(0, 8 - self.n)
+
+
+def _hints(page_off: int, page_len: int, lengths: List[int]) -> Tuple[bytes, int]:
+    """Builds the page offset and shared object hint tables for one page; returns data and /S."""
+    b = _Bits()
+    count = len(lengths)
+    # Page offset hint table header (Table F.3); the single page needs no per-page entries.
+    for value, bits in (
+        (count, 32), (page_off, 32), (0, 16), (page_len, 32), (0, 16),
+        (0, 32), (0, 16), (page_len, 32), (0, 16),
+        (0, 16), (count.bit_length(), 16), (0, 16), (0, 16),
+    ):
+        b.put(value, bits)
+    shared_at = len(b.out)
+    # Shared object hint table (Table F.5): one group per first-page object.
+    least = min(lengths)
+    width = (max(lengths) - least).bit_length()
+    for value, bits in ((0, 32), (0, 32), (count, 32), (count, 32), (0, 16), (least, 32), (width, 16)):
+        b.put(value, bits)
+    for n in lengths:
+        b.put(n - least, width)
+    b.align()
+    for _ in lengths:
+        b.put(0, 1)  # No MD5 signatures
+    b.align()
+    return bytes(b.out), shared_at
+
+
+def linearize_pdf(data: bytes) -> bytes:
+    """
+    Rewrites a single-page PDF (as written by ReportLab) in linearized form.
+
+    The catalog, the page object and everything it references (content
+    stream last) are moved to the front and renumbered after the remaining
+    objects (page tree, document info), followed by the hint tables that
+    viewers use to fetch page one with byte-range requests. Stream data is
+    copied as-is; the document /ID is kept.
+
+    Args:
+        data (bytes): A PDF with a classic cross-reference table.
+
+    Returns:
+        bytes: The linearized PDF.
+
+    Raises:
+        ValueError: If the document does not have exactly one page or cannot be read.
+    """
+    try:
+        header, objs, root, info, ids = _parse(data)
+    except (IndexError, KeyError) as e:
+        raise ValueError(f"unreadable PDF: {e!r}")
+    pages = objs[root].entry(b"Pages")
+    if len(pages) != 1 or pages[0] not in objs:
+        raise ValueError("PDF has no page tree")
+    pages_no = pages[0]
+    kids = objs[pages_no].entry(b"Kids")
+    if len(kids) != 1 or kids[0] not in objs or objs[kids[0]].entry(b"Kids"):
+        raise ValueError("only single-page documents can be linearized")
+    page = kids[0]
+
+    # Page one: the page, what it references (not via /Parent), content streams last.
+    contents = set(objs[page].entry(b"Contents"))
+    first: List[int] = [page]
+    seen = {page, root, pages_no}
+    stack = list(reversed(objs[page].refs(skip_parent=True)))
+    while stack:
+        k = stack.pop()
+        if k in seen or k not in objs:
+            continue
+        seen.add(k)
+        first.append(k)
+        stack += reversed(objs[k].refs(skip_parent=True))
+    first = [k for k in first if k not in contents] + [k for k in first if k in contents]
+    rest = [pages_no] + [k for k in sorted(objs) if k not in seen]
+
+    # Remaining objects are numbered 1..m; the linearization dict, catalog and hint stream follow.
+    renum: Dict[int, int] = {k: i for i, k in enumerate(rest, 1)}
+    lin_no = len(rest) + 1
+    renum[root] = lin_no + 1
+    hint_no = lin_no + 2
+    for i, k in enumerate(first):
+        renum[k] = hint_no + 1 + i
+    size = hint_no + 1 + len(first)
+
+    catalog = objs[root].render(renum[root], renum)
+    page_objs = [objs[k].render(renum[k], renum) for k in first]
+    rest_objs = [objs[k].render(renum[k], renum) for k in rest]
+    lengths = [len(o) for o in page_objs]
+    info_ref = b" /Info %d 0 R" % renum[info] if info in renum else b""
+    id_entry = b" /ID " + ids if ids else b""
+
+    L = H_off = H_len = E = T = prev = 0
+    for _ in range(8):
+        lin = b"%d 0 obj\n<< /Linearized 1 /L %d /H [ %d %d ] /O %d /E %d /N 1 /T %d >>\nendobj\n" % (
+            lin_no, L, H_off, H_len, renum[page], E, T,
+        )
+        first_xref_at = len(header) + len(lin)
+        xref_head = b"xref\n%d %d\n" % (lin_no, size - lin_no)
+        trailer = b"trailer\n<< /Size %d /Root %d 0 R%s%s /Prev %d >>\nstartxref\n0\n%%%%EOF\n" % (
+            size, renum[root], info_ref, id_entry, prev,
+        )
+        pos = first_xref_at + len(xref_head) + 20 * (size - lin_no) + len(trailer)
+        cat_at = pos
+        hint_at = cat_at + len(catalog)
+        # Hint table offsets are given as if the hint stream were absent.
+        hdata, shared_at = _hints(hint_at, sum(lengths), lengths)
+        hint = b"%d 0 obj\n<< /S %d /Length %d >>\nstream\n%s\nendstream\nendobj\n" % (
+            hint_no, shared_at, len(hdata), hdata,
+        )
+        page_at = hint_at + len(hint)
+        end_first = page_at + sum(lengths)
+
+        offsets = [len(header), cat_at, hint_at]
+        at = page_at
+        for n in lengths:
+            offsets.append(at)
+            at += n
+        rest_at = []
+        for o in rest_objs:
+            rest_at.append(at)
+            at += len(o)
+        main_xref = at
+        entries = b"".join(b"%010d 00000 n \n" % o for o in offsets)
+        main = (
+            b"xref\n0 %d\n0000000000 65535 f \n" % (len(rest) + 1)
+            + b"".join(b"%010d 00000 n \n" % o for o in rest_at)
+            + b"trailer\n<< /Size %d%s >>\nstartxref\n%d\n%%%%EOF\n" % (len(rest) + 1, id_entry, first_xref_at)
+        )
+        params = (
+            main_xref + len(main),
+            hint_at,
+            len(hint),
+            end_first,
+            main_xref + len(b"xref\n0 %d\n" % (len(rest) + 1)) - 1,
+            main_xref,
+        )
+        if params == (L, H_off, H_len, E, T, prev):
+            break
+        L, H_off, H_len, E, T, prev = params
+    else:
+        raise ValueError("linearization layout did not converge")
+
+    out = b"".join([header, lin, xref_head, entries, trailer, catalog, hint, *page_objs, *rest_objs, main])
+    if len(out) != L:
+        raise ValueError("linearization layout is inconsistent")
+    return out
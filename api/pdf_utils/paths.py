@@ -30,5 +30,24 @@ def get_assets_root() -> Path:
     return cand if cand.exists() else here  # Fallback: package directory itself
 
 
+def get_cache_root() -> Path:
+    """
+    Detects the directory for derived, regenerable files. Supports environment override.
+
+    Returns:
+        Path: Cache directory (not created here).
+
+    Environment Variable:
+        PDF_UTILS_CACHE: If set, overrides the default path.
+        XDG_CACHE_HOME: Used as the base directory when PDF_UTILS_CACHE is unset.
+    """
+    env = os.getenv("PDF_UTILS_CACHE")
+    if env:
+        return Path(env).expanduser().resolve()
+    base = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base).expanduser() / "pdf_utils"
+
+
 ASSETS = get_assets_root()
 ICONS_DIR = ASSETS / "icons"
+CACHE_DIR = get_cache_root()
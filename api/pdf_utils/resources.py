@@ -1,17 +1,37 @@
 """
-Utilities for extracting embedded package resources into temporary files.
-Useful for runtime access to bundled assets.
+Utilities for materializing embedded package resources as files on disk.
+Resources already on the filesystem are used in place; others are extracted
+once per content hash into the pdf_utils cache directory.
 """
 
 from importlib import resources
 from pathlib import Path
-import tempfile
+import hashlib
+import os
 import shutil
+import tempfile
+import threading
+import time
+
+from .paths import CACHE_DIR
+
+_CACHE: dict[tuple[str, str], Path] = {}
+_LOCK = threading.Lock()
+
+# Other versions of a resource are only removed once unused for this long, so
+# processes still running older code (e.g. during a reload) keep their files.
+STALE_AFTER = 24 * 3600.0
 
 
 def extract_resource(package: str, resource: str) -> Path:
     """
-    Copies a package-embedded resource to a temporary file and returns its path.
+    Returns a filesystem path for a package-embedded resource.
+
+    Resources inside regular (unzipped) packages are returned as-is. Otherwise
+    the content is written to ``CACHE_DIR/resources/<package>/<resource>/<sha256>/``
+    with an atomic rename, so concurrent processes never see partial files, and
+    versions of the same resource unused for STALE_AFTER seconds are removed.
+    Repeated calls are served from an in-process cache.
 
     Example:
         extract_resource("pdf_utils.assets", "NotoNaskhArabic-Regular.ttf")
@@ -21,11 +41,61 @@ def extract_resource(package: str, resource: str) -> Path:
         resource (str): The name of the resource file to extract.
 
     Returns:
-        Path: Path to the extracted temporary file.
+        Path: Path to the resource file.
+    """
+    key = (package, resource)
+    with _LOCK:
+        hit = _CACHE.get(key)
+        if hit is not None and hit.is_file():
+            return hit
+
+        ref = resources.files(package).joinpath(resource)
+        if isinstance(ref, Path) and ref.is_file():
+            out = ref
+        else:
+            out = _materialize(package, resource, ref.read_bytes())
+        _CACHE[key] = out
+        return out
+
+
+def _materialize(package: str, resource: str, data: bytes) -> Path:
     """
-    with resources.files(package).joinpath(resource).open("rb") as src:
-        tmpdir = Path(tempfile.mkdtemp(prefix="pdf_assets_"))
-        out = tmpdir / Path(resource).name
-        with out.open("wb") as dst:
-            shutil.copyfileobj(src, dst)
-        return out
\ No newline at end of file
+    Writes ``data`` into its content-addressed cache slot (if missing) and prunes stale slots.
+
+    Each use refreshes the slot directory's mtime, which marks it as in use
+    for the pruning done by other processes.
+    """
+    digest = hashlib.sha256(data).hexdigest()[:32]
+    root = CACHE_DIR / "resources" / package / resource.replace("/", "__")
+    out = root / digest / Path(resource).name
+    if not (out.is_file() and out.stat().st_size == len(data)):
+        out.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=out.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, out)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    now = time.time()
+    try:
+        os.utime(out.parent, (now, now))
+    except OSError:
+        pass
+
+    # Drop versions nobody has used for a while; open handles stay valid regardless.
+    for old in root.iterdir():
+        try:
+            stale = old.name != digest and old.is_dir() and now - old.stat().st_mtime > STALE_AFTER
+        except OSError:
+            continue  # Removed meanwhile by another process.
+        if stale:
+            shutil.rmtree(old, ignore_errors=True)
+    return out
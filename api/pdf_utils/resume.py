@@ -4,17 +4,84 @@ Handles layout, styling, and content population for both left and right columns.
 """
 
 from io import BytesIO
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Union, Mapping
+import hashlib
+import json
 
+from reportlab import Version as RL_VERSION, rl_config
+from reportlab.pdfbase.pdfdoc import DummyDoc, PDFText
 from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.units import mm
 from reportlab.lib.utils import ImageReader
 
 from .config import *
+from .fonts import AR_FONT, UI_FONT
+from .layout import fit_scale
+from .linearize import linearize_pdf
 from .shapes import draw_round_rect
 from .sections_left import draw_left_column, draw_left_extra_sections
 from .sections_right import draw_right_extra_sections, draw_projects, draw_education
+from .templates import Template, resolve_template
+from .vector_icons import compile_icon_forms
+
+# Part of input_digest: bump whenever a code change alters the rendered bytes
+# for the same inputs, so stored outputs and resume URLs are not served stale.
+RENDERER_VERSION = 2
+
+# ReportLab reads this only from the process-wide rl_config (content streams,
+# images, fonts), so it cannot be set per document. It is applied once, when
+# the renderer is imported, and holds for every ReportLab user in the process.
+rl_config.useA85 = int(USE_ASCII85)
+
+
+def input_digest(kwargs: Mapping[str, Any]) -> str:
+    """
+    Returns a stable SHA-256 hex digest of build_resume_pdf inputs.
+
+    Photo bytes are hashed separately; empty values and the output-only
+    ``deterministic`` flag are ignored, so omitted and empty arguments
+    give the same digest. RENDERER_VERSION, the ReportLab version, the
+    resolved font names and the template's parameter hash are included so
+    the digest changes when the output may change.
+
+    Args:
+        kwargs (Mapping[str, Any]): Keyword arguments for build_resume_pdf.
+
+    Returns:
+        str: Hex digest identifying the rendered document.
+
+    Raises:
+        ValueError: If ``template`` names an unknown template.
+    """
+    canon: Dict[str, Any] = {
+        "_renderer": [RENDERER_VERSION, RL_VERSION, AR_FONT, UI_FONT],
+        "template": resolve_template(kwargs.get("template")).cache_key,
+    }
+    for k, v in kwargs.items():
+        if k in ("deterministic", "template") or not v:
+            continue
+        if k == "photo_bytes":
+            v = hashlib.sha256(v).hexdigest()
+        canon[k] = v
+    blob = json.dumps(canon, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=list)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _fix_document_id(c: canvas.Canvas, digest: str) -> None:
+    """
+    Sets the trailer /ID to the first 16 bytes of ``digest`` (both halves equal).
+
+    ReportLab has no public API for this; PDFDocument.ID() returns a preset
+    ``_ID`` instead of hashing the content and date. That is checked here, and
+    tests/test_determinism.py checks the resulting trailer.
+
+    Raises:
+        RuntimeError: If this ReportLab version does not keep the ID in ``_ID``.
+    """
+    doc = c._doc
+    if getattr(doc, "_ID", False) is not None or not callable(getattr(doc, "ID", None)):
+        raise RuntimeError(f"deterministic output is not supported with ReportLab {RL_VERSION}")
+    ids = PDFText(bytes.fromhex(digest)[:16], enc="raw").format(DummyDoc())
+    doc._ID = b"\n[" + ids + ids + b"]\n"
 
 
 def build_resume_pdf(
@@ -34,6 +101,10 @@ def build_resume_pdf(
     rtl_mode: bool = False,
     sections_left: List[Dict[str, Any]] | None = None,
     sections_right: List[Dict[str, Any]] | None = None,
+    deterministic: bool = False,
+    fit_page: bool = False,
+    template: Union[str, Template, None] = None,
+    linearize: bool = False,
 ) -> bytes:
     """
     Generates a resume PDF with customizable sections, photo, and RTL support.
@@ -51,41 +122,58 @@ def build_resume_pdf(
         projects (List[Tuple[str, str, Optional[str]]]): Projects (title, desc, link).
         education_items (List[str]): Educational history or entries.
         photo_bytes (Optional[bytes]): Image data for profile photo.
-        rtl_mode (bool): Enables right-to-left text formatting.
+        rtl_mode (bool): Default direction for project text without strong
+            characters; every paragraph's direction is otherwise detected.
         sections_left (List[Dict[str, Any]] | None): Extra left-side sections.
         sections_right (List[Dict[str, Any]] | None): Extra right-side sections.
+        deterministic (bool): Produce byte-identical output for identical inputs:
+            fixed creation dates (SOURCE_DATE_EPOCH or 2000-01-01) and a
+            document ID derived from input_digest.
+        fit_page (bool): Shrink typography and gaps uniformly (down to
+            FIT_MIN_SCALE) until both columns fit on the page.
+        template (str | Template | None): Theme by registered name (see
+            templates.list_templates) or as a Template; "default" if omitted.
+        linearize (bool): Write a linearized ("fast web view") PDF whose first
+            page can be displayed before the whole file has arrived.
 
     Returns:
-        bytes: Binary content of the generated PDF.
+        bytes: The PDF content.
     """
+    tpl = resolve_template(template)
+    digest = None
+    if deterministic:
+        digest = input_digest({
+            "name": name, "location": location, "phone": phone, "email": email,
+            "github": github, "linkedin": linkedin, "birthdate": birthdate,
+            "skills": skills, "languages": languages, "projects": projects,
+            "education_items": education_items, "photo_bytes": photo_bytes,
+            "rtl_mode": rtl_mode, "sections_left": sections_left,
+            "sections_right": sections_right, "fit_page": fit_page,
+            "template": tpl, "linearize": linearize,
+        })
+
     sections_left = sections_left or []
     sections_right = sections_right or []
 
-    buffer = BytesIO()
-    c = canvas.Canvas(buffer, pagesize=A4)
-    W, H = A4
+    c = canvas.Canvas(None, pagesize=tpl.page_size, invariant=int(deterministic))
+    if digest:
+        _fix_document_id(c, digest)
 
-    margin = 16 * mm
-    gutter = 8 * mm
-    left_w = 0.40 * (W - 2 * margin - gutter)
-    right_w = 0.60 * (W - 2 * margin - gutter)
-    left_x = margin
-    right_x = margin + left_w + gutter
-    y_top = H - margin
+    right_x, right_w = tpl.right_x, tpl.right_w
+    inner_x, inner_w = tpl.inner_x, tpl.inner_w
 
     # Draw left column card
-    CARD_TOP, CARD_W, CARD_H, CARD_X, CARD_Y = y_top, left_w, H - 2 * margin, left_x, margin
-    draw_round_rect(c, CARD_X, CARD_Y, CARD_W, CARD_H)
-    inner_x = CARD_X + CARD_PAD
-    inner_w = CARD_W - 2 * CARD_PAD
-    cursor = CARD_TOP - CARD_PAD
+    draw_round_rect(
+        c, tpl.left_x, tpl.margin, tpl.left_w, tpl.card_h,
+        fill_color=tpl.left_bg, stroke_color=tpl.left_border, radius=tpl.card_radius,
+    )
+    cursor = tpl.y_top - tpl.card_pad
 
     # Draw circular profile image if available
     if photo_bytes:
         try:
             img = ImageReader(BytesIO(photo_bytes))
-            max_d = 42 * mm
-            d = min(inner_w, max_d)
+            d = tpl.photo_d
             r = d / 2.0
             cx = inner_x + inner_w / 2.0
             cy = cursor - r
@@ -97,41 +185,54 @@ def build_resume_pdf(
             c.clipPath(p, stroke=0, fill=0)
             c.drawImage(img, ix, iy, width=d, height=d, preserveAspectRatio=True, mask="auto")
             c.restoreState()
-            c.setStrokeColor(LEFT_BORDER)
+            c.setStrokeColor(tpl.left_border)
             c.setLineWidth(1)
             c.circle(cx, cy, r)
-            cursor = iy - 6 * mm
+            cursor = iy - tpl.photo_gap
         except Exception:
             pass
 
-    # Populate left column content
-    cursor = draw_left_column(
-        c,
-        name=name,
-        location=location,
-        phone=phone,
-        email=email,
-        github=github,
-        linkedin=linkedin,
-        birthdate=birthdate,
-        skills=list(skills),
-        languages=list(languages),
-        inner_x=inner_x,
-        inner_w=inner_w,
-        cursor=cursor,
-    )
+    def columns(target, s: float = 1.0) -> Tuple[float, float]:
+        """Lays out both columns on ``target`` at scale ``s``; returns their bottoms in page units."""
+        # Populate left column content
+        cur = draw_left_column(
+            target,
+            name=name,
+            location=location,
+            phone=phone,
+            email=email,
+            github=github,
+            linkedin=linkedin,
+            birthdate=birthdate,
+            skills=list(skills),
+            languages=list(languages),
+            inner_x=inner_x / s,
+            inner_w=inner_w / s,
+            cursor=cursor / s,
+            template=tpl,
+        )
+
+        # Left-side extra sections
+        cur = draw_left_extra_sections(target, inner_x / s, inner_w / s, cur, sections_left, tpl)
 
-    # Left-side extra sections
-    cursor = draw_left_extra_sections(c, inner_x, inner_w, cursor, sections_left)
+        # Right column content
+        yR = (tpl.y_top - tpl.gap_after_heading) / s
+        yR = draw_right_extra_sections(target, right_x / s, right_w / s, yR, sections_right, tpl)
+        yR = draw_projects(target, right_x / s, right_w / s, yR, list(projects), rtl_mode, tpl)
+        yR = draw_education(target, right_x / s, right_w / s, yR, list(education_items), tpl)
+        return cur * s, yR * s
 
-    # Right column content
-    yR = y_top - GAP_AFTER_HEADING
-    yR = draw_right_extra_sections(c, right_x, right_w, yR, sections_right)
-    yR = draw_projects(c, right_x, right_w, yR, list(projects), rtl_mode)
-    yR = draw_education(c, right_x, right_w, yR, list(education_items))
+    if fit_page:
+        # Measure-only passes pick the scale; the chosen layout is drawn once.
+        scale, dl = fit_scale(columns, (tpl.margin + tpl.card_pad, tpl.margin), FIT_MIN_SCALE, FIT_ITERATIONS)
+        dl.replay(c, scale=scale)
+    else:
+        columns(c)
 
+    compile_icon_forms(c)
     c.showPage()
-    c.save()
-    out = buffer.getvalue()
-    buffer.close()
-    return out
\ No newline at end of file
+    # getpdfdata() hands back ReportLab's single joined buffer; no BytesIO round trip.
+    data = c.getpdfdata()
+    if linearize:
+        data = linearize_pdf(data)
+    return data
@@ -0,0 +1,19 @@
+"""
+Guard for code that relies on ReportLab's private canvas state.
+
+TextBatch reads and updates the canvas' current font and fill colour
+(``_fontname``, ``_fontsize``, ``_leading``, ``_fillColorObj``) and the text
+object's font; compile_icon_forms reads the forms a page references
+(``_formsinuse``). ReportLab does not expose these, so that code is only
+used with the versions it was checked against; requirements.txt pins one.
+Other versions replay text call by call and compile every icon form.
+"""
+
+from __future__ import annotations
+
+from reportlab import Version as RL_VERSION
+
+# ReportLab versions whose private canvas state matches what the code expects.
+CHECKED_VERSIONS = frozenset({"4.4.4"})
+
+CANVAS_STATE_OK = RL_VERSION in CHECKED_VERSIONS
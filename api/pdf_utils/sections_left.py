@@ -4,16 +4,18 @@ skills, languages, and additional custom sections.
 """
 
 from reportlab.pdfgen import canvas
-from reportlab.lib import colors
 
-from .config import *
-from .icons import ICON_PATHS, draw_icon_line
-from .text import wrap_text, draw_par
+from .templates import HEADINGS, Template, resolve_template
+from .icons import draw_icon_line, icon_for
+from .layout import cached_layout
+from .text import wrap_visual, draw_par
+from .fonts import visual
+from .fallback import draw_string
 from .social import extract_social_handle
 
 
 
-def info_line(c, x, y, key: str, value: str, max_w: float, line_gap=LEFT_LINE_GAP, size=LEFT_TEXT_SIZE):
+def info_line(c, x, y, key: str, value: str, max_w: float, line_gap=None, size=None, template: Template | None = None):
     """
     Draws a single line of text with an optional icon and clickable hyperlink for specific keys.
 
@@ -24,8 +26,9 @@ def info_line(c, x, y, key: str, value: str, max_w: float, line_gap=LEFT_LINE_GA
         key (str): Label key (e.g., "GitHub", "LinkedIn", "Phone").
         value (str): Raw input string to be processed.
         max_w (float): Maximum allowed width for the rendered line.
-        line_gap (float, optional): Line spacing. Defaults to LEFT_LINE_GAP.
-        size (float, optional): Font size. Defaults to LEFT_TEXT_SIZE.
+        line_gap (float, optional): Line spacing. Defaults to the template's left_line_gap.
+        size (float, optional): Font size. Defaults to the template's left_text_size.
+        template (Template | None): Theme; the default template if omitted.
 
     Returns:
         Rendered line with optional link and icon, if applicable.
@@ -34,7 +37,8 @@ def info_line(c, x, y, key: str, value: str, max_w: float, line_gap=LEFT_LINE_GA
         - Only GitHub and LinkedIn values are transformed into clickable links.
         - Non-social fields are rendered as plain text.
     """
-    icon = ICON_PATHS.get(key)
+    tpl = resolve_template(template)
+    icon = icon_for(key, tpl.icon_style)
     raw = (value or "").strip()
     display = raw
     link = None
@@ -78,48 +82,61 @@ def info_line(c, x, y, key: str, value: str, max_w: float, line_gap=LEFT_LINE_GA
 
     return draw_icon_line(
         c, x, y, icon, display,
-        icon_w=ICON_SIZE, icon_h=ICON_SIZE, pad_x=ICON_PAD_X, size=size,
-        line_gap=line_gap, max_w=max_w, link_url=link
+        icon_w=tpl.icon_size, icon_h=tpl.icon_size, pad_x=tpl.icon_pad_x,
+        size=tpl.left_text_size if size is None else size,
+        valign=tpl.icon_valign, text_dy=tpl.icon_text_dy,
+        line_gap=tpl.left_line_gap if line_gap is None else line_gap,
+        max_w=max_w, link_url=link, template=tpl,
     )
 
 
+@cached_layout("cursor")
 def draw_left_extra_sections(
     c: canvas.Canvas,
     inner_x: float,
     inner_w: float,
     cursor: float,
-    sections_left: list[dict]
+    sections_left: list[dict],
+    template: Template | None = None,
 ) -> float:
     """Draws user-defined sections on the left column."""
+    tpl = resolve_template(template)
     for sec in (sections_left or []):
         title = (sec.get("title") or "").strip()
         lines = [str(x).strip() for x in (sec.get("lines") or []) if str(x).strip()]
         if not title or not lines:
             continue
-        cursor -= LEFT_SEC_TITLE_TOP_GAP
-        c.setFont("Helvetica-Bold", LEFT_SEC_HEADING_SIZE)
-        c.setFillColor(colors.black)
-        if LEFT_SEC_TITLE_ALIGN == "center":
-            c.drawCentredString(inner_x + inner_w / 2, cursor, title)
-        elif LEFT_SEC_TITLE_ALIGN == "right":
-            c.drawRightString(inner_x + inner_w, cursor, title)
+        title = visual(title)[0]
+        cursor -= tpl.left_sec_title_top_gap
+        c.setFont(tpl.font_bold, tpl.left_sec_heading_size)
+        c.setFillColor(tpl.text_color)
+        if tpl.left_sec_title_align == "center":
+            draw_string(c, inner_x + inner_w / 2, cursor, title, tpl.font_bold, tpl.left_sec_heading_size, "center")
+        elif tpl.left_sec_title_align == "right":
+            draw_string(c, inner_x + inner_w, cursor, title, tpl.font_bold, tpl.left_sec_heading_size, "right")
         else:
-            c.drawString(inner_x, cursor, title)
-        cursor -= LEFT_SEC_TITLE_BOTTOM_GAP
-        c.setStrokeColor(LEFT_SEC_RULE_COLOR)
-        c.setLineWidth(LEFT_SEC_RULE_WIDTH)
+            draw_string(c, inner_x, cursor, title, tpl.font_bold, tpl.left_sec_heading_size)
+        cursor -= tpl.left_sec_title_bottom_gap
+        c.setStrokeColor(tpl.left_sec_rule_color)
+        c.setLineWidth(tpl.left_sec_rule_width)
         c.line(inner_x, cursor, inner_x + inner_w, cursor)
-        cursor -= LEFT_SEC_RULE_TO_LIST_GAP
-        c.setFont("Helvetica", LEFT_SEC_TEXT_SIZE)
-        c.setFillColor(colors.black)
+        cursor -= tpl.left_sec_rule_to_list_gap
+        c.setFont(tpl.font, tpl.left_sec_text_size)
+        c.setFillColor(tpl.text_color)
+        # Bullets first, then the lines, so the list text is one text object.
+        rows = []
         for ln in lines:
-            c.circle(inner_x + LEFT_SEC_BULLET_X_OFFSET, cursor + 3, LEFT_SEC_BULLET_RADIUS, stroke=1, fill=1)
-            c.drawString(inner_x + LEFT_SEC_TEXT_X_OFFSET, cursor, ln)
-            cursor -= LEFT_SEC_LINE_GAP
-        cursor -= LEFT_SEC_SECTION_GAP
+            rows.append((cursor, visual(ln)[0]))
+            cursor -= tpl.left_sec_line_gap
+        for y, _ in rows:
+            c.circle(inner_x + tpl.left_sec_bullet_x_offset, y + 3, tpl.left_sec_bullet_radius, stroke=1, fill=1)
+        for y, ln in rows:
+            draw_string(c, inner_x + tpl.left_sec_text_x_offset, y, ln, tpl.font, tpl.left_sec_text_size)
+        cursor -= tpl.left_sec_section_gap
     return cursor
 
 
+@cached_layout("cursor")
 def draw_left_column(
     c: canvas.Canvas,
     *,
@@ -135,86 +152,82 @@ def draw_left_column(
     inner_x: float,
     inner_w: float,
     cursor: float,
+    template: Template | None = None,
 ) -> float:
     """Draws the full left column including contact, skills, and language sections."""
+    tpl = resolve_template(template)
     if name:
-        c.setFont("Helvetica-Bold", NAME_SIZE)
-        c.setFillColor(HEADING_COLOR)
-        c.drawCentredString(inner_x + inner_w / 2, cursor, name)
-        cursor -= NAME_GAP
+        c.setFont(tpl.font_bold, tpl.name_size)
+        c.setFillColor(tpl.heading_color)
+        draw_string(c, inner_x + inner_w / 2, cursor, visual(name)[0], tpl.font_bold, tpl.name_size, "center")
+        cursor -= tpl.name_gap
 
     has_contact = any([location, phone, email, birthdate, github, linkedin])
     if has_contact:
-        c.setFont("Helvetica-Bold", HEADING_SIZE)
-        c.setFillColor(HEADING_COLOR)
-        c.drawCentredString(inner_x + inner_w / 2, cursor, "Pers\u00f6nliche Informationen")
+        c.setFont(tpl.font_bold, tpl.heading_size)
+        c.setFillColor(tpl.heading_color)
+        c.drawString(tpl.heading_x("contact", inner_x, inner_w, "center"), cursor, HEADINGS["contact"])
         cursor -= 6
         from .shapes import draw_rule
-        draw_rule(c, inner_x, cursor, inner_w)
+        draw_rule(c, inner_x, cursor, inner_w, tpl.rule_color, tpl.rule_width)
         cursor -= 6
 
         if location:
-            cursor = info_line(c, inner_x, cursor, "Ort", location, inner_w)
+            cursor = info_line(c, inner_x, cursor, "Ort", location, inner_w, template=tpl)
         if phone:
-            cursor = info_line(c, inner_x, cursor, "Telefon", phone, inner_w)
+            cursor = info_line(c, inner_x, cursor, "Telefon", phone, inner_w, template=tpl)
         if email:
-            cursor = info_line(c, inner_x, cursor, "E-Mail", email, inner_w)
+            cursor = info_line(c, inner_x, cursor, "E-Mail", email, inner_w, template=tpl)
         if birthdate:
-            cursor = info_line(c, inner_x, cursor, "Geburtsdatum", birthdate, inner_w)
+            cursor = info_line(c, inner_x, cursor, "Geburtsdatum", birthdate, inner_w, template=tpl)
         if github:
-            cursor = info_line(c, inner_x, cursor, "GitHub", github, inner_w)
+            cursor = info_line(c, inner_x, cursor, "GitHub", github, inner_w, template=tpl)
         if linkedin:
-            cursor = info_line(c, inner_x, cursor, "LinkedIn", linkedin, inner_w)
+            cursor = info_line(c, inner_x, cursor, "LinkedIn", linkedin, inner_w, template=tpl)
 
-        cursor -= LEFT_AFTER_CONTACT_GAP
+        cursor -= tpl.left_after_contact_gap
 
     if skills:
-        cursor -= LEFT_SEC_TITLE_TOP_GAP
-        c.setFont("Helvetica-Bold", LEFT_SEC_HEADING_SIZE)
-        c.setFillColor(HEADING_COLOR)
-        if LEFT_SEC_TITLE_ALIGN == "center":
-            c.drawCentredString(inner_x + inner_w / 2, cursor, "Technische F\u00e4higkeiten")
-        elif LEFT_SEC_TITLE_ALIGN == "right":
-            c.drawRightString(inner_x + inner_w, cursor, "Technische F\u00e4higkeiten")
-        else:
-            c.drawString(inner_x, cursor, "Technische F\u00e4higkeiten")
-        cursor -= LEFT_SEC_TITLE_BOTTOM_GAP
-        c.setStrokeColor(LEFT_SEC_RULE_COLOR)
-        c.setLineWidth(LEFT_SEC_RULE_WIDTH)
+        cursor -= tpl.left_sec_title_top_gap
+        c.setFont(tpl.font_bold, tpl.left_sec_heading_size)
+        c.setFillColor(tpl.heading_color)
+        c.drawString(tpl.heading_x("skills", inner_x, inner_w, tpl.left_sec_title_align), cursor, HEADINGS["skills"])
+        cursor -= tpl.left_sec_title_bottom_gap
+        c.setStrokeColor(tpl.left_sec_rule_color)
+        c.setLineWidth(tpl.left_sec_rule_width)
         c.line(inner_x, cursor, inner_x + inner_w, cursor)
-        cursor -= LEFT_SEC_RULE_TO_LIST_GAP
-        c.setFont("Helvetica", LEFT_SEC_TEXT_SIZE)
-        c.setFillColor(colors.black)
-        max_text_w = inner_w - (LEFT_SEC_TEXT_X_OFFSET + 2)
+        cursor -= tpl.left_sec_rule_to_list_gap
+        c.setFont(tpl.font, tpl.left_sec_text_size)
+        c.setFillColor(tpl.text_color)
+        max_text_w = inner_w - (tpl.left_sec_text_x_offset + 2)
+        rows = []
         for sk in skills:
-            wrapped = wrap_text(sk, "Helvetica", LEFT_SEC_TEXT_SIZE, max_text_w)
+            wrapped, _ = wrap_visual(sk, tpl.font, tpl.left_sec_text_size, max_text_w)
             for i, ln in enumerate(wrapped):
-                if i == 0:
-                    c.circle(inner_x + LEFT_SEC_BULLET_X_OFFSET, cursor + 3, LEFT_SEC_BULLET_RADIUS, stroke=1, fill=1)
-                c.drawString(inner_x + LEFT_SEC_TEXT_X_OFFSET, cursor, ln)
-                cursor -= LEFT_SEC_LINE_GAP
-        cursor -= LEFT_SEC_SECTION_GAP
+                rows.append((cursor, ln, i == 0))
+                cursor -= tpl.left_sec_line_gap
+        for y, _, first in rows:
+            if first:
+                c.circle(inner_x + tpl.left_sec_bullet_x_offset, y + 3, tpl.left_sec_bullet_radius, stroke=1, fill=1)
+        for y, ln, _ in rows:
+            draw_string(c, inner_x + tpl.left_sec_text_x_offset, y, ln, tpl.font, tpl.left_sec_text_size)
+        cursor -= tpl.left_sec_section_gap
 
     if languages:
-        cursor -= LEFT_SEC_TITLE_TOP_GAP
-        c.setFont("Helvetica-Bold", LEFT_SEC_HEADING_SIZE)
-        if LEFT_SEC_TITLE_ALIGN == "center":
-            c.drawCentredString(inner_x + inner_w / 2, cursor, "Sprachen")
-        elif LEFT_SEC_TITLE_ALIGN == "right":
-            c.drawRightString(inner_x + inner_w, cursor, "Sprachen")
-        else:
-            c.drawString(inner_x, cursor, "Sprachen")
-        cursor -= LEFT_SEC_TITLE_BOTTOM_GAP
-        c.setStrokeColor(LEFT_SEC_RULE_COLOR)
-        c.setLineWidth(LEFT_SEC_RULE_WIDTH)
+        cursor -= tpl.left_sec_title_top_gap
+        c.setFont(tpl.font_bold, tpl.left_sec_heading_size)
+        c.drawString(tpl.heading_x("languages", inner_x, inner_w, tpl.left_sec_title_align), cursor, HEADINGS["languages"])
+        cursor -= tpl.left_sec_title_bottom_gap
+        c.setStrokeColor(tpl.left_sec_rule_color)
+        c.setLineWidth(tpl.left_sec_rule_width)
         c.line(inner_x, cursor, inner_x + inner_w, cursor)
-        cursor -= LEFT_SEC_RULE_TO_LIST_GAP
-        c.setFont("Helvetica", LEFT_SEC_TEXT_SIZE)
+        cursor -= tpl.left_sec_rule_to_list_gap
+        c.setFont(tpl.font, tpl.left_sec_text_size)
         langs = ", ".join(languages)
         cursor = draw_par(
-            c, inner_x, cursor, [langs], "Helvetica", LEFT_SEC_TEXT_SIZE,
-            inner_w, "left", False, LEFT_SEC_LINE_GAP
+            c, inner_x, cursor, [langs], tpl.font, tpl.left_sec_text_size,
+            inner_w, "auto", False, tpl.left_sec_line_gap, tpl.gap_between_paras, tpl
         )
-        cursor -= LEFT_SEC_SECTION_GAP
+        cursor -= tpl.left_sec_section_gap
 
     return cursor
\ No newline at end of file
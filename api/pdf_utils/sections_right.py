@@ -4,46 +4,49 @@ continuing education, and customizable extra sections.
 """
 
 from reportlab.pdfgen import canvas
-from reportlab.pdfbase import pdfmetrics
-from reportlab.lib import colors
 
-from .config import *
+from .templates import HEADINGS, Template, resolve_template
 from .shapes import draw_rule
-from .text import draw_par
-from .fonts import AR_FONT
+from .text import draw_line, draw_par
+from .fallback import draw_string, string_width
+from .layout import cached_layout
 
 
+@cached_layout("yR")
 def draw_right_extra_sections(
     c: canvas.Canvas,
     right_x: float,
     right_w: float,
     yR: float,
     sections_right: list[dict],
+    template: Template | None = None,
 ) -> float:
     """Draws additional user-defined sections on the right column."""
+    tpl = resolve_template(template)
     for sec in (sections_right or []):
         title = (sec.get("title") or "").strip()
         lines = [str(x).strip() for x in (sec.get("lines") or []) if str(x).strip()]
         if not title or not lines:
             continue
-        c.setFont("Helvetica-Bold", RIGHT_SEC_HEADING_SIZE)
-        c.setFillColor(colors.black)
-        c.drawString(right_x, yR, title)
-        yR -= RIGHT_SEC_TITLE_TO_RULE_GAP
-        c.setStrokeColor(RIGHT_SEC_RULE_COLOR)
-        c.setLineWidth(RIGHT_SEC_RULE_WIDTH)
+        c.setFont(tpl.font_bold, tpl.right_sec_heading_size)
+        c.setFillColor(tpl.text_color)
+        draw_line(c, right_x, yR, right_w, title, tpl.font_bold, tpl.right_sec_heading_size)
+        yR -= tpl.right_sec_title_to_rule_gap
+        c.setStrokeColor(tpl.right_sec_rule_color)
+        c.setLineWidth(tpl.right_sec_rule_width)
         c.line(right_x, yR, right_x + right_w, yR)
-        yR -= RIGHT_SEC_RULE_TO_TEXT_GAP
-        c.setFont("Helvetica", RIGHT_SEC_TEXT_SIZE)
-        c.setFillColor(colors.black)
+        yR -= tpl.right_sec_rule_to_text_gap
+        c.setFont(tpl.font, tpl.right_sec_text_size)
+        c.setFillColor(tpl.text_color)
         yR = draw_par(
-            c, right_x, yR, lines, "Helvetica", RIGHT_SEC_TEXT_SIZE,
-            right_w, "left", False, RIGHT_SEC_LINE_GAP, RIGHT_SEC_PARA_GAP
+            c, right_x, yR, lines, tpl.font, tpl.right_sec_text_size,
+            right_w, "auto", False, tpl.right_sec_line_gap, tpl.right_sec_para_gap, tpl
         )
-        yR -= RIGHT_SEC_SECTION_GAP
+        yR -= tpl.right_sec_section_gap
     return yR
 
 
+@cached_layout("yR")
 def draw_projects(
     c: canvas.Canvas,
     right_x: float,
@@ -51,13 +54,18 @@ def draw_projects(
     yR: float,
     projects: list[tuple[str, str, str | None]],
     rtl_mode: bool = False,
+    template: Template | None = None,
 ) -> float:
     """
-    Draws the "Selected Projects" section with optional RTL support and links.
+    Draws the "Selected Projects" section with links.
+
+    Each title and paragraph gets its own direction from its first strong
+    character; ``rtl_mode`` only sets the direction of neutral-only text.
 
     Returns:
         float: Updated y-position.
     """
+    tpl = resolve_template(template)
     clean_projects = []
     for title, desc, link in (projects or []):
         t = (title or "").strip()
@@ -69,55 +77,60 @@ def draw_projects(
     if not clean_projects:
         return yR
 
-    c.setFont("Helvetica-Bold", HEADING_SIZE)
-    c.setFillColor(HEADING_COLOR)
-    c.drawString(right_x, yR, "Ausgew\u00e4hlte Projekte")
-    yR -= GAP_AFTER_HEADING
-    draw_rule(c, right_x, yR, right_w)
-    yR -= RIGHT_SEC_RULE_TO_TEXT_GAP
+    c.setFont(tpl.font_bold, tpl.heading_size)
+    c.setFillColor(tpl.heading_color)
+    c.drawString(right_x, yR, HEADINGS["projects"])
+    yR -= tpl.gap_after_heading
+    draw_rule(c, right_x, yR, right_w, tpl.rule_color, tpl.rule_width)
+    yR -= tpl.right_sec_rule_to_text_gap
 
     for title, desc, link in clean_projects:
-        c.setFont("Helvetica-Bold", PROJECT_TITLE_SIZE)
-        c.setFillColor(SUBHEAD_COLOR)
-        c.drawString(right_x, yR, title)
-        yR -= PROJECT_TITLE_GAP_BELOW
+        c.setFont(tpl.font_bold, tpl.project_title_size)
+        c.setFillColor(tpl.subhead_color)
+        draw_line(c, right_x, yR, right_w, title, tpl.font_bold, tpl.project_title_size, rtl_mode)
+        yR -= tpl.project_title_gap_below
 
-        c.setFillColor(colors.black)
+        c.setFillColor(tpl.text_color)
         yR = draw_par(
             c=c,
             x=right_x,
             y=yR,
             lines=(desc or "").split("\n"),
-            font=(AR_FONT if rtl_mode else "Helvetica"),
-            size=TEXT_SIZE,
+            font=tpl.font,
+            size=tpl.text_size,
             max_w=right_w,
-            align=("right" if rtl_mode else "left"),
+            align="auto",
             rtl_mode=rtl_mode,
-            leading=PROJECT_DESC_LEADING,
+            leading=tpl.project_desc_leading,
+            para_gap=tpl.gap_between_paras,
+            template=tpl,
         )
 
-        yR -= PROJECT_LINK_GAP_ABOVE
+        yR -= tpl.project_link_gap_above
         if link:
-            font_name = "Helvetica-Oblique"
-            c.setFont(font_name, PROJECT_LINK_TEXT_SIZE)
-            c.setFillColor(HEADING_COLOR)
+            font_name = tpl.font_italic
+            size = tpl.project_link_text_size
+            c.setFont(font_name, size)
+            c.setFillColor(tpl.heading_color)
             link_text = f"Repo: {link}"
-            c.drawString(right_x, yR, link_text)
-            tw = pdfmetrics.stringWidth(link_text, font_name, PROJECT_LINK_TEXT_SIZE)
-            asc = pdfmetrics.getAscent(font_name) / 1000.0 * PROJECT_LINK_TEXT_SIZE
-            dsc = abs(pdfmetrics.getDescent(font_name)) / 1000.0 * PROJECT_LINK_TEXT_SIZE
+            draw_string(c, right_x, yR, link_text, font_name, size)
+            tw = string_width(link_text, font_name, size)
+            asc = tpl.link_ascent * size
+            dsc = tpl.link_descent * size
             c.linkURL(link, (right_x, yR - dsc, right_x + tw, yR + asc * 0.2), relative=0, thickness=0)
-        yR -= PROJECT_BLOCK_GAP
+        yR -= tpl.project_block_gap
 
     return yR
 
 
+@cached_layout("yR")
 def draw_education(
     c: canvas.Canvas,
     right_x: float,
     right_w: float,
     yR: float,
     education_items: list[str],
+    template: Template | None = None,
 ) -> float:
     """
     Draws the "Professional Education" section on the right column.
@@ -125,34 +138,35 @@ def draw_education(
     Returns:
         float: Updated y-position.
     """
+    tpl = resolve_template(template)
     items = [str(b).strip() for b in (education_items or []) if str(b).strip()]
     if not items:
         return yR
 
-    c.setFont("Helvetica-Bold", HEADING_SIZE)
-    c.setFillColor(HEADING_COLOR)
-    c.drawString(right_x, yR, "Berufliche Weiterbildung")
-    yR -= GAP_AFTER_HEADING
-    draw_rule(c, right_x, yR, right_w)
-    yR -= RIGHT_SEC_RULE_TO_TEXT_GAP
+    c.setFont(tpl.font_bold, tpl.heading_size)
+    c.setFillColor(tpl.heading_color)
+    c.drawString(right_x, yR, HEADINGS["education"])
+    yR -= tpl.gap_after_heading
+    draw_rule(c, right_x, yR, right_w, tpl.rule_color, tpl.rule_width)
+    yR -= tpl.right_sec_rule_to_text_gap
 
     for block in items:
         parts = [ln.strip() for ln in block.splitlines() if ln.strip()]
         if not parts:
             continue
 
-        c.setFont("Helvetica-Bold", TEXT_SIZE)
-        c.setFillColor(EDU_TITLE_COLOR)
-        c.drawString(right_x, yR, parts[0])
-        yR -= RIGHT_SEC_LINE_GAP
+        c.setFont(tpl.font_bold, tpl.text_size)
+        c.setFillColor(tpl.edu_title_color)
+        draw_line(c, right_x, yR, right_w, parts[0], tpl.font_bold, tpl.text_size)
+        yR -= tpl.right_sec_line_gap
 
         rest = parts[1:]
         if rest:
-            c.setFillColor(colors.black)
+            c.setFillColor(tpl.text_color)
             yR = draw_par(
-                c, right_x, yR, rest, "Helvetica", RIGHT_SEC_TEXT_SIZE,
-                right_w, "left", False, EDU_TEXT_LEADING, 2
+                c, right_x, yR, rest, tpl.font, tpl.right_sec_text_size,
+                right_w, "auto", False, tpl.edu_text_leading, 2, tpl
             )
-        yR -= RIGHT_SEC_SECTION_GAP
+        yR -= tpl.right_sec_section_gap
 
     return yR
\ No newline at end of file
@@ -42,6 +42,7 @@ def draw_rule(
     y: float,
     w: float,
     color=RULE_COLOR,
+    width: float = 0.7,
 ):
     """
     Draws a horizontal rule (line).
@@ -52,7 +53,8 @@ def draw_rule(
         y (float): Y-coordinate for the rule.
         w (float): Width of the rule.
         color: Color of the line.
+        width (float): Line width.
     """
     c.setStrokeColor(color)
-    c.setLineWidth(0.7)
+    c.setLineWidth(width)
     c.line(x, y, x + w, y)
\ No newline at end of file
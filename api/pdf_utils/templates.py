@@ -0,0 +1,322 @@
+"""
+Registry of resume templates (themes).
+
+A template is an immutable set of layout and style parameters. Values that
+follow from them (page geometry, font metrics, static heading widths) are
+computed once per template, and compiled templates are cached by name.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.pdfbase import pdfmetrics
+
+from .config import (
+    HEADING_SIZE, TEXT_SIZE, NAME_SIZE, NAME_GAP, LEFT_TEXT_FONT, LEFT_TEXT_FONT_BOLD,
+    LEFT_TEXT_IS_BOLD, LEADING_BODY, LEADING_BODY_RTL, GAP_AFTER_HEADING, GAP_BETWEEN_PARAS,
+    GAP_BETWEEN_SECTIONS, LEFT_BG, LEFT_BORDER, HEADING_COLOR, SUBHEAD_COLOR, MUTED, RULE_COLOR,
+    EDU_TITLE_COLOR, CARD_RADIUS, CARD_PAD, ICON_SIZE, ICON_PAD_X, ICON_TEXT_DY, ICON_VALIGN,
+    ICON_STYLE, LEFT_TEXT_SIZE, LEFT_LINE_GAP, LEFT_SEC_HEADING_SIZE, LEFT_SEC_TEXT_SIZE,
+    LEFT_SEC_TITLE_TOP_GAP, LEFT_SEC_TITLE_BOTTOM_GAP, LEFT_SEC_RULE_COLOR, LEFT_SEC_RULE_WIDTH,
+    LEFT_SEC_RULE_TO_LIST_GAP, LEFT_SEC_LINE_GAP, LEFT_SEC_BULLET_RADIUS, LEFT_SEC_BULLET_X_OFFSET,
+    LEFT_SEC_TEXT_X_OFFSET, LEFT_SEC_SECTION_GAP, LEFT_AFTER_CONTACT_GAP, LEFT_SEC_TITLE_ALIGN,
+    RIGHT_SEC_HEADING_SIZE, RIGHT_SEC_TEXT_SIZE, RIGHT_SEC_TITLE_TO_RULE_GAP, RIGHT_SEC_RULE_COLOR,
+    RIGHT_SEC_RULE_WIDTH, RIGHT_SEC_RULE_TO_TEXT_GAP, RIGHT_SEC_LINE_GAP, RIGHT_SEC_SECTION_GAP,
+    RIGHT_SEC_PARA_GAP, PROJECT_TITLE_SIZE, PROJECT_TITLE_GAP_BELOW, PROJECT_DESC_LEADING,
+    PROJECT_LINK_TEXT_SIZE, PROJECT_LINK_GAP_ABOVE, PROJECT_BLOCK_GAP, EDU_TEXT_LEADING,
+)
+
+DEFAULT_TEMPLATE = "default"
+
+# Fixed section headings, keyed by section.
+HEADINGS = {
+    "contact": "Persönliche Informationen",
+    "skills": "Technische Fähigkeiten",
+    "languages": "Sprachen",
+    "projects": "Ausgewählte Projekte",
+    "education": "Berufliche Weiterbildung",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Template:
+    """
+    Layout and style parameters of one resume theme.
+
+    Field defaults come from ``config``, so the "default" template renders
+    exactly like the module-level settings. Fields after ``cache_key`` are
+    derived in ``__post_init__`` and must not be passed in.
+    """
+
+    name: str = DEFAULT_TEMPLATE
+
+    # Page
+    page_size: Tuple[float, float] = A4
+    margin: float = 16 * mm
+    gutter: float = 8 * mm
+    left_ratio: float = 0.40
+
+    # Fonts and typography
+    font: str = "Helvetica"
+    font_bold: str = "Helvetica-Bold"
+    font_italic: str = "Helvetica-Oblique"
+    heading_size: float = HEADING_SIZE
+    text_size: float = TEXT_SIZE
+    name_size: float = NAME_SIZE
+    name_gap: float = NAME_GAP
+    left_text_font: str = LEFT_TEXT_FONT
+    left_text_font_bold: str = LEFT_TEXT_FONT_BOLD
+    left_text_is_bold: bool = LEFT_TEXT_IS_BOLD
+
+    # Spacing
+    leading_body: float = LEADING_BODY
+    leading_body_rtl: float = LEADING_BODY_RTL
+    gap_after_heading: float = GAP_AFTER_HEADING
+    gap_between_paras: float = GAP_BETWEEN_PARAS
+    gap_between_sections: float = GAP_BETWEEN_SECTIONS
+
+    # Colors and rules
+    text_color: Any = colors.black
+    left_bg: Any = LEFT_BG
+    left_border: Any = LEFT_BORDER
+    heading_color: Any = HEADING_COLOR
+    subhead_color: Any = SUBHEAD_COLOR
+    muted: Any = MUTED
+    rule_color: Any = RULE_COLOR
+    rule_width: float = 0.7
+    edu_title_color: Any = EDU_TITLE_COLOR
+
+    # Card and photo
+    card_radius: float = CARD_RADIUS
+    card_pad: float = CARD_PAD
+    photo_max_d: float = 42 * mm
+    photo_gap: float = 6 * mm
+
+    # Icons row
+    icon_size: float = ICON_SIZE
+    icon_pad_x: float = ICON_PAD_X
+    icon_text_dy: float = ICON_TEXT_DY
+    icon_valign: str = ICON_VALIGN
+    icon_style: str = ICON_STYLE
+
+    # Left column
+    left_text_size: float = LEFT_TEXT_SIZE
+    left_line_gap: float = LEFT_LINE_GAP
+    left_sec_heading_size: float = LEFT_SEC_HEADING_SIZE
+    left_sec_text_size: float = LEFT_SEC_TEXT_SIZE
+    left_sec_title_top_gap: float = LEFT_SEC_TITLE_TOP_GAP
+    left_sec_title_bottom_gap: float = LEFT_SEC_TITLE_BOTTOM_GAP
+    left_sec_rule_color: Any = LEFT_SEC_RULE_COLOR
+    left_sec_rule_width: float = LEFT_SEC_RULE_WIDTH
+    left_sec_rule_to_list_gap: float = LEFT_SEC_RULE_TO_LIST_GAP
+    left_sec_line_gap: float = LEFT_SEC_LINE_GAP
+    left_sec_bullet_radius: float = LEFT_SEC_BULLET_RADIUS
+    left_sec_bullet_x_offset: float = LEFT_SEC_BULLET_X_OFFSET
+    left_sec_text_x_offset: float = LEFT_SEC_TEXT_X_OFFSET
+    left_sec_section_gap: float = LEFT_SEC_SECTION_GAP
+    left_after_contact_gap: float = LEFT_AFTER_CONTACT_GAP
+    left_sec_title_align: str = LEFT_SEC_TITLE_ALIGN
+
+    # Right column
+    right_sec_heading_size: float = RIGHT_SEC_HEADING_SIZE
+    right_sec_text_size: float = RIGHT_SEC_TEXT_SIZE
+    right_sec_title_to_rule_gap: float = RIGHT_SEC_TITLE_TO_RULE_GAP
+    right_sec_rule_color: Any = RIGHT_SEC_RULE_COLOR
+    right_sec_rule_width: float = RIGHT_SEC_RULE_WIDTH
+    right_sec_rule_to_text_gap: float = RIGHT_SEC_RULE_TO_TEXT_GAP
+    right_sec_line_gap: float = RIGHT_SEC_LINE_GAP
+    right_sec_section_gap: float = RIGHT_SEC_SECTION_GAP
+    right_sec_para_gap: float = RIGHT_SEC_PARA_GAP
+
+    # Projects and education
+    project_title_size: float = PROJECT_TITLE_SIZE
+    project_title_gap_below: float = PROJECT_TITLE_GAP_BELOW
+    project_desc_leading: float = PROJECT_DESC_LEADING
+    project_link_text_size: float = PROJECT_LINK_TEXT_SIZE
+    project_link_gap_above: float = PROJECT_LINK_GAP_ABOVE
+    project_block_gap: float = PROJECT_BLOCK_GAP
+    edu_text_leading: float = EDU_TEXT_LEADING
+
+    # Derived
+    cache_key: str = field(init=False, repr=False, compare=False)
+    page_w: float = field(init=False, repr=False, compare=False)
+    page_h: float = field(init=False, repr=False, compare=False)
+    left_x: float = field(init=False, repr=False, compare=False)
+    left_w: float = field(init=False, repr=False, compare=False)
+    right_x: float = field(init=False, repr=False, compare=False)
+    right_w: float = field(init=False, repr=False, compare=False)
+    y_top: float = field(init=False, repr=False, compare=False)
+    card_h: float = field(init=False, repr=False, compare=False)
+    inner_x: float = field(init=False, repr=False, compare=False)
+    inner_w: float = field(init=False, repr=False, compare=False)
+    photo_d: float = field(init=False, repr=False, compare=False)
+    value_font: str = field(init=False, repr=False, compare=False)
+    value_ascent: float = field(init=False, repr=False, compare=False)
+    value_descent: float = field(init=False, repr=False, compare=False)
+    link_ascent: float = field(init=False, repr=False, compare=False)
+    link_descent: float = field(init=False, repr=False, compare=False)
+    heading_widths: Mapping[str, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        derived: Dict[str, Any] = {}
+        W, H = self.page_size
+        body_w = W - 2 * self.margin - self.gutter
+        derived["page_w"], derived["page_h"] = W, H
+        derived["left_x"] = self.margin
+        derived["left_w"] = self.left_ratio * body_w
+        derived["right_x"] = self.margin + derived["left_w"] + self.gutter
+        derived["right_w"] = (1 - self.left_ratio) * body_w
+        derived["y_top"] = H - self.margin
+        derived["card_h"] = H - 2 * self.margin
+        derived["inner_x"] = self.margin + self.card_pad
+        derived["inner_w"] = derived["left_w"] - 2 * self.card_pad
+        derived["photo_d"] = min(derived["inner_w"], self.photo_max_d)
+
+        # Ascent/descent per point of font size.
+        value_font = self.left_text_font_bold if self.left_text_is_bold else self.left_text_font
+        derived["value_font"] = value_font
+        derived["value_ascent"] = pdfmetrics.getAscent(value_font) / 1000.0
+        derived["value_descent"] = abs(pdfmetrics.getDescent(value_font)) / 1000.0
+        derived["link_ascent"] = pdfmetrics.getAscent(self.font_italic) / 1000.0
+        derived["link_descent"] = abs(pdfmetrics.getDescent(self.font_italic)) / 1000.0
+
+        sizes = {
+            "contact": self.heading_size,
+            "skills": self.left_sec_heading_size,
+            "languages": self.left_sec_heading_size,
+            "projects": self.heading_size,
+            "education": self.heading_size,
+        }
+        derived["heading_widths"] = MappingProxyType({
+            k: pdfmetrics.stringWidth(HEADINGS[k], self.font_bold, size) for k, size in sizes.items()
+        })
+
+        params = [(f.name, getattr(self, f.name)) for f in fields(self) if f.init]
+        digest = hashlib.blake2b(repr(params).encode("utf-8"), digest_size=8).hexdigest()
+        derived["cache_key"] = f"{self.name}:{digest}"
+
+        for k, v in derived.items():
+            object.__setattr__(self, k, v)
+
+    def heading_x(self, key: str, x: float, w: float, align: str = "left") -> float:
+        """
+        Returns the start x of a fixed heading aligned within [x, x + w].
+
+        Uses the precomputed width, matching drawCentredString/drawRightString.
+        """
+        if align == "center":
+            return x + w / 2 - 0.5 * self.heading_widths[key]
+        if align == "right":
+            return x + w - self.heading_widths[key]
+        return x
+
+
+# name -> overrides of the Template defaults
+TEMPLATES: Dict[str, Dict[str, Any]] = {
+    DEFAULT_TEMPLATE: {},
+    "compact": {
+        "margin": 12 * mm,
+        "heading_size": 13,
+        "text_size": 10.5,
+        "name_size": 16,
+        "left_text_size": 10.5,
+        "left_line_gap": 14,
+        "left_sec_heading_size": 12,
+        "left_sec_text_size": 10.5,
+        "left_sec_line_gap": 15,
+        "right_sec_heading_size": 13,
+        "right_sec_text_size": 10.5,
+        "right_sec_line_gap": 11,
+        "project_title_size": 11.5,
+        "project_title_gap_below": 12,
+        "project_desc_leading": 12,
+        "project_link_text_size": 9.5,
+        "project_block_gap": 18,
+        "edu_text_leading": 11,
+        "icon_size": 5 * mm,
+    },
+    "classic": {
+        "font": "Times-Roman",
+        "font_bold": "Times-Bold",
+        "font_italic": "Times-Italic",
+        "left_text_font": "Times-Roman",
+        "left_text_font_bold": "Times-Bold",
+        "left_bg": colors.white,
+        "left_border": colors.HexColor("#BFBFBF"),
+        "subhead_color": colors.HexColor("#7A1F1F"),
+        "edu_title_color": colors.HexColor("#7A1F1F"),
+        "rule_color": colors.HexColor("#BFBFBF"),
+        "left_sec_rule_color": colors.HexColor("#BFBFBF"),
+        "right_sec_rule_color": colors.HexColor("#BFBFBF"),
+        "left_sec_title_align": "center",
+    },
+}
+
+_lock = threading.Lock()
+
+
+def register_template(name: str, base: str = DEFAULT_TEMPLATE, **overrides: Any) -> Template:
+    """
+    Registers (or replaces) a template as ``base`` plus ``overrides``.
+
+    Args:
+        name (str): Template name used in requests.
+        base (str): Registered template to start from.
+        **overrides: Template fields to change.
+
+    Returns:
+        Template: The compiled template.
+
+    Raises:
+        ValueError: If ``base`` is unknown or an override is not a template field.
+    """
+    with _lock:
+        if base not in TEMPLATES:
+            raise ValueError(f"unknown template: {base!r}")
+        params = {**TEMPLATES[base], **overrides}
+        compiled = _compile(name, params)  # validates before registering
+        TEMPLATES[name] = params
+        get_template.cache_clear()
+    return compiled
+
+
+def _compile(name: str, params: Mapping[str, Any]) -> Template:
+    try:
+        return Template(name=name, **params)
+    except TypeError as e:
+        raise ValueError(f"invalid template {name!r}: {e}")
+
+
+@lru_cache(maxsize=None)
+def get_template(name: str = DEFAULT_TEMPLATE) -> Template:
+    """
+    Returns the compiled template registered under ``name``.
+
+    Raises:
+        ValueError: If no template of that name is registered.
+    """
+    params = TEMPLATES.get(name)
+    if params is None:
+        raise ValueError(f"unknown template: {name!r}")
+    return _compile(name, params)
+
+
+def resolve_template(template: "str | Template | None") -> Template:
+    """Accepts a template, a template name, or None for the default template."""
+    if isinstance(template, Template):
+        return template
+    return get_template(template or DEFAULT_TEMPLATE)
+
+
+def list_templates() -> List[str]:
+    """Returns the registered template names, default first."""
+    return sorted(TEMPLATES, key=lambda n: (n != DEFAULT_TEMPLATE, n))
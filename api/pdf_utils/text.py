@@ -3,12 +3,12 @@ Text wrapping and paragraph rendering utilities for PDF generation.
 Handles LTR and RTL text alignment and spacing.
 """
 
-from typing import List
+from typing import List, Tuple
 from reportlab.pdfgen import canvas
-from reportlab.pdfbase import pdfmetrics
 
-from .fonts import rtl
-from .config import LEADING_BODY, LEADING_BODY_RTL, GAP_BETWEEN_PARAS
+from .fonts import has_rtl, is_rtl_paragraph, reorder, rtl, shape, visual
+from .fallback import draw_string, string_width
+from .templates import Template, resolve_template
 
 
 def wrap_text(text: str, font: str, size: int, max_w: float) -> List[str]:
@@ -19,7 +19,7 @@ def wrap_text(text: str, font: str, size: int, max_w: float) -> List[str]:
     lines, cur = [], words[0]
     for w in words[1:]:
         trial = f"{cur} {w}"
-        if pdfmetrics.stringWidth(trial, font, size) <= max_w:
+        if string_width(trial, font, size) <= max_w:
             cur = trial
         else:
             lines.append(cur)
@@ -28,6 +28,48 @@ def wrap_text(text: str, font: str, size: int, max_w: float) -> List[str]:
     return lines
 
 
+def wrap_visual(text: str, font: str, size: int, max_w: float, default_rtl: bool = False) -> Tuple[List[str], bool]:
+    """
+    Wraps one paragraph and returns its lines in visual order with its direction.
+
+    Paragraphs containing right-to-left letters are shaped, wrapped in logical
+    order and then reordered line by line; all other text skips shaping.
+
+    Args:
+        text (str): Paragraph in logical order.
+        font (str): Font name.
+        size (int): Font size.
+        max_w (float): Maximum line width.
+        default_rtl (bool): Direction for paragraphs without strong characters.
+
+    Returns:
+        Tuple[List[str], bool]: Display lines and whether the paragraph is right-to-left.
+    """
+    if has_rtl(text):
+        rtl_base = is_rtl_paragraph(text, default_rtl)
+        return [reorder(ln, rtl_base) for ln in wrap_text(shape(text), font, size, max_w)], rtl_base
+    rtl_base = default_rtl and is_rtl_paragraph(text, True)
+    return (wrap_text(text, font, size, max_w) if text else [""]), rtl_base
+
+
+def draw_line(
+    c: canvas.Canvas,
+    x: float,
+    y: float,
+    w: float,
+    text: str,
+    font: str,
+    size: int,
+    default_rtl: bool = False,
+) -> None:
+    """Draws a single unwrapped line, right-aligned within ``w`` if it is right-to-left."""
+    txt, rtl_base = visual(text, default_rtl)
+    if rtl_base:
+        draw_string(c, x + w, y, txt, font, size, "right")
+    else:
+        draw_string(c, x, y, txt, font, size)
+
+
 def wrap_lines(lines: List[str], font: str, size: int, max_w: float, do_rtl=False) -> List[str]:
     """Wraps multiple lines of text to fit within a max width, optionally applying RTL logic."""
     out: List[str] = []
@@ -49,6 +91,7 @@ def draw_par(
     rtl_mode: bool = False,
     leading: int | None = None,
     para_gap: int | None = None,
+    template: Template | None = None,
 ) -> float:
     """
     Draws paragraphs with wrapping and spacing control.
@@ -61,30 +104,34 @@ def draw_par(
         font (str): Font name.
         size (int): Font size.
         max_w (float): Maximum width for wrapping.
-        align (str): Text alignment ("left" or "right").
-        rtl_mode (bool): Enables RTL reshaping.
-        leading (int | None): Line spacing.
-        para_gap (int | None): Gap between paragraphs.
+        align (str): Text alignment: "left", "right", or "auto" (right for
+            right-to-left paragraphs, left otherwise).
+        rtl_mode (bool): Default direction for paragraphs without strong
+            characters; each paragraph's direction is otherwise detected.
+        leading (int | None): Line spacing; the template's ``leading_body`` or
+            ``leading_body_rtl`` (by paragraph direction) if None.
+        para_gap (int | None): Gap between paragraphs; the template's
+            ``gap_between_paras`` if None.
+        template (Template | None): Supplies the defaults above; "default" if omitted.
 
     Returns:
         float: Updated y-coordinate after drawing.
     """
     c.setFont(font, size)
     cur = y
-    line_gap = leading if leading is not None else (
-        LEADING_BODY_RTL if (rtl_mode and align == "right") else LEADING_BODY
-    )
-    gap_between_paras = GAP_BETWEEN_PARAS if para_gap is None else para_gap
+    tpl = resolve_template(template)
+    gap_between_paras = tpl.gap_between_paras if para_gap is None else para_gap
 
     for raw in lines:
-        txt = rtl(raw) if (rtl_mode and align == "right") else raw
-        wrapped = wrap_text(txt, font, size, max_w) if txt else [""]
+        wrapped, rtl_base = wrap_visual(raw, font, size, max_w, rtl_mode)
+        right = align == "right" or (align == "auto" and rtl_base)
+        line_gap = leading if leading is not None else (tpl.leading_body_rtl if rtl_base else tpl.leading_body)
         for ln in wrapped:
-            if align == "right":
-                c.drawRightString(x + max_w, cur, ln)
+            if right:
+                draw_string(c, x + max_w, cur, ln, font, size, "right")
             else:
-                c.drawString(x, cur, ln)
+                draw_string(c, x, cur, ln, font, size)
             cur -= line_gap
         cur -= gap_between_paras
 
-    return cur
\ No newline at end of file
+    return cur
@@ -0,0 +1,114 @@
+"""
+Batched text output for display-list replay.
+
+Consecutive text draws are written into one PDF text object (BT ... ET)
+with relative line moves instead of one text object per string, and font
+or fill colour changes that repeat the current state are dropped.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional, Tuple
+
+# Calls a TextBatch takes over; anything else ends the current text object.
+TEXT_OPS = frozenset({"drawString", "drawRightString", "drawCentredString", "setFont", "setFillColor"})
+# Calls that add no page content (annotations) and so do not end a text object.
+PASS_OPS = frozenset({"linkURL"})
+# Calls that neither use nor save the font, so a pending font change can wait past them.
+FONT_FREE_OPS = frozenset({"line", "circle", "rect", "drawImage", "setStrokeColor", "setLineWidth"})
+
+
+def _color_key(color: Any) -> Any:
+    rgba = getattr(color, "rgba", None)
+    return (type(color).__name__, tuple(rgba())) if rgba else repr(color)
+
+
+class TextBatch:
+    """
+    Collects the text calls of a replay and writes them as few text objects.
+
+    ``setFont`` and ``setFillColor`` are only recorded; they are written when
+    text is drawn (or the batch is flushed) and skipped if the canvas is
+    already in that state. The canvas' own font and fill colour attributes
+    always describe what has been written, so calls made on the canvas
+    after flush() and the elision itself see the right state. Those
+    attributes are private to ReportLab; only use a TextBatch when
+    rlcompat.CANVAS_STATE_OK.
+
+    Args:
+        c: The ReportLab canvas to draw on.
+    """
+
+    def __init__(self, c) -> None:
+        self.c = c
+        self.t = None
+        self.origin: Tuple[float, float] = (0.0, 0.0)
+        self.font: Optional[Tuple[str, float, float]] = None
+        self.fill: Optional[Any] = None
+
+    def handles(self, name: str, kwargs: dict) -> bool:
+        """True if call ``name`` is batched (text calls only without extra options)."""
+        return name in TEXT_OPS and not kwargs
+
+    def setFont(self, name: str, size: float, leading: Optional[float] = None) -> None:
+        self.font = (name, size, size * 1.2 if leading is None else leading)
+
+    def setFillColor(self, color: Any) -> None:
+        self.fill = color
+
+    def drawString(self, x: float, y: float, text: str) -> None:
+        self._text(0.0, x, y, text)
+
+    def drawRightString(self, x: float, y: float, text: str) -> None:
+        self._text(1.0, x, y, text)
+
+    def drawCentredString(self, x: float, y: float, text: str) -> None:
+        self._text(0.5, x, y, text)
+
+    def _text(self, align: float, x: float, y: float, text: str) -> None:
+        if not text:
+            return
+        c = self.c
+        name, size, leading = self.font or (c._fontname, c._fontsize, c._leading)
+        if align:
+            x -= align * c.stringWidth(text, name, size)
+        t = self.t
+        if t is None:
+            t = self.t = c.beginText(x, y)
+        else:
+            ox, oy = self.origin
+            t.moveCursor(x - ox, oy - y)  # Td, relative to the start of the previous line
+        self.origin = (x, y)
+        if self.font is not None:
+            if (name, size) != (t._fontname, t._fontsize):
+                t.setFont(name, size, leading)
+            c._fontname, c._fontsize, c._leading = self.font
+            self.font = None
+        self._sync_fill(t)
+        t.textOut(text)
+
+    def _sync_fill(self, target) -> None:
+        if self.fill is None:
+            return
+        c = self.c
+        if _color_key(self.fill) != _color_key(c._fillColorObj):
+            target.setFillColor(self.fill)
+            c._fillColorObj = self.fill
+        self.fill = None
+
+    def flush(self, font: bool = True) -> None:
+        """
+        Ends the current text object and writes pending state changes to the canvas.
+
+        With ``font=False`` a pending font change is kept for the next text;
+        only calls in FONT_FREE_OPS may be issued before the next flush().
+        """
+        c = self.c
+        t, self.t = self.t, None
+        if t is not None:
+            c.drawText(t)
+        if font and self.font is not None:
+            if self.font[:2] != (c._fontname, c._fontsize):
+                c.setFont(*self.font)
+            self.font = None
+        self._sync_fill(c)
@@ -0,0 +1,176 @@
+"""
+Vector versions of the contact icons, drawn as reusable form XObjects.
+
+Each icon is path data in a 24x24 box (SVG coordinates, y pointing down)
+with a fill colour. A page references an icon with doForm; the form itself
+is compiled once per document, after layout, for the icons actually used.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import List, Tuple
+
+from reportlab.lib import colors
+from reportlab.pdfgen.canvas import FILL_EVEN_ODD
+
+from .rlcompat import CANVAS_STATE_OK
+
+ICON_BOX = 24.0
+FORM_PREFIX = "icon_"
+
+# name -> (path data: absolute M/L/H/V/C/Z commands, even-odd fill; colour)
+VECTOR_ICONS = {
+    "pin": (
+        "M12 2C8.1 2 5 5.1 5 9C5 14.2 12 22 12 22C12 22 19 14.2 19 9C19 5.1 15.9 2 12 2Z"
+        "M14.5 9C14.5 10.38 13.38 11.5 12 11.5C10.62 11.5 9.5 10.38 9.5 9"
+        "C9.5 7.62 10.62 6.5 12 6.5C13.38 6.5 14.5 7.62 14.5 9Z",
+        colors.HexColor("#C24B5D"),
+    ),
+    "phone": (
+        "M7 3.5L9.8 3.2C10.4 3.1 10.9 3.5 11 4L11.8 7.6C11.9 8.1 11.7 8.6 11.3 8.9L9.4 10.3"
+        "C10.5 12.6 11.4 13.5 13.7 14.6L15.1 12.7C15.4 12.3 15.9 12.1 16.4 12.2L20 13"
+        "C20.5 13.1 20.9 13.6 20.8 14.2L20.5 17C20.4 18.9 18.9 20.5 17 20.5"
+        "C10 20.5 3.5 14 3.5 7C3.5 5.1 5.1 3.6 7 3.5Z",
+        colors.HexColor("#D84054"),
+    ),
+    "mail": (
+        "M4 5H20C21.1 5 22 5.9 22 7V17C22 18.1 21.1 19 20 19H4C2.9 19 2 18.1 2 17V7C2 5.9 2.9 5 4 5Z"
+        "M3.6 6.6H20.4V17.4H3.6Z"
+        "M3.6 6.6L12 12.4L20.4 6.6V8.5L12 14.3L3.6 8.5Z",
+        colors.HexColor("#6C757D"),
+    ),
+    "cake": (
+        "M3.5 12.5H20.5V21H3.5Z"
+        "M3.5 15.8H20.5V17H3.5Z"
+        "M10.8 7H13.2V12.5H10.8Z"
+        "M12 2C13.2 3.4 13.5 4.2 13.5 4.8C13.5 5.6 12.8 6.2 12 6.2"
+        "C11.2 6.2 10.5 5.6 10.5 4.8C10.5 4.2 10.8 3.4 12 2Z",
+        colors.HexColor("#E18A8E"),
+    ),
+    "github": (
+        "M22 12C22 17.52 17.52 22 12 22C6.48 22 2 17.52 2 12C2 6.48 6.48 2 12 2C17.52 2 22 6.48 22 12Z"
+        "M8.2 5.8L9.9 7.6C11.3 7.3 12.7 7.3 14.1 7.6L15.8 5.8C16.3 7 16.4 8.3 16 9.3"
+        "C16.8 10.2 17.2 11.3 17.2 12.5C17.2 15.6 15.4 16.7 13.6 17C14 17.4 14.3 18.1 14.3 19"
+        "V21.6H9.7V20.2C8 20.6 6.9 19.8 6.4 18.6C6.1 18 5.6 17.6 5.2 17.5"
+        "C6.1 17.4 6.7 18.1 7 18.6C7.6 19.5 8.6 19.6 9.7 19.2V19C9.7 18.1 10 17.4 10.4 17"
+        "C8.6 16.7 6.8 15.6 6.8 12.5C6.8 11.3 7.2 10.2 8 9.3C7.6 8.3 7.7 7 8.2 5.8Z",
+        colors.HexColor("#24292F"),
+    ),
+    "linkedin": (
+        "M5 2H19C20.7 2 22 3.3 22 5V19C22 20.7 20.7 22 19 22H5C3.3 22 2 20.7 2 19V5C2 3.3 3.3 2 5 2Z"
+        "M5.5 9.5H8.5V18.5H5.5Z"
+        "M8.6 6.6C8.6 7.5 7.9 8.2 7 8.2C6.1 8.2 5.4 7.5 5.4 6.6C5.4 5.7 6.1 5 7 5C7.9 5 8.6 5.7 8.6 6.6Z"
+        "M10.5 9.5H13.4V10.8C13.9 10 14.9 9.3 16.3 9.3C18.6 9.3 19 10.8 19 12.8V18.5H16V13.4"
+        "C16 12.5 15.8 11.7 14.9 11.7C13.9 11.7 13.5 12.4 13.5 13.4V18.5H10.5Z",
+        colors.HexColor("#0A66C2"),
+    ),
+}
+
+_TOKEN = re.compile(r"[MLHVCZ]|-?\d*\.?\d+")
+_ARITY = {"M": 2, "L": 2, "H": 1, "V": 1, "C": 6, "Z": 0}
+
+PathOp = Tuple[str, Tuple[float, ...]]
+
+
+@lru_cache(maxsize=None)
+def parse_path(d: str) -> Tuple[PathOp, ...]:
+    """
+    Parses absolute SVG path data (M, L, H, V, C, Z) into moveTo/lineTo/curveTo/close ops.
+
+    Raises:
+        ValueError: On unsupported commands or a wrong number of coordinates.
+    """
+    ops: List[PathOp] = []
+    x = y = 0.0
+    cmd = None
+    nums: List[float] = []
+
+    def flush() -> None:
+        nonlocal x, y
+        if cmd is None:
+            return
+        n = _ARITY[cmd]
+        if (n == 0 and nums) or (n and (not nums or len(nums) % n)):
+            raise ValueError(f"bad coordinates for {cmd}: {nums}")
+        if cmd == "Z":
+            ops.append(("close", ()))
+            return
+        for i in range(0, len(nums), n):
+            a = nums[i:i + n]
+            if cmd == "H":
+                a = [a[0], y]
+            elif cmd == "V":
+                a = [x, a[0]]
+            op = "moveTo" if cmd == "M" and i == 0 else ("curveTo" if cmd == "C" else "lineTo")
+            ops.append((op, tuple(a)))
+            x, y = a[-2], a[-1]
+
+    pos = 0
+    for m in _TOKEN.finditer(d):
+        if d[pos:m.start()].strip(" ,"):
+            raise ValueError(f"unsupported path data: {d[pos:m.start()]!r}")
+        pos = m.end()
+        tok = m.group()
+        if tok in _ARITY:
+            flush()
+            cmd, nums = tok, []
+        else:
+            nums.append(float(tok))
+    flush()
+    return tuple(ops)
+
+
+def form_name(name: str) -> str:
+    """Returns the form XObject name used for vector icon ``name``."""
+    return FORM_PREFIX + name
+
+
+def draw_vector_icon(c, name: str, x: float, y: float, w: float, h: float) -> None:
+    """
+    Places vector icon ``name`` with its top-left corner at (x, y), sized w x h.
+
+    Only the form reference is drawn; compile_icon_forms() adds the form to
+    the document. Works on DisplayLists as well as canvases.
+    """
+    c.saveState()
+    c.transform(w / ICON_BOX, 0, 0, -h / ICON_BOX, x, y)
+    c.doForm(form_name(name))
+    c.restoreState()
+
+
+def compile_icon_forms(c) -> int:
+    """
+    Defines the form XObject of every vector icon the document references.
+
+    Call once per document, after drawing and before the page is finished;
+    forms that already exist are skipped. The referenced forms are read from
+    the canvas' private state, so with an unchecked ReportLab version (see
+    rlcompat) every icon is compiled.
+
+    Returns:
+        int: Number of forms compiled.
+    """
+    done = 0
+    used = c._formsinuse if CANVAS_STATE_OK else [FORM_PREFIX + n for n in VECTOR_ICONS]
+    for form in dict.fromkeys(used):
+        name = form[len(FORM_PREFIX):]
+        if not form.startswith(FORM_PREFIX) or name not in VECTOR_ICONS or c.hasForm(form):
+            continue
+        d, color = VECTOR_ICONS[name]
+        c.beginForm(form, 0, 0, ICON_BOX, ICON_BOX)
+        c.setFillColor(color)
+        p = c.beginPath()
+        for op, args in parse_path(d):
+            getattr(p, op)(*args)
+        c.drawPath(p, stroke=0, fill=1, fillMode=FILL_EVEN_ODD)
+        c.endForm()
+        done += 1
+    return done
+
+
+def preload_vector_icons() -> None:
+    """Parses all icon path data up front."""
+    for d, _ in VECTOR_ICONS.values():
+        parse_path(d)
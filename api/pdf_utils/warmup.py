@@ -0,0 +1,80 @@
+"""
+Warm-up routine that exercises every rendering path once.
+Used at API startup so the first real request does not pay for font parsing,
+font metric loading, icon decoding or the Arabic reshaper setup.
+"""
+
+from __future__ import annotations
+
+import time
+from io import BytesIO
+
+from reportlab.pdfbase import pdfmetrics
+
+from .fallback import FALLBACK_FONTS, coverage
+from .fonts import visual
+from .icons import preload_icons
+from .resume import build_resume_pdf
+from .templates import get_template, list_templates
+
+_SAMPLE = dict(
+    name="Warm Up",
+    location="Wuppertal, Germany",
+    phone="+49 000 000",
+    email="warmup@example.com",
+    github="https://github.com/example",
+    linkedin="linkedin.com/in/example",
+    birthdate="01.01.1990",
+    skills=["FastAPI", "ReportLab"],
+    languages=["Deutsch – Gute Kenntnisse", "العربية"],
+    education_items=["Course – School\n2024–2025"],
+    sections_left=[{"title": "Hobbies", "lines": ["Reading"]}],
+    sections_right=[{"title": "Profile", "lines": ["Backend developer"]}],
+)
+
+_PROJECTS_LTR = [("Project", "Short description.", "https://github.com/example/project")]
+_PROJECTS_RTL = [("مشروع", "وصف قصير للمشروع.", "https://github.com/example/project")]
+
+
+def _sample_photo() -> bytes | None:
+    """Builds a tiny PNG in memory, or None if Pillow is unavailable."""
+    try:
+        from PIL import Image
+    except Exception:
+        return None
+    buf = BytesIO()
+    Image.new("RGB", (8, 8), (128, 128, 128)).save(buf, "PNG")
+    return buf.getvalue()
+
+
+def preload_assets() -> None:
+    """
+    Loads shared rendering assets without producing a document.
+
+    Covers icon decoding, the compiled templates and their font metrics,
+    fallback coverage bitmaps and the Arabic reshaper tables.
+    """
+    preload_icons()
+    fonts = list(FALLBACK_FONTS)
+    for name in list_templates():
+        t = get_template(name)
+        fonts += [t.font, t.font_bold, t.font_italic, t.value_font]
+    for font in dict.fromkeys(fonts):
+        pdfmetrics.getFont(font)
+        coverage(font)
+    visual("العربية")
+
+
+def warm_up() -> float:
+    """
+    Renders throwaway resumes covering the LTR, RTL, photo and icon paths.
+
+    Returns:
+        float: Elapsed time in seconds.
+    """
+    t0 = time.perf_counter()
+    preload_assets()
+    photo = _sample_photo()
+    build_resume_pdf(**_SAMPLE, projects=_PROJECTS_LTR, photo_bytes=photo, rtl_mode=False)
+    build_resume_pdf(**_SAMPLE, projects=_PROJECTS_RTL, photo_bytes=photo, rtl_mode=True)
+    return time.perf_counter() - t0
@@ -5,25 +5,22 @@ Handles file upload, text parsing, and PDF rendering using the PDF utility modul
 
 from __future__ import annotations
 
+import time
 from typing import Optional
-from fastapi import APIRouter, UploadFile, File, Form
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Request
 from fastapi.responses import Response
 
-from ..pdf_utils import build_resume_pdf
-from ..utils.parsers import (
-    parse_csv_or_lines,
-    normalize_language_level,
-    parse_projects_blocks,
-    parse_education_blocks,
-    parse_sections_text,
-)
+from ..pdf_utils import input_digest
+from ..utils.payload import render_kwargs
+from ..utils.render_pool import produce_pdf, source_headers
+from ..utils.recorder import record_path, record_request
 
 
 router = APIRouter()
 
-
 @router.post("/generate-form")
 async def generate_form(
+    request: Request,
     name: str = Form(""),
     location: str = Form(""),
     phone: str = Form(""),
@@ -38,39 +35,74 @@ async def generate_form(
     skills_text: str = Form(""),
     languages_text: str = Form(""),
     rtl_mode: str = Form("false"),
+    fit_page: str = Form("false"),
+    linearize: str = Form("false"),
+    template: str = Form(""),
+    structured: str = Form(""),
     photo: Optional[UploadFile] = File(None),
 ):
     """
     Accepts form data and returns a generated PDF resume.
 
+    ``structured`` may carry a JSON object with already-parsed fields (see
+    STRUCTURED_KEYS); those replace parsing of the matching text fields.
+
+    A PDF already in the outputs store for the same inputs is served without
+    rendering (``X-Output-Cache: hit``). Otherwise rendering runs on the
+    shared render executor, identical concurrent requests share one render
+    (marked with ``X-Render-Coalesced: 1``), and the result is stored in the
+    background.
+
+    ``linearize=true`` returns a linearized ("fast web view") PDF.
+
     Returns:
         Response: A PDF file as application/pdf.
     """
+    t0 = time.perf_counter()
     photo_bytes: Optional[bytes] = await photo.read() if photo else None
 
-    skills = parse_csv_or_lines(skills_text)
-    languages = [normalize_language_level(x) for x in parse_csv_or_lines(languages_text)]
-    projects = parse_projects_blocks(projects_text)
-    education_items = parse_education_blocks(education_text)
-    sections_left = parse_sections_text(sections_left_text)
-    sections_right = parse_sections_text(sections_right_text)
-
-    pdf = build_resume_pdf(
-        name=name,
-        location=location,
-        phone=phone,
-        email=email,
-        github=github,
-        linkedin=linkedin,
-        birthdate=birthdate,
-        skills=skills,
-        languages=languages,
-        projects=projects,
-        education_items=education_items,
-        photo_bytes=photo_bytes,
-        rtl_mode=(rtl_mode.strip().lower() == "true"),
-        sections_left=sections_left,
-        sections_right=sections_right,
-    )
-
-    return Response(content=pdf, media_type="application/pdf")
\ No newline at end of file
+    fields = {
+        "name": name,
+        "location": location,
+        "phone": phone,
+        "email": email,
+        "github": github,
+        "linkedin": linkedin,
+        "birthdate": birthdate,
+        "projects_text": projects_text,
+        "education_text": education_text,
+        "sections_left_text": sections_left_text,
+        "sections_right_text": sections_right_text,
+        "skills_text": skills_text,
+        "languages_text": languages_text,
+        "rtl_mode": rtl_mode,
+        "fit_page": fit_page,
+        "linearize": linearize,
+        "template": template,
+        "structured": structured,
+    }
+    rec = record_path()
+    if rec:
+        record_request(rec, "/generate-form", fields, photo_bytes)
+
+    t1 = time.perf_counter()
+    try:
+        kwargs = render_kwargs(fields, photo_bytes)
+        key = input_digest(kwargs)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid payload: {e}")
+
+    t2 = time.perf_counter()
+    pdf, source = await produce_pdf(kwargs, key, request.client.host if request.client else None)
+    t3 = time.perf_counter()
+    headers = {
+        "Server-Timing": server_timing(read=t1 - t0, parse=t2 - t1, render=t3 - t2),
+        **source_headers(source),
+    }
+
+    return Response(content=pdf, media_type="application/pdf", headers=headers)
+
+
+def server_timing(**stages: float) -> str:
+    """Formats stage durations (seconds) as a Server-Timing header value in ms."""
+    return ", ".join(f"{name};dur={sec * 1000:.2f}" for name, sec in stages.items())
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""
+Liveness and readiness endpoints for load balancers and orchestrators.
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+
+from ..pdf_utils.bundle import bundle_info
+from ..utils.outputs import get_store
+from ..utils.render_pool import render_stats
+from .preview import preview_stats
+
+
+router = APIRouter()
+
+
+@router.get("/healthz")
+async def healthz():
+    """
+    Liveness probe: the process is up and serving requests.
+
+    Returns:
+        dict: Always {"status": "ok"}.
+    """
+    return {"status": "ok"}
+
+
+@router.get("/readyz")
+async def readyz(request: Request):
+    """
+    Readiness probe: answers 200 only once the startup warm-up has completed.
+
+    Returns:
+        JSONResponse: 200 when ready, 503 while warming up or after a failed warm-up.
+    """
+    state = request.app.state
+    if getattr(state, "ready", False):
+        return {"status": "ready", "warmup_seconds": round(state.warmup_seconds, 3)}
+    body = {"status": "warming_up"}
+    if getattr(state, "warmup_error", None):
+        body = {"status": "failed", "error": state.warmup_error}
+    return JSONResponse(body, status_code=503)
+
+
+@router.get("/stats")
+async def stats():
+    """
+    Render and live-preview counters of the serving process (each pre-forked
+    worker has its own), outputs store totals and the asset bundle in use.
+
+    Returns:
+        dict: {"render": {...}, "preview": {...}, "outputs": {...} | None,
+        "assets": {...}}; render holds the executor settings and the number of
+        renders started, requests coalesced onto them, and renders in flight.
+    """
+    store = get_store()
+    return {
+        "render": render_stats(),
+        "preview": preview_stats(),
+        "outputs": await run_in_threadpool(store.stats) if store else None,
+        "assets": await run_in_threadpool(bundle_info),
+    }
@@ -0,0 +1,35 @@
+"""
+Read access to PDFs in the managed outputs store.
+
+A stored PDF is only reachable through its input hash, which only the
+client that generated it knows; there is deliberately no listing of the
+index, which holds other users' documents and client addresses.
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+
+from ..utils.outputs import get_store
+from ..utils.specs import HASH_RE
+
+
+router = APIRouter()
+
+
+@router.get("/outputs/{h}.pdf")
+async def get_output(h: str):
+    """
+    Serves a stored PDF by input hash, from disk with Range support, so
+    viewers can fetch the first page of a linearized PDF on its own.
+
+    Returns:
+        FileResponse: 200/206 with the PDF, or 404 if it is not (or no longer) stored.
+    """
+    store = get_store()
+    path = await run_in_threadpool(store.locate, h) if store and HASH_RE.match(h) else None
+    if path is None:
+        raise HTTPException(status_code=404, detail="Unknown output")
+    return FileResponse(path, media_type="application/pdf", content_disposition_type="inline")
@@ -0,0 +1,180 @@
+"""
+WebSocket live preview: clients stream form edits, the server renders only
+the newest state once the previous render has finished.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import binascii
+import json
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+
+from ..pdf_utils import input_digest
+from ..utils.payload import render_kwargs
+from ..utils.profiles import merge_patch
+from ..utils.render_pool import produce_pdf
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Process-wide counters, reported by /stats
+_counters = {"connections": 0, "states": 0, "renders": 0, "skipped": 0}
+
+
+class _Session:
+    """Latest form state of one preview connection and its parse caches."""
+
+    def __init__(self, websocket: WebSocket) -> None:
+        self.websocket = websocket
+        self.state: Dict[str, Any] = {}
+        self.rev = 0
+        self.seq: Any = None
+        self.received = 0.0
+        self.rendered_rev = 0
+        self.memo: Dict[str, Tuple[str, Any]] = {}
+        self.photo: Tuple[Optional[str], Optional[bytes]] = (None, None)
+        self.changed = asyncio.Event()
+        self.send_lock = asyncio.Lock()
+
+    def update(self, msg: Dict[str, Any]) -> None:
+        """Applies a ``payload`` (full state) or ``patch`` (JSON merge patch) message."""
+        if isinstance(msg.get("payload"), dict):
+            self.state = dict(msg["payload"])
+        elif isinstance(msg.get("patch"), dict):
+            self.state = merge_patch(self.state, msg["patch"])
+        else:
+            raise ValueError("expected a 'payload' or 'patch' object")
+        self.rev += 1
+        self.seq = msg.get("seq")
+        self.received = time.perf_counter()
+        _counters["states"] += 1
+        self.changed.set()
+
+    def photo_bytes(self, state: Dict[str, Any]) -> Optional[bytes]:
+        """Decodes ``photo_b64`` of ``state``, reusing the last decode."""
+        b64 = state.get("photo_b64") or None
+        if b64 != self.photo[0]:
+            try:
+                data = base64.b64decode(b64, validate=True) if b64 else None
+            except (binascii.Error, ValueError, TypeError) as e:
+                raise ValueError(f"invalid photo_b64: {e}")
+            self.photo = (b64, data)
+        return self.photo[1]
+
+    def parse(self, state: Dict[str, Any]) -> Tuple[dict, str]:
+        """
+        Returns the build_resume_pdf arguments of ``state`` and their input_digest.
+
+        Runs in the thread pool; only the render loop calls it, one state at a
+        time, so the memo and the cached photo need no locking.
+        """
+        kwargs = render_kwargs(state, self.photo_bytes(state), self.memo)
+        return kwargs, input_digest(kwargs)
+
+    async def send(self, meta: Dict[str, Any], pdf: Optional[bytes] = None) -> None:
+        """Sends a JSON frame, followed by the PDF as one binary frame if given."""
+        async with self.send_lock:
+            await self.websocket.send_json(meta)
+            if pdf is not None:
+                await self.websocket.send_bytes(pdf)
+
+
+async def _render_loop(session: _Session, client: Optional[str]) -> None:
+    while True:
+        await session.changed.wait()
+        session.changed.clear()
+        rev, seq, state, received = session.rev, session.seq, session.state, session.received
+        skipped = rev - session.rendered_rev - 1
+        session.rendered_rev = rev
+        _counters["skipped"] += skipped
+
+        t0 = time.perf_counter()
+        try:
+            kwargs, key = await run_in_threadpool(session.parse, state)
+        except ValueError as e:
+            await session.send({"type": "error", "rev": rev, "seq": seq, "detail": f"Invalid payload: {e}"})
+            continue
+        t1 = time.perf_counter()
+        try:
+            pdf, source = await produce_pdf(kwargs, key, client, store=False)
+        except Exception:
+            logger.exception("Preview render failed")
+            await session.send({"type": "error", "rev": rev, "seq": seq, "detail": "Render failed"})
+            continue
+        t2 = time.perf_counter()
+        _counters["renders"] += 1
+        timings = {
+            "queue_ms": round((t0 - received) * 1000, 2),
+            "parse_ms": round((t1 - t0) * 1000, 2),
+            "render_ms": round((t2 - t1) * 1000, 2),
+        }
+        meta = {
+            "type": "pdf",
+            "rev": rev,
+            "seq": seq,
+            "key": key,
+            "source": source,
+            "skipped": skipped,
+            "size": len(pdf),
+            "timings": timings,
+        }
+        await session.send(meta, pdf)
+
+
+@router.websocket("/ws/preview")
+async def preview(websocket: WebSocket):
+    """
+    Live preview channel.
+
+    The client sends JSON text frames, either ``{"payload": {...}}`` with the
+    whole state (saved-profile layout, photo as ``photo_b64``) or
+    ``{"patch": {...}}`` with a JSON merge patch against the previous state;
+    an optional ``seq`` is echoed back. The server keeps only the newest
+    state: while a render runs, further edits replace each other and only
+    the last one is rendered next, so intermediate states are never parsed
+    or rendered. Previews are served from the outputs store when present
+    but never written to it.
+
+    Each render is answered with a JSON frame ``{"type": "pdf", "rev", "seq",
+    "key", "source", "skipped", "size", "timings"}`` followed by the PDF as
+    one binary frame. Invalid messages or payloads get ``{"type": "error",
+    "detail": ...}`` and the connection stays open.
+    """
+    await websocket.accept()
+    session = _Session(websocket)
+    client = websocket.client.host if websocket.client else None
+    _counters["connections"] += 1
+    renderer = asyncio.create_task(_render_loop(session, client))
+    try:
+        while True:
+            text = await websocket.receive_text()
+            try:
+                msg = json.loads(text)
+                if not isinstance(msg, dict):
+                    raise ValueError("expected a JSON object")
+                session.update(msg)
+            except ValueError as e:
+                await session.send({"type": "error", "rev": session.rev, "detail": f"Invalid message: {e}"})
+            if renderer.done():
+                break
+    except WebSocketDisconnect:
+        pass
+    finally:
+        _counters["connections"] -= 1
+        renderer.cancel()
+        try:
+            await renderer
+        except (asyncio.CancelledError, Exception):
+            pass
+
+
+def preview_stats() -> dict:
+    """Returns open preview connections and how many states were received, rendered and skipped."""
+    return dict(_counters)
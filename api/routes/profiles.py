@@ -0,0 +1,138 @@
+"""
+CRUD endpoints for server-side profiles and rendering a profile by id.
+
+Iterative editors create a profile once and then send only JSON merge
+patches (RFC 7396) of the fields that changed. Profiles are not listed;
+the random id returned on creation is what gives access to one.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Body, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response
+
+from ..pdf_utils import input_digest
+from ..utils.profiles import VersionConflict, get_profiles
+from ..utils.render_pool import produce_pdf, source_headers
+
+router = APIRouter()
+
+
+def _not_found() -> HTTPException:
+    return HTTPException(status_code=404, detail="Unknown profile")
+
+
+def _invalid(e: ValueError) -> HTTPException:
+    return HTTPException(status_code=422, detail=f"Invalid profile: {e}")
+
+
+def _conflict(e: VersionConflict) -> HTTPException:
+    return HTTPException(status_code=409, detail=f"Profile changed concurrently: {e}")
+
+
+def _render_args(pid: str, patch: Optional[Dict[str, Any]], save: bool):
+    """Returns (version, kwargs, input digest) for a profile render, or None if it does not exist."""
+    res = get_profiles().render_args(pid, patch, save=save)
+    if res is None:
+        return None
+    version, kwargs = res
+    return version, kwargs, input_digest(kwargs)
+
+
+@router.post("/profiles", status_code=201)
+async def create_profile(payload: Dict[str, Any] = Body(...)):
+    """
+    Stores a new profile (saved-profile layout, photo as ``photo_b64``).
+
+    Returns:
+        JSONResponse: ``{"id": ..., "version": 1}`` with a Location header.
+    """
+    try:
+        pid, version = await run_in_threadpool(get_profiles().create, payload)
+    except ValueError as e:
+        raise _invalid(e)
+    return JSONResponse({"id": pid, "version": version}, status_code=201, headers={"Location": f"/profiles/{pid}"})
+
+
+@router.get("/profiles/{pid}")
+async def get_profile(pid: str):
+    """
+    Returns a profile.
+
+    Returns:
+        dict: ``{"id": ..., "version": ..., "profile": {...}}``.
+    """
+    out = await run_in_threadpool(get_profiles().get, pid)
+    if out is None:
+        raise _not_found()
+    return out
+
+
+@router.put("/profiles/{pid}")
+async def replace_profile(pid: str, payload: Dict[str, Any] = Body(...)):
+    """Replaces a profile and returns its new version."""
+    try:
+        version = await run_in_threadpool(get_profiles().replace, pid, payload)
+    except ValueError as e:
+        raise _invalid(e)
+    if version is None:
+        raise _not_found()
+    return {"id": pid, "version": version}
+
+
+@router.patch("/profiles/{pid}")
+async def patch_profile(pid: str, patch: Dict[str, Any] = Body(...)):
+    """Applies a JSON merge patch to a profile and returns its new version (409 on a concurrent write)."""
+    try:
+        version = await run_in_threadpool(get_profiles().patch, pid, patch)
+    except ValueError as e:
+        raise _invalid(e)
+    except VersionConflict as e:
+        raise _conflict(e)
+    if version is None:
+        raise _not_found()
+    return {"id": pid, "version": version}
+
+
+@router.delete("/profiles/{pid}", status_code=204)
+async def delete_profile(pid: str):
+    """Deletes a profile."""
+    if not await run_in_threadpool(get_profiles().delete, pid):
+        raise _not_found()
+    return Response(status_code=204)
+
+
+@router.post("/profiles/{pid}/generate")
+async def generate_profile(
+    pid: str,
+    request: Request,
+    patch: Optional[Dict[str, Any]] = Body(None),
+    save: bool = Query(True),
+):
+    """
+    Renders a profile with an optional JSON merge patch applied.
+
+    Only the text fields the patch changes are parsed again; the stored
+    photo is reused. With ``save=true`` (default) the patched profile is
+    stored as a new version, so the next patch can be relative to it; a
+    write by another client in between gives 409. Output-store hits and
+    render coalescing work as in /generate-form.
+
+    Returns:
+        Response: The PDF, with the profile version in ``X-Profile-Version``.
+    """
+    try:
+        res = await run_in_threadpool(_render_args, pid, patch, save)
+    except ValueError as e:
+        raise _invalid(e)
+    except VersionConflict as e:
+        raise _conflict(e)
+    if res is None:
+        raise _not_found()
+    version, kwargs, key = res
+    pdf, source = await produce_pdf(kwargs, key, request.client.host if request.client else None)
+    headers = {"X-Profile-Version": str(version), **source_headers(source)}
+    return Response(content=pdf, media_type="application/pdf", headers=headers)
@@ -0,0 +1,89 @@
+"""
+Content-addressed resume URLs.
+
+A spec is registered once with POST /resume and is then available at
+GET /resume/{hash}.pdf, which is immutable and cacheable by browsers,
+proxies and CDNs (strong ETag, conditional requests, byte ranges).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, Body, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, JSONResponse, Response
+
+from ..utils.specs import HASH_RE, ensure_pdf, register_spec, spec_exists
+
+router = APIRouter()
+
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against ``etag`` (RFC 9110)."""
+    value = if_none_match.strip()
+    if value == "*":
+        return True
+    tags = (t.strip() for t in value.split(","))
+    return any((t[2:] if t.startswith("W/") else t) == etag for t in tags)
+
+
+@router.post("/resume", status_code=201)
+async def register_resume(payload: Dict[str, Any] = Body(...)):
+    """
+    Registers a resume spec and returns its content hash and PDF URL.
+
+    The body uses the saved-profile or form-field layout (photo as ``photo_b64``).
+
+    Returns:
+        JSONResponse: ``{"hash": ..., "url": "/resume/<hash>.pdf"}``.
+    """
+    try:
+        h = await run_in_threadpool(register_spec, payload)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid resume spec: {e}")
+    url = f"/resume/{h}.pdf"
+    return JSONResponse({"hash": h, "url": url}, status_code=201, headers={"Location": url})
+
+
+@router.api_route("/resume/{h}.pdf", methods=["GET", "HEAD"])
+async def get_resume(h: str, request: Request):
+    """
+    Serves the PDF for a registered spec.
+
+    A matching If-None-Match for a registered spec is answered with 304
+    without rendering; otherwise the deterministic PDF is rendered once (on
+    the render executor, shared by concurrent requests) and served from disk
+    with Range support.
+
+    Returns:
+        Response: 200/206 with the PDF, 304, 404 for unknown hashes, or 410
+        for specs that cannot be rendered as registered (the renderer
+        changed before the PDF was cached).
+    """
+    if not HASH_RE.match(h):
+        raise HTTPException(status_code=404, detail="Unknown resume")
+    etag = f'"{h}"'
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+    inm = request.headers.get("if-none-match")
+    if inm and etag_matches(inm, etag):
+        if not await run_in_threadpool(spec_exists, h):
+            raise HTTPException(status_code=404, detail="Unknown resume")
+        return Response(status_code=304, headers=headers)
+
+    try:
+        path = await ensure_pdf(h)
+    except ValueError as e:
+        raise HTTPException(status_code=410, detail=f"Resume can no longer be rendered: {e}")
+    if path is None:
+        raise HTTPException(status_code=404, detail="Unknown resume")
+    return FileResponse(
+        path,
+        media_type="application/pdf",
+        headers=headers,
+        filename=f"{h[:12]}.pdf",
+        content_disposition_type="inline",
+    )
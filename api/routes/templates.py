@@ -0,0 +1,23 @@
+"""
+Lists the resume templates a request can select.
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter
+
+from ..pdf_utils.templates import DEFAULT_TEMPLATE, list_templates
+
+
+router = APIRouter()
+
+
+@router.get("/templates")
+async def templates():
+    """
+    Returns the registered template names.
+
+    Returns:
+        dict: {"default": ..., "templates": [...]}, default first.
+    """
+    return {"default": DEFAULT_TEMPLATE, "templates": list_templates()}
@@ -0,0 +1,275 @@
+"""
+Pre-forking production server for the resume API.
+
+The master process imports the app and loads every rendering asset once,
+then forks workers that share those pages copy-on-write. Workers are
+recycled after a number of requests and can be replaced gracefully with
+SIGHUP; SIGTERM/SIGINT shut everything down.
+
+SIGHUP forks the new workers from the master as it is, so they start with
+fresh memory but run the code and assets preloaded at startup. To deploy
+new code, restart the ``serve`` process itself.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import logging
+import os
+import random
+import signal
+import socket
+import time
+from typing import Dict
+
+import uvicorn
+
+logger = logging.getLogger(__name__)
+
+# Seconds a stopping worker waits between closing its listener and closing
+# idle connections, so requests on connections it has just accepted are read.
+ACCEPT_DRAIN = 0.5
+
+
+def _bind(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """Creates the listening socket shared by all workers."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+class _WorkerServer(uvicorn.Server):
+    """
+    uvicorn server that drains freshly accepted connections on shutdown.
+
+    uvicorn closes every connection without a request in progress right after
+    it stops accepting. With a listener shared by several workers, a worker
+    that is recycled or reloaded may just have accepted a connection whose
+    request has not been read yet; that client would see a reset.
+    """
+
+    async def shutdown(self, sockets=None) -> None:
+        for server in self.servers:
+            server.close()
+        await asyncio.sleep(ACCEPT_DRAIN)
+        await super().shutdown(sockets)
+
+
+class Arbiter:
+    """
+    Supervises a fixed-size set of forked uvicorn workers.
+
+    Args:
+        app: The ASGI application, already imported in the master.
+        sock (socket.socket): Bound listening socket.
+        workers (int): Number of worker processes.
+        max_requests (int): Requests served before a worker is recycled (0 = never).
+        max_requests_jitter (int): Random extra requests to stagger recycling.
+        graceful_timeout (float): Seconds to wait for workers on stop/reload.
+        log_level (str): uvicorn log level for workers.
+    """
+
+    def __init__(
+        self,
+        app,
+        sock: socket.socket,
+        *,
+        workers: int = 2,
+        max_requests: int = 0,
+        max_requests_jitter: int = 0,
+        graceful_timeout: float = 30.0,
+        log_level: str = "info",
+    ) -> None:
+        self.app = app
+        self.sock = sock
+        self.workers = max(1, workers)
+        self.max_requests = max(0, max_requests)
+        self.max_requests_jitter = max(0, max_requests_jitter)
+        self.graceful_timeout = graceful_timeout
+        self.log_level = log_level
+        self.generation = 0
+        self.children: Dict[int, int] = {}  # pid -> generation
+        self.retiring: Dict[int, float] = {}  # generation -> SIGKILL deadline
+        self._stop = False
+        self._reload = False
+
+    # ---------- master ----------
+
+    def run(self) -> None:
+        """Runs the supervision loop until SIGTERM/SIGINT."""
+        signal.signal(signal.SIGTERM, self._on_stop)
+        signal.signal(signal.SIGINT, self._on_stop)
+        signal.signal(signal.SIGHUP, self._on_reload)
+
+        self._spawn_missing()
+        while not self._stop:
+            if self._reload:
+                self._reload = False
+                self._do_reload()
+            self._reap()
+            self._kill_overdue()
+            self._spawn_missing()
+            time.sleep(0.2)
+        self._shutdown()
+
+    def _on_stop(self, signum, frame) -> None:
+        self._stop = True
+
+    def _on_reload(self, signum, frame) -> None:
+        self._reload = True
+
+    def _spawn_missing(self) -> None:
+        alive = sum(1 for gen in self.children.values() if gen == self.generation)
+        for _ in range(self.workers - alive):
+            self._spawn()
+
+    def _spawn(self) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                self._run_worker()
+            except BaseException:
+                logger.exception("Worker crashed")
+                code = 1
+            finally:
+                os._exit(code)
+        self.children[pid] = self.generation
+        logger.info("Started worker %d (generation %d)", pid, self.generation)
+
+    def _reap(self) -> None:
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            gen = self.children.pop(pid, None)
+            if gen is not None:
+                logger.info("Worker %d exited with status %d", pid, os.waitstatus_to_exitcode(status))
+
+    def _signal_all(self, sig: int, generation: int | None = None) -> None:
+        for pid, gen in list(self.children.items()):
+            if generation is None or gen == generation:
+                try:
+                    os.kill(pid, sig)
+                except ProcessLookupError:
+                    self.children.pop(pid, None)
+
+    def _wait(self, generation: int | None, deadline: float) -> None:
+        def pending() -> bool:
+            return any(generation is None or g == generation for g in self.children.values())
+
+        while pending() and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.1)
+        if pending():
+            self._signal_all(signal.SIGKILL, generation)
+            while pending():
+                self._reap()
+                time.sleep(0.05)
+
+    def _do_reload(self) -> None:
+        """
+        Starts a fresh set of workers, then asks the previous generation to stop.
+
+        Does not wait for the old workers: the supervision loop keeps reaping
+        and replacing workers meanwhile, and _kill_overdue() kills those still
+        running after graceful_timeout. New workers are forked from this
+        process, so they run the code loaded at startup (see module docstring).
+        """
+        old = self.generation
+        self.generation += 1
+        logger.info("Reloading: generation %d -> %d", old, self.generation)
+        self._spawn_missing()
+        self._signal_all(signal.SIGTERM, old)
+        self.retiring[old] = time.monotonic() + self.graceful_timeout
+
+    def _kill_overdue(self) -> None:
+        """Kills workers of retired generations that outlived their graceful timeout."""
+        now = time.monotonic()
+        for gen, deadline in list(self.retiring.items()):
+            if not any(g == gen for g in self.children.values()):
+                del self.retiring[gen]
+            elif now >= deadline:
+                logger.warning("Killing workers of generation %d after %.0fs", gen, self.graceful_timeout)
+                self._signal_all(signal.SIGKILL, gen)
+                del self.retiring[gen]
+
+    def _shutdown(self) -> None:
+        logger.info("Shutting down %d workers", len(self.children))
+        self._signal_all(signal.SIGTERM)
+        self._wait(None, time.monotonic() + self.graceful_timeout)
+        self.sock.close()
+
+    # ---------- worker ----------
+
+    def _run_worker(self) -> None:
+        for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+            signal.signal(sig, signal.SIG_DFL)
+        random.seed()
+        limit = None
+        if self.max_requests:
+            limit = self.max_requests + random.randint(0, self.max_requests_jitter)
+        config = uvicorn.Config(
+            self.app,
+            lifespan="on",
+            log_level=self.log_level,
+            limit_max_requests=limit,
+            timeout_graceful_shutdown=int(self.graceful_timeout),
+        )
+        _WorkerServer(config).run(sockets=[self.sock])
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    *,
+    workers: int = 2,
+    max_requests: int = 0,
+    max_requests_jitter: int = 0,
+    graceful_timeout: float = 30.0,
+    log_level: str = "info",
+) -> None:
+    """
+    Preloads the app and its rendering assets, then runs pre-forked workers.
+
+    Args:
+        host (str): Interface to bind.
+        port (int): TCP port to bind.
+        workers (int): Number of worker processes.
+        max_requests (int): Recycle a worker after this many requests (0 = never).
+        max_requests_jitter (int): Random extra requests per worker before recycling.
+        graceful_timeout (float): Seconds to wait for in-flight requests on stop/reload.
+        log_level (str): Log level for master and workers.
+    """
+    logging.basicConfig(level=log_level.upper(), format="%(asctime)s %(process)d %(levelname)s %(message)s")
+
+    from .main import app
+    from .pdf_utils import warm_up
+
+    logger.info("Preloaded assets in %.3fs", warm_up())
+    # Workers inherit the warmed state and can report ready immediately.
+    os.environ["API_WARMUP"] = "0"
+    # Move everything loaded so far out of the collector's reach so that
+    # garbage collection in workers does not touch (and copy) shared pages.
+    gc.collect()
+    gc.freeze()
+
+    sock = _bind(host, port)
+    logger.info("Listening on %s:%d with %d workers", host, port, workers)
+    Arbiter(
+        app,
+        sock,
+        workers=workers,
+        max_requests=max_requests,
+        max_requests_jitter=max_requests_jitter,
+        graceful_timeout=graceful_timeout,
+        log_level=log_level,
+    ).run()
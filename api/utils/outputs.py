@@ -0,0 +1,191 @@
+"""
+Managed store of generated PDFs.
+
+PDFs are written off the request path into OUTPUTS_DIR, sharded by input
+hash (input_digest), and recorded in a small SQLite index: client, time,
+size and render time. Entries expire by age and by total size, least
+recently used first. A stored PDF is served again without re-rendering.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+OUTPUTS_DIR = Path(os.getenv("API_OUTPUTS_DIR") or Path(__file__).resolve().parents[2] / "outputs")
+OUTPUTS_ENABLED = os.getenv("API_OUTPUTS", "1").strip().lower() not in ("0", "false", "no")
+OUTPUTS_MAX_BYTES = int(os.getenv("API_OUTPUTS_MAX_BYTES", str(256 * 1024 * 1024)))
+OUTPUTS_MAX_AGE = float(os.getenv("API_OUTPUTS_MAX_AGE_DAYS", "30")) * 86400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outputs (
+    hash TEXT PRIMARY KEY,
+    client TEXT,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    size INTEGER NOT NULL,
+    render_ms REAL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS outputs_accessed ON outputs (accessed);
+"""
+
+
+class OutputStore:
+    """
+    Content-addressed PDF store with an SQLite index.
+
+    Writes, index updates and eviction run on one background thread; lookups
+    read the sharded file directly. Safe to share between pre-forked workers
+    (atomic file renames, SQLite in WAL mode).
+
+    Args:
+        root (Path): Directory holding the shards and ``index.sqlite3``.
+        max_bytes (int): Total PDF size to keep (0 = unlimited).
+        max_age (float): Seconds since last access before an entry expires (0 = never).
+    """
+
+    def __init__(self, root: Path, max_bytes: int = OUTPUTS_MAX_BYTES, max_age: float = OUTPUTS_MAX_AGE):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._local = threading.local()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="outputs")
+
+    def path(self, h: str) -> Path:
+        """Returns where the PDF for input hash ``h`` is stored."""
+        return self.root / h[:2] / f"{h}.pdf"
+
+    def _db(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.root / "index.sqlite3", timeout=5.0, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(_SCHEMA)
+            self._local.db = db
+        return db
+
+    def lookup(self, h: str) -> Optional[bytes]:
+        """
+        Returns the stored PDF for ``h``, or None.
+
+        A hit refreshes the entry's access time in the background.
+        """
+        try:
+            data = self.path(h).read_bytes()
+        except OSError:
+            return None
+        self._writer.submit(self._touch, h, time.time())
+        return data
+
+    def locate(self, h: str) -> Optional[Path]:
+        """
+        Returns the stored file for ``h``, or None; for serving it straight from disk.
+
+        A hit refreshes the entry's access time in the background.
+        """
+        path = self.path(h)
+        if not path.is_file():
+            return None
+        self._writer.submit(self._touch, h, time.time())
+        return path
+
+    def save(self, h: str, pdf: bytes, client: Optional[str] = None, render_ms: Optional[float] = None) -> Future:
+        """
+        Schedules storing ``pdf`` under ``h`` and returns immediately.
+
+        Returns:
+            Future: Completes once the file and index entry are written.
+        """
+        return self._writer.submit(self._save, h, pdf, client, render_ms, time.time())
+
+    def _save(self, h: str, pdf: bytes, client: Optional[str], render_ms: Optional[float], now: float) -> None:
+        out = self.path(h)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=out.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(pdf)
+            os.replace(tmp, out)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        self._db().execute(
+            "INSERT INTO outputs (hash, client, created, accessed, size, render_ms) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (hash) DO UPDATE SET accessed = excluded.accessed, size = excluded.size",
+            (h, client, now, now, len(pdf), render_ms),
+        )
+        self._evict(now)
+
+    def _touch(self, h: str, now: float) -> None:
+        self._db().execute("UPDATE outputs SET accessed = ?, hits = hits + 1 WHERE hash = ?", (now, h))
+
+    def _evict(self, now: float) -> int:
+        db = self._db()
+        doomed: List[str] = []
+        if self.max_age:
+            doomed += [r[0] for r in db.execute("SELECT hash FROM outputs WHERE accessed < ?", (now - self.max_age,))]
+        if self.max_bytes:
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM outputs").fetchone()[0]
+            if total > self.max_bytes:
+                for h, size in db.execute("SELECT hash, size FROM outputs ORDER BY accessed"):
+                    if total <= self.max_bytes:
+                        break
+                    if h not in doomed:
+                        doomed.append(h)
+                        total -= size
+        for h in doomed:
+            try:
+                self.path(h).unlink()
+            except FileNotFoundError:
+                pass
+            db.execute("DELETE FROM outputs WHERE hash = ?", (h,))
+        return len(doomed)
+
+    def evict(self) -> int:
+        """Applies the age and size limits now; returns the number of entries removed."""
+        return self._writer.submit(self._evict, time.time()).result()
+
+    def stats(self) -> dict:
+        """Returns the entry count, total size and configured limits."""
+        count, total = self._db().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM outputs").fetchone()
+        return {"count": count, "bytes": total, "max_bytes": self.max_bytes, "max_age": self.max_age}
+
+    def close(self) -> None:
+        """Waits for pending writes and stops the writer thread."""
+        self._writer.shutdown(wait=True)
+
+
+_store: Optional[OutputStore] = None
+_lock = threading.Lock()
+
+
+def get_store() -> Optional[OutputStore]:
+    """Returns the process-wide store (created on first use), or None when disabled via API_OUTPUTS=0."""
+    global _store
+    if not OUTPUTS_ENABLED:
+        return None
+    with _lock:
+        if _store is None:
+            _store = OutputStore(OUTPUTS_DIR)
+        return _store
+
+
+def close_store() -> None:
+    """Flushes and closes the process-wide store, if it was used."""
+    global _store
+    with _lock:
+        store, _store = _store, None
+    if store is not None:
+        store.close()
@@ -7,6 +7,18 @@ from __future__ import annotations
 from typing import Optional, List, Tuple
 import re
 
+from .tokenizer import LINK, TITLE, parse_document, tokenize
+
+CEFR_LEVELS = {
+    "a1": "Grundkenntnisse",
+    "a2": "Grundkenntnisse",
+    "b1": "Gute Kenntnisse",
+    "b2": "Gute Kenntnisse",
+    "c1": "Sehr gute Kenntnisse",
+    "c2": "Verhandlungssicher",
+}
+_LANG_LEVEL_RE = re.compile(r"(?i)^(.+?)\s*[-\u2013:]\s*([abc][12])\b")
+
 
 def parse_csv_or_lines(txt: str) -> List[str]:
     """
@@ -18,14 +30,7 @@ def parse_csv_or_lines(txt: str) -> List[str]:
     Returns:
         List[str]: Cleaned list of values.
     """
-    if not txt:
-        return []
-    parts: List[str] = []
-    for line in txt.replace(",", "\n").splitlines():
-        s = line.strip()
-        if s:
-            parts.append(s)
-    return parts
+    return [tok.text for tok in tokenize((txt or "").replace(",", "\n")) if tok.text]
 
 
 def normalize_language_level(label: str) -> str:
@@ -39,19 +44,11 @@ def normalize_language_level(label: str) -> str:
         str: Reformatted string like 'Deutsch – Gute Kenntnisse'.
     """
     s = (label or "").strip()
-    mapping = {
-        "a1": "Grundkenntnisse",
-        "a2": "Grundkenntnisse",
-        "b1": "Gute Kenntnisse",
-        "b2": "Gute Kenntnisse",
-        "c1": "Sehr gute Kenntnisse",
-        "c2": "Verhandlungssicher",
-    }
-    m = re.search(r"(?i)^(.+?)\s*[-\u2013:]\s*([abc][12])\b", s)
+    m = _LANG_LEVEL_RE.search(s)
     if m:
         lang = m.group(1).strip()
         lvl = m.group(2).lower()
-        return f"{lang} – {mapping.get(lvl, m.group(2))}"
+        return f"{lang} – {CEFR_LEVELS.get(lvl, m.group(2))}"
     return s
 
 
@@ -71,22 +68,17 @@ def parse_sections(text: str) -> List[dict]:
         List[dict]: List of sections with 'title' and 'lines'.
     """
     sections: List[dict] = []
-    cur = {"title": "", "lines": []}
-    for raw in (text or "").splitlines():
-        line = raw.strip()
-        if not line:
-            if cur["title"] and cur["lines"]:
-                sections.append(cur)
-            cur = {"title": "", "lines": []}
-            continue
-        if line.startswith("[") and line.endswith("]"):
-            if cur["title"] and cur["lines"]:
-                sections.append(cur)
-            cur = {"title": line.strip("[]").strip(), "lines": []}
-        elif line.startswith("-"):
-            cur["lines"].append(line[1:].strip())
-    if cur["title"] and cur["lines"]:
-        sections.append(cur)
+    for block in parse_document(text).blocks:
+        cur = {"title": "", "lines": []}
+        for tok in block.tokens:
+            if tok.kind == TITLE:
+                if cur["title"] and cur["lines"]:
+                    sections.append(cur)
+                cur = {"title": tok.text.strip("[]").strip(), "lines": []}
+            elif tok.text.startswith("-"):
+                cur["lines"].append(tok.value)
+        if cur["title"] and cur["lines"]:
+            sections.append(cur)
     return sections
 
 
@@ -100,12 +92,7 @@ def parse_simple_list(txt: str) -> List[str]:
     Returns:
         List[str]: Cleaned list.
     """
-    out: List[str] = []
-    for line in (txt or "").splitlines():
-        s = line.strip()
-        if s:
-            out.append(s)
-    return out
+    return [tok.text for tok in tokenize(txt) if tok.text]
 
 
 def parse_projects_blocks(txt: str) -> List[Tuple[str, str, Optional[str]]]:
@@ -116,27 +103,16 @@ def parse_projects_blocks(txt: str) -> List[Tuple[str, str, Optional[str]]]:
         List[Tuple[str, str, Optional[str]]]: Title, description, and optional link.
     """
     blocks: List[Tuple[str, str, Optional[str]]] = []
-    cur_title, cur_desc, cur_link = "", [], None
-
-    def flush():
-        nonlocal cur_title, cur_desc, cur_link
-        if cur_title or cur_desc or cur_link:
-            blocks.append((cur_title.strip(), "\n".join(cur_desc).strip(), cur_link))
-        cur_title, cur_desc, cur_link = "", [], None
-
-    for raw in (txt or "").splitlines():
-        line = raw.strip()
-        if not line:
-            flush()
-            continue
-        if not cur_title:
-            cur_title = line
-        elif line.startswith("http://") or line.startswith("https://"):
-            cur_link = line
-        else:
-            cur_desc.append(line)
-
-    flush()
+    for block in parse_document(txt).blocks:
+        head, *rest = block.tokens
+        desc: List[str] = []
+        link: Optional[str] = None
+        for tok in rest:
+            if tok.kind == LINK:
+                link = tok.text
+            else:
+                desc.append(tok.text)
+        blocks.append((head.text, "\n".join(desc).strip(), link))
     return blocks
 
 
@@ -148,31 +124,10 @@ def parse_sections_text(txt: str) -> List[dict]:
         List[dict]: Sections with title and associated lines.
     """
     sections: List[dict] = []
-    title: Optional[str] = None
-    lines: List[str] = []
-
-    def flush():
-        nonlocal title, lines
-        if title and lines:
-            sections.append({"title": title, "lines": lines[:]})
-        title, lines = None, []
-
-    for raw in (txt or "").splitlines():
-        s = raw.strip()
-        if not s:
-            flush()
-            continue
-        if s.startswith("[") and s.endswith("]"):
-            flush()
-            title = s[1:-1].strip()
-        elif s[:1] in "-•–":
-            lines.append(s[1:].strip())
-        else:
-            if lines:
-                lines[-1] += " " + s
-            else:
-                title = title or s
-    flush()
+    for block in parse_document(txt).blocks:
+        for sec in block.sections:
+            if sec.title and sec.items:
+                sections.append({"title": sec.title, "lines": [it.text for it in sec.items]})
     return sections
 
 
@@ -183,16 +138,163 @@ def parse_education_blocks(txt: str) -> List[str]:
     Returns:
         List[str]: List of education blocks preserving internal lines.
     """
-    blocks: List[str] = []
-    cur: List[str] = []
-    for raw in (txt or "").splitlines():
-        ln = raw.rstrip()
-        if not ln.strip():
-            if cur:
-                blocks.append("\n".join(cur))
-                cur = []
-        else:
-            cur.append(ln)
-    if cur:
-        blocks.append("\n".join(cur))
-    return blocks
+    return ["\n".join(tok.raw for tok in block.tokens) for block in parse_document(txt).blocks]
+
+
+STRUCTURED_KEYS = (
+    "skills",
+    "languages",
+    "projects",
+    "education_items",
+    "sections_left",
+    "sections_right",
+)
+
+
+def parse_languages(txt: str) -> List[str]:
+    """Parses languages like parse_csv_or_lines and normalizes CEFR levels."""
+    return [normalize_language_level(x) for x in parse_csv_or_lines(txt)]
+
+
+# STRUCTURED_KEYS entry -> parser of its free-text form field
+TEXT_PARSERS = {
+    "skills": parse_csv_or_lines,
+    "languages": parse_languages,
+    "projects": parse_projects_blocks,
+    "education_items": parse_education_blocks,
+    "sections_left": parse_sections_text,
+    "sections_right": parse_sections_text,
+}
+
+
+def parse_form_texts(
+    *,
+    skills_text: str = "",
+    languages_text: str = "",
+    projects_text: str = "",
+    education_text: str = "",
+    sections_left_text: str = "",
+    sections_right_text: str = "",
+) -> dict:
+    """
+    Parses all free-text form fields into the structure used by the renderer.
+
+    Shared by the API and the Streamlit frontend so both sides agree on the result.
+
+    Returns:
+        dict: Keys from STRUCTURED_KEYS, ready to pass to build_resume_pdf.
+    """
+    return {
+        "skills": TEXT_PARSERS["skills"](skills_text),
+        "languages": TEXT_PARSERS["languages"](languages_text),
+        "projects": TEXT_PARSERS["projects"](projects_text),
+        "education_items": TEXT_PARSERS["education_items"](education_text),
+        "sections_left": TEXT_PARSERS["sections_left"](sections_left_text),
+        "sections_right": TEXT_PARSERS["sections_right"](sections_right_text),
+    }
+
+
+def coerce_structured(data: object) -> dict:
+    """
+    Validates a pre-parsed structure received from a client.
+
+    Args:
+        data (object): Decoded JSON; may contain any subset of STRUCTURED_KEYS.
+
+    Returns:
+        dict: Only the keys that were present, normalized to renderer types.
+
+    Raises:
+        ValueError: If the structure has an unexpected shape.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("structured payload must be an object")
+
+    def str_list(key: str) -> List[str]:
+        v = data[key]
+        if not isinstance(v, list) or not all(isinstance(x, str) for x in v):
+            raise ValueError(f"'{key}' must be a list of strings")
+        return v
+
+    def sections(key: str) -> List[dict]:
+        v = data[key]
+        if not isinstance(v, list):
+            raise ValueError(f"'{key}' must be a list of sections")
+        out: List[dict] = []
+        for sec in v:
+            if not isinstance(sec, dict) or not isinstance(sec.get("title", ""), str):
+                raise ValueError(f"'{key}' entries must have a string 'title'")
+            lines = sec.get("lines", [])
+            if not isinstance(lines, list) or not all(isinstance(x, str) for x in lines):
+                raise ValueError(f"'{key}' entries must have a list of string 'lines'")
+            out.append({"title": sec.get("title", ""), "lines": lines})
+        return out
+
+    def projects() -> List[Tuple[str, str, Optional[str]]]:
+        v = data["projects"]
+        if not isinstance(v, list):
+            raise ValueError("'projects' must be a list")
+        out: List[Tuple[str, str, Optional[str]]] = []
+        for p in v:
+            if not isinstance(p, (list, tuple)) or len(p) != 3:
+                raise ValueError("'projects' entries must be [title, description, link]")
+            title, desc, link = p
+            if not isinstance(title, str) or not isinstance(desc, str) or not isinstance(link, (str, type(None))):
+                raise ValueError("'projects' entries must be [title, description, link]")
+            out.append((title, desc, link))
+        return out
+
+    out: dict = {}
+    if "skills" in data:
+        out["skills"] = str_list("skills")
+    if "languages" in data:
+        out["languages"] = str_list("languages")
+    if "projects" in data:
+        out["projects"] = projects()
+    if "education_items" in data:
+        out["education_items"] = str_list("education_items")
+    if "sections_left" in data:
+        out["sections_left"] = sections("sections_left")
+    if "sections_right" in data:
+        out["sections_right"] = sections("sections_right")
+    return out
+
+
+def lint_sections_text(txt: str) -> List[str]:
+    """
+    Reports lines of a ``[Title]`` / ``- item`` block that will not be rendered.
+
+    Returns:
+        List[str]: Human-readable warnings, one per problem.
+    """
+    warnings: List[str] = []
+    for block in parse_document(txt).blocks:
+        for tok in block.tokens:
+            if tok.kind != TITLE and tok.text.startswith("[") and not tok.text.endswith("]"):
+                warnings.append(f"Line {tok.lineno}: title is missing a closing ']'.")
+        for sec in block.sections:
+            if not sec.title:
+                warnings.append(f"Line {sec.lineno}: items without a [Title] are skipped.")
+            elif not sec.items:
+                warnings.append(f"Line {sec.lineno}: section '{sec.title}' has no '- item' lines and is skipped.")
+    return warnings
+
+
+def lint_projects_text(txt: str) -> List[str]:
+    """
+    Reports suspicious project blocks (missing description, several links, ...).
+
+    Returns:
+        List[str]: Human-readable warnings, one per problem.
+    """
+    warnings: List[str] = []
+    for block in parse_document(txt).blocks:
+        head, *rest = block.tokens
+        links = [tok for tok in rest if tok.kind == LINK]
+        if head.kind == LINK:
+            warnings.append(f"Line {head.lineno}: project title looks like a link; the first line is the title.")
+        if len(links) > 1:
+            warnings.append(f"Line {head.lineno}: project '{head.text}' has several links; only the last is used.")
+        if len(rest) == len(links):
+            warnings.append(f"Line {head.lineno}: project '{head.text}' has no description.")
+    return warnings
@@ -0,0 +1,109 @@
+"""
+Conversion of resume payloads (form fields or saved profiles) into
+keyword arguments for build_resume_pdf.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Any, Mapping, MutableMapping, Optional, Tuple
+
+from ..pdf_utils.templates import DEFAULT_TEMPLATE, get_template
+from .parsers import STRUCTURED_KEYS, TEXT_PARSERS, coerce_structured
+
+# Free-text field (and list-valued aliases) behind each structured key
+TEXT_SOURCES = {
+    "skills": ("skills_text", "skills"),
+    "languages": ("languages_text", "languages"),
+    "projects": ("projects_text",),
+    "education_items": ("education_text",),
+    "sections_left": ("sections_left_text",),
+    "sections_right": ("sections_right_text",),
+}
+
+TEXT_FIELDS = ("name", "location", "phone", "email", "github", "linkedin", "birthdate")
+
+
+def _as_text(v: Any) -> str:
+    """Joins list values line by line so they go through the regular parser."""
+    if isinstance(v, (list, tuple)):
+        return "\n".join(str(x) for x in v)
+    return str(v or "")
+
+
+def _as_bool(v: Any) -> bool:
+    if isinstance(v, str):
+        return v.strip().lower() == "true"
+    return bool(v)
+
+
+def render_kwargs(
+    payload: Mapping[str, Any],
+    photo_bytes: Optional[bytes] = None,
+    memo: Optional[MutableMapping[str, Tuple[str, Any]]] = None,
+) -> dict:
+    """
+    Builds build_resume_pdf keyword arguments from a payload.
+
+    Accepts both the form-field layout (``skills_text``, ``languages_text``)
+    and the saved-profile layout (``skills``/``languages`` lists, ``photo_b64``),
+    plus an optional pre-parsed ``structured`` object or JSON string.
+    ``template`` selects a registered template by name.
+
+    Args:
+        payload (Mapping[str, Any]): Form fields or a saved profile.
+        photo_bytes (Optional[bytes]): Photo data; overrides ``photo_b64``.
+        memo (Optional[MutableMapping]): Per-key ``(text, parsed)`` results of an
+            earlier call; fields whose text is unchanged are not parsed again.
+            Updated in place.
+
+    Returns:
+        dict: Keyword arguments for build_resume_pdf.
+
+    Raises:
+        ValueError: If ``structured`` or ``photo_b64`` is malformed, or the
+            template is unknown.
+    """
+    pre: dict = {}
+    structured = payload.get("structured")
+    if isinstance(structured, str):
+        structured = json.loads(structured) if structured.strip() else None
+    if structured:
+        pre = coerce_structured(structured)
+
+    def text(key: str, *aliases: str) -> str:
+        for k in (key, *aliases):
+            if payload.get(k):
+                return _as_text(payload[k])
+        return ""
+
+    parsed: dict = {}
+    for key in STRUCTURED_KEYS:
+        if key in pre:
+            parsed[key] = pre[key]
+            continue
+        src = text(*TEXT_SOURCES[key])
+        hit = memo.get(key) if memo is not None else None
+        if hit is not None and hit[0] == src:
+            parsed[key] = hit[1]
+            continue
+        parsed[key] = TEXT_PARSERS[key](src)
+        if memo is not None:
+            memo[key] = (src, parsed[key])
+
+    if photo_bytes is None and payload.get("photo_b64"):
+        try:
+            photo_bytes = base64.b64decode(payload["photo_b64"], validate=True)
+        except (binascii.Error, ValueError, TypeError) as e:
+            raise ValueError(f"invalid photo_b64: {e}")
+
+    kwargs = {k: str(payload.get(k) or "") for k in TEXT_FIELDS}
+    kwargs.update(parsed)
+    kwargs["photo_bytes"] = photo_bytes or None
+    kwargs["rtl_mode"] = _as_bool(payload.get("rtl_mode", False))
+    kwargs["fit_page"] = _as_bool(payload.get("fit_page", False))
+    kwargs["linearize"] = _as_bool(payload.get("linearize", False))
+    kwargs["template"] = get_template(str(payload.get("template") or DEFAULT_TEMPLATE).strip()).name
+    return kwargs
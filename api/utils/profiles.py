@@ -0,0 +1,317 @@
+"""
+Server-side resume profiles in a local SQLite store.
+
+A profile is a saved-profile payload (see render_kwargs) kept under an id,
+with its photo stored as raw bytes. Clients update profiles with JSON merge
+patches (RFC 7396) and render them by id; the parsed text fields and the
+photo of recently used profiles stay in memory, so a patch only re-parses
+the fields it changes.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+from .payload import render_kwargs
+
+PROFILES_DB = Path(os.getenv("API_PROFILES_DB") or Path(__file__).resolve().parents[2] / "profiles" / "profiles.sqlite3")
+PROFILE_CACHE_SIZE = 64  # Profiles kept parsed in memory per process
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    photo BLOB,
+    version INTEGER NOT NULL,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+"""
+
+
+def merge_patch(target: Any, patch: Any) -> Any:
+    """
+    Applies a JSON merge patch (RFC 7396) and returns the result.
+
+    Objects are merged recursively, ``null`` removes a key, and any other
+    value (including arrays) replaces the target value. ``target`` is not modified.
+    """
+    if not isinstance(patch, dict):
+        return patch
+    out = dict(target) if isinstance(target, dict) else {}
+    for k, v in patch.items():
+        if v is None:
+            out.pop(k, None)
+        else:
+            out[k] = merge_patch(out.get(k), v)
+    return out
+
+
+def _split_photo(payload: Mapping[str, Any], photo: Optional[bytes]) -> Tuple[dict, Optional[bytes]]:
+    """Moves ``photo_b64`` out of a payload, decoded; absent keeps ``photo``, null/empty clears it."""
+    data = dict(payload)
+    if "photo_b64" in data:
+        b64 = data.pop("photo_b64")
+        try:
+            photo = base64.b64decode(b64, validate=True) if b64 else None
+        except (binascii.Error, ValueError, TypeError) as e:
+            raise ValueError(f"invalid photo_b64: {e}")
+    return data, photo
+
+
+class VersionConflict(Exception):
+    """A profile was written by someone else between reading and updating it."""
+
+    def __init__(self, pid: str, expected: int, current: int):
+        super().__init__(f"profile {pid} is at version {current}, not {expected}")
+        self.expected = expected
+        self.current = current
+
+
+@dataclass
+class _Entry:
+    version: int
+    data: dict
+    photo: Optional[bytes]
+    memo: Dict[str, Tuple[str, Any]] = field(default_factory=dict)
+
+
+class ProfileStore:
+    """
+    SQLite-backed profile CRUD with an in-memory cache of parsed profiles.
+
+    Every write bumps the profile's version; cached entries are checked
+    against it, so pre-forked workers sharing the database stay consistent,
+    and patches are only stored on top of the version they were applied to.
+    There is no listing: a profile is only reachable through its random id.
+
+    Args:
+        path (Path): SQLite database file.
+        cache_size (int): Parsed profiles kept in memory.
+    """
+
+    def __init__(self, path: Path, cache_size: int = PROFILE_CACHE_SIZE):
+        self.path = Path(path)
+        self.cache_size = cache_size
+        self._local = threading.local()
+        self._cache: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(_SCHEMA)
+            self._local.db = db
+        return db
+
+    @contextmanager
+    def _tx(self) -> Iterator[sqlite3.Connection]:
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def _remember(self, pid: str, entry: _Entry) -> _Entry:
+        with self._lock:
+            old = self._cache.get(pid)
+            if old is not None and not entry.memo:
+                entry.memo = old.memo  # Still valid per field: keyed by text.
+            self._cache[pid] = entry
+            self._cache.move_to_end(pid)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return entry
+
+    def _entry(self, pid: str) -> Optional[_Entry]:
+        row = self._db().execute("SELECT version FROM profiles WHERE id = ?", (pid,)).fetchone()
+        if row is None:
+            with self._lock:
+                self._cache.pop(pid, None)
+            return None
+        with self._lock:
+            hit = self._cache.get(pid)
+            if hit is not None and hit.version == row[0]:
+                self._cache.move_to_end(pid)
+                return hit
+        row = self._db().execute("SELECT version, data, photo FROM profiles WHERE id = ?", (pid,)).fetchone()
+        if row is None:
+            return None
+        return self._remember(pid, _Entry(row[0], json.loads(row[1]), row[2]))
+
+    def _write(
+        self,
+        pid: str,
+        data: dict,
+        photo: Optional[bytes],
+        memo: Dict[str, Tuple[str, Any]],
+        create: bool,
+        expected: Optional[int] = None,
+    ) -> Optional[int]:
+        now = time.time()
+        blob = json.dumps(data, ensure_ascii=False)
+        with self._tx() as db:
+            if create:
+                db.execute(
+                    "INSERT INTO profiles (id, data, photo, version, created, updated) VALUES (?, ?, ?, 1, ?, ?)",
+                    (pid, blob, photo, now, now),
+                )
+                version = 1
+            elif expected is not None:
+                cur = db.execute(
+                    "UPDATE profiles SET data = ?, photo = ?, version = version + 1, updated = ? "
+                    "WHERE id = ? AND version = ?",
+                    (blob, photo, now, pid, expected),
+                )
+                if cur.rowcount == 0:
+                    row = db.execute("SELECT version FROM profiles WHERE id = ?", (pid,)).fetchone()
+                    if row is None:
+                        return None
+                    raise VersionConflict(pid, expected, row[0])
+                version = expected + 1
+            else:
+                cur = db.execute(
+                    "UPDATE profiles SET data = ?, photo = ?, version = version + 1, updated = ? WHERE id = ?",
+                    (blob, photo, now, pid),
+                )
+                if cur.rowcount == 0:
+                    return None
+                version = db.execute("SELECT version FROM profiles WHERE id = ?", (pid,)).fetchone()[0]
+        self._remember(pid, _Entry(version, data, photo, memo))
+        return version
+
+    def create(self, payload: Mapping[str, Any]) -> Tuple[str, int]:
+        """
+        Validates and stores a new profile.
+
+        Returns:
+            Tuple[str, int]: The new id and version (1).
+
+        Raises:
+            ValueError: If the payload is not a valid resume spec.
+        """
+        data, photo = _split_photo(payload, None)
+        memo: Dict[str, Tuple[str, Any]] = {}
+        render_kwargs(data, photo, memo)
+        pid = uuid.uuid4().hex
+        return pid, self._write(pid, data, photo, memo, create=True)
+
+    def get(self, pid: str) -> Optional[dict]:
+        """Returns the profile payload (photo as ``photo_b64``) and ``version``, or None."""
+        entry = self._entry(pid)
+        if entry is None:
+            return None
+        out = dict(entry.data)
+        if entry.photo:
+            out["photo_b64"] = base64.b64encode(entry.photo).decode("ascii")
+        return {"id": pid, "version": entry.version, "profile": out}
+
+    def replace(self, pid: str, payload: Mapping[str, Any]) -> Optional[int]:
+        """
+        Replaces a profile; returns the new version, or None if it does not exist.
+
+        Raises:
+            ValueError: If the payload is not a valid resume spec.
+        """
+        data, photo = _split_photo(payload, None)
+        entry = self._entry(pid)
+        if entry is None:
+            return None
+        memo = dict(entry.memo)
+        render_kwargs(data, photo, memo)
+        return self._write(pid, data, photo, memo, create=False)
+
+    def patch(self, pid: str, patch: Mapping[str, Any]) -> Optional[int]:
+        """
+        Applies a JSON merge patch to a profile.
+
+        ``photo_b64`` in the patch sets (or, as null, removes) the photo.
+
+        Returns:
+            Optional[int]: The new version, or None if the profile does not exist.
+
+        Raises:
+            ValueError: If the patched profile is not a valid resume spec.
+            VersionConflict: If the profile changed while the patch was applied.
+        """
+        res = self.render_args(pid, patch, save=True)
+        return None if res is None else res[0]
+
+    def render_args(
+        self, pid: str, patch: Optional[Mapping[str, Any]] = None, save: bool = False
+    ) -> Optional[Tuple[int, dict]]:
+        """
+        Returns build_resume_pdf arguments for a profile with ``patch`` applied.
+
+        Text fields that the patch leaves unchanged reuse their cached parse,
+        and the stored photo is passed as bytes. With ``save`` the patched
+        profile is only stored if no other write happened since it was read.
+
+        Args:
+            pid (str): Profile id.
+            patch (Optional[Mapping[str, Any]]): JSON merge patch.
+            save (bool): Store the patched profile as a new version.
+
+        Returns:
+            Optional[Tuple[int, dict]]: The (possibly new) version and the
+            keyword arguments, or None if the profile does not exist.
+
+        Raises:
+            ValueError: If the patched profile is not a valid resume spec.
+            VersionConflict: If ``save`` and the profile changed meanwhile.
+        """
+        entry = self._entry(pid)
+        if entry is None:
+            return None
+        if not patch:
+            return entry.version, render_kwargs(entry.data, entry.photo, entry.memo)
+        body, photo = _split_photo(patch, entry.photo)
+        data = merge_patch(entry.data, body)
+        memo = dict(entry.memo)
+        kwargs = render_kwargs(data, photo, memo)
+        version = entry.version
+        if save:
+            version = self._write(pid, data, photo, memo, create=False, expected=entry.version)
+            if version is None:
+                return None
+        else:
+            entry.memo.update(memo)
+        return version, kwargs
+
+    def delete(self, pid: str) -> bool:
+        """Deletes a profile; returns False if it did not exist."""
+        with self._lock:
+            self._cache.pop(pid, None)
+        with self._tx() as db:
+            return db.execute("DELETE FROM profiles WHERE id = ?", (pid,)).rowcount > 0
+
+
+_store: Optional[ProfileStore] = None
+_store_lock = threading.Lock()
+
+
+def get_profiles() -> ProfileStore:
+    """Returns the process-wide profile store, created on first use."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ProfileStore(PROFILES_DB)
+        return _store
@@ -0,0 +1,69 @@
+"""
+Optional request recorder producing replayable JSONL logs.
+
+Enabled by setting API_RECORD_REQUESTS to a file path; each /generate-form
+call is appended as one JSON object with its form fields and base64 photo.
+Lines are encoded and written on one background thread, never on the
+request path.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Mapping, Optional
+
+_writer: Optional[ThreadPoolExecutor] = None
+_writer_lock = threading.Lock()
+
+
+def _get_writer() -> ThreadPoolExecutor:
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recorder")
+        return _writer
+
+
+def record_path() -> Optional[str]:
+    """Returns the recording target, or None when recording is disabled."""
+    return os.getenv("API_RECORD_REQUESTS") or None
+
+
+def record_request(path: str, endpoint: str, fields: Mapping[str, str], photo: Optional[bytes] = None) -> Future:
+    """
+    Schedules appending one request to the JSONL log at ``path`` and returns immediately.
+
+    Args:
+        path (str): Target JSONL file.
+        endpoint (str): Request path, e.g. "/generate-form".
+        fields (Mapping[str, str]): Form fields as received.
+        photo (Optional[bytes]): Uploaded photo, stored as base64.
+
+    Returns:
+        Future: Completes once the line is written.
+    """
+    rec = {"ts": time.time(), "endpoint": endpoint, **{k: v for k, v in fields.items() if v}}
+    return _get_writer().submit(_append, path, rec, photo)
+
+
+def _append(path: str, rec: dict, photo: Optional[bytes]) -> None:
+    if photo:
+        rec["photo_b64"] = base64.b64encode(photo).decode("ascii")
+    line = json.dumps(rec, ensure_ascii=False) + "\n"
+    # The single writer thread serializes appends within this process.
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line)
+
+
+def close_recorder() -> None:
+    """Waits for pending log lines to be written and stops the writer thread, if it was used."""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.shutdown(wait=True)
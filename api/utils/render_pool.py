@@ -0,0 +1,208 @@
+"""
+Off-loop PDF rendering with in-flight deduplication.
+
+Renders run on a shared executor (a process pool by default in the server,
+threads in the in-process frontend) so the event loop stays responsive. Identical concurrent requests, identified by
+input_digest, wait on one render and share its bytes. Coalescing is per
+server process; each pre-forked worker has its own pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Mapping, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+from ..pdf_utils import build_resume_pdf, input_digest, preload_assets
+from .outputs import get_store
+from .singleflight import SingleFlight
+
+RENDER_EXECUTOR = os.getenv("API_RENDER_EXECUTOR", "").strip().lower()  # process | thread; unset: see get_executor
+RENDER_WORKERS = int(os.getenv("API_RENDER_WORKERS", "1"))
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[Executor] = None
+_executor_kind: Optional[str] = None
+_lock = threading.Lock()
+_flight = SingleFlight()
+
+
+def get_executor(default: str = "process") -> Executor:
+    """
+    Returns the shared render executor, creating it on first use.
+
+    Args:
+        default (str): Executor kind used when API_RENDER_EXECUTOR is unset.
+            The server uses "process" and starts the pool early (see
+            start_executor). Synchronous embedders pass "thread": they create
+            the executor lazily from a busy multi-threaded process, which must
+            not be forked, so a process pool requested there is started with
+            the "spawn" method instead.
+    """
+    global _executor, _executor_kind
+    with _lock:
+        if _executor is None:
+            workers = max(1, RENDER_WORKERS)
+            kind = RENDER_EXECUTOR or default
+            if kind == "thread":
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="render")
+            else:
+                ctx = multiprocessing.get_context("spawn") if default == "thread" else None
+                _executor = ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_worker)
+            _executor_kind = kind
+        return _executor
+
+
+def _init_worker() -> None:
+    """Pool process setup: default signal handling (not the server's) and warm assets."""
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl-C is handled by the parent.
+    preload_assets()
+
+
+def start_executor() -> None:
+    """
+    Creates the executor and starts its workers now rather than on the first request.
+
+    Call before other threads are busy, so pool processes are forked from a
+    quiet parent.
+    """
+    get_executor().submit(int).result()
+
+
+def _discard(ex: Executor) -> None:
+    """Drops ``ex`` as the shared executor if it still is; the next get_executor() starts a new one."""
+    global _executor
+    with _lock:
+        if _executor is not ex:
+            return  # Already replaced by another caller.
+        _executor = None
+    logger.warning("Render pool broke (a worker died); starting a new one")
+    ex.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_executor() -> None:
+    """
+    Stops the executor; renders still queued are cancelled, running ones finish.
+
+    Waits for the pool processes to exit: a serve worker leaves with
+    os._exit() right after this, and pool processes that were never told to
+    stop would block on their call queue forever.
+    """
+    global _executor
+    with _lock:
+        ex, _executor = _executor, None
+    if ex is not None:
+        ex.shutdown(wait=True, cancel_futures=True)
+
+
+def _render(kwargs: Mapping[str, Any]) -> bytes:
+    return build_resume_pdf(**kwargs)
+
+
+def render_blocking(kwargs: Mapping[str, Any]) -> bytes:
+    """
+    Renders a PDF on the shared executor and waits for it, for synchronous callers.
+
+    Used by the in-process frontend backend, where the calling thread (a
+    Streamlit script run) has no event loop; renders from all sessions
+    share the executor's workers. The executor defaults to threads there
+    (see get_executor). A render whose pool broke (a worker was killed) is
+    retried once on a new pool.
+    """
+    kwargs = dict(kwargs)
+    ex = get_executor("thread")
+    try:
+        return ex.submit(_render, kwargs).result()
+    except BrokenProcessPool:
+        _discard(ex)
+    return get_executor("thread").submit(_render, kwargs).result()
+
+
+async def _render_async(kwargs: dict) -> bytes:
+    loop = asyncio.get_running_loop()
+    ex = get_executor()
+    try:
+        return await loop.run_in_executor(ex, _render, kwargs)
+    except BrokenProcessPool:
+        _discard(ex)
+    return await loop.run_in_executor(get_executor(), _render, kwargs)
+
+
+async def render_pdf(kwargs: Mapping[str, Any], key: Optional[str] = None) -> Tuple[bytes, bool]:
+    """
+    Renders a PDF off the event loop, sharing the render with identical concurrent requests.
+
+    Args:
+        kwargs (Mapping[str, Any]): Keyword arguments for build_resume_pdf
+            (picklable: templates by name).
+        key (Optional[str]): Precomputed input_digest of ``kwargs``.
+
+    A render whose process pool broke (a worker crashed or was killed) is
+    retried once on a fresh pool; later requests use the new pool as well.
+
+    Returns:
+        Tuple[bytes, bool]: The PDF and whether it came from another request's render.
+    """
+    key = key or input_digest(kwargs)
+    if kwargs.get("deterministic"):
+        key += ":deterministic"  # input_digest ignores the flag, but the bytes differ.
+    return await _flight.do(key, lambda: _render_async(dict(kwargs)))
+
+
+async def produce_pdf(
+    kwargs: Mapping[str, Any], key: Optional[str] = None, client: Optional[str] = None, store: bool = True
+) -> Tuple[bytes, str]:
+    """
+    Returns the PDF for ``kwargs`` from the outputs store, or renders and stores it.
+
+    The store is read in the thread pool, so large stored PDFs do not block the loop.
+
+    Args:
+        kwargs (Mapping[str, Any]): Keyword arguments for build_resume_pdf.
+        key (Optional[str]): Precomputed input_digest of ``kwargs``.
+        client (Optional[str]): Requesting client, recorded in the outputs index.
+        store (bool): Save a fresh render in the outputs store; False for
+            transient documents such as live previews.
+
+    Returns:
+        Tuple[bytes, str]: The PDF and its source: "hit" (outputs store),
+        "coalesced" (another request's render) or "rendered".
+    """
+    key = key or input_digest(kwargs)
+    outputs = get_store()
+    pdf = await run_in_threadpool(outputs.lookup, key) if outputs else None
+    if pdf is not None:
+        return pdf, "hit"
+    t0 = time.perf_counter()
+    pdf, shared = await render_pdf(kwargs, key)
+    if shared:
+        return pdf, "coalesced"
+    if outputs and store:
+        outputs.save(key, pdf, client=client, render_ms=(time.perf_counter() - t0) * 1000)
+    return pdf, "rendered"
+
+
+def source_headers(source: str) -> dict:
+    """Response headers describing where produce_pdf got the PDF from."""
+    if source == "hit":
+        return {"X-Output-Cache": "hit"}
+    if source == "coalesced":
+        return {"X-Render-Coalesced": "1"}
+    return {}
+
+
+def render_stats() -> dict:
+    """Returns the executor settings and the deduplication counters of this process."""
+    kind = _executor_kind or RENDER_EXECUTOR or "process"
+    return {"executor": kind, "workers": max(1, RENDER_WORKERS), **_flight.stats()}
@@ -0,0 +1,65 @@
+"""
+In-flight deduplication of identical asynchronous calls.
+
+Concurrent callers using the same key share one execution and all receive
+its result (or exception). Nothing is kept once the call finishes, so this
+is independent of any result cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls by key within one event loop.
+
+    Attributes:
+        started (int): Calls that actually executed.
+        coalesced (int): Calls that joined an execution already in flight.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[str, asyncio.Future] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """
+        Runs ``fn()`` unless a call with ``key`` is in flight, then awaits its result.
+
+        The shared call runs as its own task, so a cancelled caller does not
+        cancel it for the others.
+
+        Args:
+            key (str): Identity of the call (e.g. a canonical input hash).
+            fn (Callable[[], Awaitable[T]]): Starts the call.
+
+        Returns:
+            Tuple[T, bool]: The result and whether it was shared with an
+            earlier caller.
+        """
+        fut = self._calls.get(key)
+        shared = fut is not None
+        if shared:
+            self.coalesced += 1
+        else:
+            self.started += 1
+            fut = asyncio.ensure_future(fn())
+            self._calls[key] = fut
+            fut.add_done_callback(lambda f: self._forget(key, f))
+        return await asyncio.shield(fut), shared
+
+    def _forget(self, key: str, fut: asyncio.Future) -> None:
+        if self._calls.get(key) is fut:
+            del self._calls[key]
+        if not fut.cancelled():
+            fut.exception()  # Retrieved here so abandoned failures are not logged.
+
+    def stats(self) -> dict:
+        """Returns the counters and the number of calls currently in flight."""
+        return {"started": self.started, "coalesced": self.coalesced, "in_flight": len(self._calls)}
@@ -0,0 +1,128 @@
+"""
+On-disk store of registered resume specs and their rendered PDFs.
+
+A spec is saved under the content hash of its render inputs (input_digest),
+so the same resume always maps to the same address and, rendered in
+deterministic mode, to the same bytes. The digest covers the renderer
+version, so a hash names one rendering: once the renderer changes, a spec
+whose PDF is not cached yet is refused rather than served with new bytes
+under the old hash.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+from fastapi.concurrency import run_in_threadpool
+
+from ..pdf_utils import input_digest
+from ..pdf_utils.paths import CACHE_DIR
+from .payload import render_kwargs
+from .render_pool import render_pdf
+
+SPECS_DIR = Path(os.getenv("API_SPECS_DIR") or CACHE_DIR / "specs")
+HASH_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def _shard(h: str) -> Path:
+    return SPECS_DIR / h[:2]
+
+
+def spec_path(h: str) -> Path:
+    """Returns where the spec with hash ``h`` is stored."""
+    return _shard(h) / f"{h}.json"
+
+
+def pdf_path(h: str) -> Path:
+    """Returns where the rendered PDF for hash ``h`` is cached."""
+    return _shard(h) / f"{h}.pdf"
+
+
+def _checked_kwargs(spec: Mapping[str, Any], h: str) -> dict:
+    kwargs = render_kwargs(spec)
+    if input_digest(kwargs) != h:
+        raise ValueError("spec was registered with a different renderer")
+    return kwargs
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def register_spec(payload: Mapping[str, Any]) -> str:
+    """
+    Validates and stores a resume spec, returning its content hash.
+
+    Args:
+        payload (Mapping[str, Any]): Form-field or saved-profile layout, as
+            accepted by render_kwargs (photo as ``photo_b64``).
+
+    Returns:
+        str: 64-character hex hash; registering the same spec again is a no-op.
+
+    Raises:
+        ValueError: If the payload cannot be turned into render arguments.
+    """
+    h = input_digest(render_kwargs(payload))
+    path = spec_path(h)
+    if not path.is_file():
+        _write_atomic(path, json.dumps(dict(payload), ensure_ascii=False).encode("utf-8"))
+    return h
+
+
+def load_spec(h: str) -> Optional[dict]:
+    """Returns the stored spec for ``h``, or None if it is unknown."""
+    if not HASH_RE.match(h):
+        return None
+    try:
+        with open(spec_path(h), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def spec_exists(h: str) -> bool:
+    """True if a spec is registered under ``h``."""
+    return bool(HASH_RE.match(h)) and spec_path(h).is_file()
+
+
+async def ensure_pdf(h: str) -> Optional[Path]:
+    """
+    Returns the cached PDF for ``h``, rendering it deterministically on first use.
+
+    Disk access runs in the thread pool and the render on the shared render
+    executor, coalesced with concurrent first requests for the same hash.
+
+    Returns:
+        Optional[Path]: Path to the PDF, or None if no spec is registered under ``h``.
+
+    Raises:
+        ValueError: If the spec can no longer be rendered as registered
+            (invalid now, or its digest changed with the renderer).
+    """
+    out = pdf_path(h)
+    if await run_in_threadpool(out.is_file):
+        return out
+    spec = await run_in_threadpool(load_spec, h)
+    if spec is None:
+        return None
+    kwargs = await run_in_threadpool(_checked_kwargs, spec, h)
+    pdf, _ = await render_pdf({**kwargs, "deterministic": True}, key=h)
+    await run_in_threadpool(_write_atomic, out, pdf)
+    return out
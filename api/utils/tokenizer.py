@@ -0,0 +1,165 @@
+"""
+Single-pass tokenizer and document model for the free-text form blocks.
+Every line is classified exactly once; sections, items, links and
+continuation lines are assembled while streaming over the input.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Union
+
+# Token kinds
+BLANK = "blank"
+TITLE = "title"
+ITEM = "item"
+LINK = "link"
+TEXT = "text"
+
+BULLET_CHARS = "-•–"
+LINK_PREFIXES = ("http://", "https://")
+
+
+class Token(NamedTuple):
+    """A classified input line."""
+
+    kind: str
+    text: str  # Line with surrounding whitespace removed
+    value: str  # Payload: title without brackets, item without bullet, or text
+    raw: str  # Line with trailing whitespace removed (keeps indentation)
+    lineno: int  # 1-based line number
+
+
+def classify(raw: str, lineno: int = 0) -> Token:
+    """
+    Classifies a single line of input.
+
+    Args:
+        raw (str): Line without its line terminator.
+        lineno (int): 1-based line number for diagnostics.
+
+    Returns:
+        Token: The classified line.
+    """
+    s = raw.strip()
+    if not s:
+        return Token(BLANK, "", "", "", lineno)
+    if s[0] == "[" and s[-1] == "]":
+        return Token(TITLE, s, s[1:-1].strip(), raw.rstrip(), lineno)
+    if s[0] in BULLET_CHARS:
+        return Token(ITEM, s, s[1:].strip(), raw.rstrip(), lineno)
+    if s.startswith(LINK_PREFIXES):
+        return Token(LINK, s, s, raw.rstrip(), lineno)
+    return Token(TEXT, s, s, raw.rstrip(), lineno)
+
+
+def tokenize(src: Union[str, Iterable[str], None]) -> Iterator[Token]:
+    """
+    Streams tokens from a text or an iterable of lines.
+
+    Args:
+        src (str | Iterable[str] | None): Raw text or lines (e.g. an open file).
+
+    Yields:
+        Token: One token per input line.
+    """
+    if not src:
+        return
+    lines = src.splitlines() if isinstance(src, str) else src
+    for lineno, raw in enumerate(lines, 1):
+        yield classify(raw.rstrip("\r\n"), lineno)
+
+
+@dataclass
+class Item:
+    """A bulleted entry and the plain lines that continue it."""
+
+    head: str
+    lineno: int
+    continuation: List[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        """The item with its continuation lines joined by single spaces."""
+        if not self.continuation:
+            return self.head
+        return " ".join([self.head, *self.continuation])
+
+
+@dataclass
+class Section:
+    """A titled group of items inside a block."""
+
+    title: Optional[str]
+    lineno: int
+    items: List[Item] = field(default_factory=list)
+
+
+@dataclass
+class Block:
+    """Consecutive non-blank lines delimited by blank lines."""
+
+    tokens: List[Token] = field(default_factory=list)
+    sections: List[Section] = field(default_factory=list)
+
+    @property
+    def links(self) -> List[str]:
+        """All link lines in the block, in order."""
+        return [t.text for t in self.tokens if t.kind == LINK]
+
+
+@dataclass
+class Document:
+    """Parsed representation of one free-text field."""
+
+    blocks: List[Block] = field(default_factory=list)
+
+
+def parse_document(src: Union[str, Iterable[str], None]) -> Document:
+    """
+    Builds the document model in a single pass over the input.
+
+    Rules:
+        - Blank lines close the current block and section.
+        - ``[Title]`` opens a new section.
+        - Lines starting with ``-``, ``•`` or ``–`` open a new item.
+        - Other lines continue the last item, or name the section if it has
+          neither a title nor items yet.
+
+    Args:
+        src (str | Iterable[str] | None): Raw text or lines.
+
+    Returns:
+        Document: Blocks with their tokens and sections.
+    """
+    doc = Document()
+    block: Optional[Block] = None
+    sec: Optional[Section] = None
+
+    for tok in tokenize(src):
+        kind = tok.kind
+        if kind == BLANK:
+            block, sec = None, None
+            continue
+        if block is None:
+            block = Block()
+            doc.blocks.append(block)
+        block.tokens.append(tok)
+
+        if kind == TITLE:
+            sec = Section(tok.value, tok.lineno)
+            block.sections.append(sec)
+        elif kind == ITEM:
+            if sec is None:
+                sec = Section(None, tok.lineno)
+                block.sections.append(sec)
+            sec.items.append(Item(tok.value, tok.lineno))
+        elif sec is not None and sec.items:
+            sec.items[-1].continuation.append(tok.text)
+        elif sec is None:
+            sec = Section(tok.text, tok.lineno)
+            block.sections.append(sec)
+        elif not sec.title:
+            sec.title = tok.text
+
+    return doc
@@ -4,16 +4,40 @@ Client-side handler for submitting resume form data to the backend PDF generatio
 
 from __future__ import annotations
 
+import json
+
 import requests
 import streamlit as st
 
+from api.utils.parsers import parse_form_texts
+
+from .state import BACKEND_MODE
 from .utils import PHOTO_BYTES_KEY, PHOTO_NAME_KEY, PHOTO_MIME_KEY
 
 
+# Free-text form fields that parse_form_state turns into ``structured``.
+TEXT_KEYS = ("skills", "languages", "projects_text", "education_text", "sections_left_text", "sections_right_text")
+
+
+def parse_form_state(form_state: dict) -> dict:
+    """Parses the free-text fields of a form payload with the backend's own parser."""
+    return parse_form_texts(
+        skills_text=", ".join(form_state.get("skills", [])),
+        languages_text=", ".join(form_state.get("languages", [])),
+        projects_text=form_state.get("projects_text", ""),
+        education_text=form_state.get("education_text", ""),
+        sections_left_text=form_state.get("sections_left_text", ""),
+        sections_right_text=form_state.get("sections_right_text", ""),
+    )
+
+
 def call_generate_form(api_base: str, form_state: dict) -> bytes:
     """
     Sends resume form data to the FastAPI backend and returns the generated PDF.
 
+    The free-text fields are parsed locally with the backend's own parser and
+    sent as one ``structured`` JSON field instead of raw text.
+
     Args:
         api_base (str): Base URL of the backend API.
         form_state (dict): Dictionary containing all form fields and their values.
@@ -22,6 +46,7 @@ def call_generate_form(api_base: str, form_state: dict) -> bytes:
         bytes: PDF content as bytes.
     """
     url = api_base.rstrip("/") + "/generate-form"
+    structured = parse_form_state(form_state)
     data = {
         "name": form_state.get("name", ""),
         "location": form_state.get("location", ""),
@@ -30,13 +55,11 @@ def call_generate_form(api_base: str, form_state: dict) -> bytes:
         "github": form_state.get("github", ""),
         "linkedin": form_state.get("linkedin", ""),
         "birthdate": form_state.get("birthdate", ""),
-        "projects_text": form_state.get("projects_text", ""),
-        "education_text": form_state.get("education_text", ""),
-        "sections_left_text": form_state.get("sections_left_text", ""),
-        "sections_right_text": form_state.get("sections_right_text", ""),
-        "skills_text": ", ".join(form_state.get("skills", [])),
-        "languages_text": ", ".join(form_state.get("languages", [])),
+        "structured": json.dumps(structured, ensure_ascii=False),
         "rtl_mode": "true" if form_state.get("rtl_mode") else "false",
+        "fit_page": "true" if form_state.get("fit_page") else "false",
+        "linearize": "true" if form_state.get("linearize") else "false",
+        "template": form_state.get("template") or "default",
     }
 
     files = None
@@ -51,4 +74,102 @@ def call_generate_form(api_base: str, form_state: dict) -> bytes:
 
     resp = requests.post(url, data=data, files=files, timeout=60)
     resp.raise_for_status()
-    return resp.content
\ No newline at end of file
+    return resp.content
+
+
+def call_generate_local(payload: dict, photo_bytes: bytes | None, memo: dict) -> bytes:
+    """
+    Renders the form in this process, without the HTTP API.
+
+    The payload goes through the backend's own render_kwargs and the PDF is
+    built on the shared render executor (see api.utils.render_pool), so no
+    multipart encoding or network hop is involved. For single-host setups
+    (FRONTEND_BACKEND=inprocess); the backend modules are imported on first use.
+
+    Args:
+        payload (dict): Saved-profile layout of the current form.
+        photo_bytes (bytes | None): Raw photo, used instead of ``photo_b64``.
+        memo (dict): Per-session parse results, reused for unchanged fields.
+
+    Returns:
+        bytes: PDF content as bytes.
+    """
+    from api.utils.payload import render_kwargs
+    from api.utils.render_pool import render_blocking
+
+    return render_blocking(render_kwargs(payload, photo_bytes or None, memo))
+
+
+def merge_diff(old: dict, new: dict) -> dict:
+    """Returns the JSON merge patch (RFC 7396) that turns ``old`` into ``new``; nested objects are diffed too."""
+    patch = {}
+    for k, v in new.items():
+        if isinstance(v, dict) and isinstance(old.get(k), dict):
+            sub = merge_diff(old[k], v)
+            if sub:
+                patch[k] = sub
+        elif old.get(k) != v:
+            patch[k] = v
+    patch.update({k: None for k in old if k not in new})
+    return patch
+
+
+def call_generate_profile(api_base: str, payload: dict, sync: dict) -> bytes:
+    """
+    Renders the form through a server-side profile, sending only what changed.
+
+    The free-text fields are parsed here, as in call_generate_form, and
+    stored as ``structured`` instead of raw text. The first call stores the
+    whole profile with POST /profiles; later calls send a merge patch
+    against that stored profile to /profiles/{id}/generate with
+    ``save=false``, so edits are not written to the server's database and
+    a patch carries only the parsed blocks that changed. A profile the
+    server no longer knows is created again.
+
+    Args:
+        api_base (str): Base URL of the backend API.
+        payload (dict): Saved-profile layout of the current form.
+        sync (dict): Per-session state holding ``id`` and the stored ``payload``; updated in place.
+
+    Returns:
+        bytes: PDF content as bytes.
+    """
+    base = api_base.rstrip("/")
+    profile = {k: v for k, v in payload.items() if k not in TEXT_KEYS}
+    profile["structured"] = parse_form_state(payload)
+    for _ in range(2):
+        if not sync.get("id"):
+            resp = requests.post(base + "/profiles", json=profile, timeout=60)
+            resp.raise_for_status()
+            sync["id"], sync["payload"] = resp.json()["id"], profile
+        patch = merge_diff(sync["payload"], profile)
+        resp = requests.post(
+            f"{base}/profiles/{sync['id']}/generate", params={"save": "false"}, json=patch, timeout=60
+        )
+        if resp.status_code == 404:
+            sync.clear()
+            continue
+        resp.raise_for_status()
+        return resp.content
+    resp.raise_for_status()
+    return resp.content
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_templates(api_base: str) -> list[str]:
+    """
+    Returns the template names offered by the backend, default first.
+
+    In-process mode reads the template registry directly. Falls back to
+    ``["default"]`` when the backend is unreachable.
+    """
+    if BACKEND_MODE == "inprocess":
+        from api.pdf_utils.templates import list_templates
+
+        return list_templates()
+    try:
+        resp = requests.get(api_base.rstrip("/") + "/templates", timeout=5)
+        resp.raise_for_status()
+        return list(resp.json().get("templates") or ["default"])
+    except (requests.RequestException, ValueError):
+        return ["default"]
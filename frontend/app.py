@@ -55,6 +55,9 @@ def _apply_payload_to_form(p: dict) -> None:
     st.session_state[K["sections_left_text"]] = p.get("sections_left_text", "") or ""
     st.session_state[K["sections_right_text"]] = p.get("sections_right_text", "") or ""
     st.session_state[K["rtl_mode"]] = bool(p.get("rtl_mode", False))
+    st.session_state[K["fit_page"]] = bool(p.get("fit_page", False))
+    st.session_state[K["linearize"]] = bool(p.get("linearize", False))
+    st.session_state[K["template"]] = p.get("template") or "default"
 
     if p.get("photo_b64"):
         decode_photo_from_b64(
@@ -18,19 +18,26 @@ K = {
     "sections_left_text": "f_sections_left_text",
     "sections_right_text": "f_sections_right_text",
     "rtl_mode": "f_rtl_mode",
+    "fit_page": "f_fit_page",
+    "linearize": "f_linearize",
+    "template": "f_template",
     "api_base": "f_api_base",
 }
 
 DEFAULT_API_BASE = os.getenv("API_BASE_URL", "http://127.0.0.1:8000")
+# "http" talks to the API at API_BASE_URL; "inprocess" renders in the Streamlit process
+BACKEND_MODE = os.getenv("FRONTEND_BACKEND", "http").strip().lower()
 
 
 def init_state():
     """Initialize Streamlit session_state with default values."""
     for key in K.values():
         if key not in st.session_state:
-            if key == K["rtl_mode"]:
+            if key in (K["rtl_mode"], K["fit_page"], K["linearize"]):
                 st.session_state[key] = False
             elif key == K["api_base"]:
                 st.session_state[key] = DEFAULT_API_BASE
+            elif key == K["template"]:
+                st.session_state[key] = "default"
             else:
                 st.session_state[key] = ""
@@ -1,6 +1,27 @@
 from __future__ import annotations
 import streamlit as st
-from ..state import K
+
+from api.utils.parsers import (
+    lint_projects_text,
+    lint_sections_text,
+    parse_education_blocks,
+    parse_projects_blocks,
+    parse_sections_text,
+)
+
+from ..api_client import fetch_templates
+from ..state import K, DEFAULT_API_BASE
+
+
+def _preview(key: str, parse, lint=None) -> None:
+    """Parses a text area locally and shows warnings and the parsed structure inline."""
+    txt = st.session_state.get(key, "")
+    if not txt.strip():
+        return
+    for w in (lint(txt) if lint else []):
+        st.warning(w)
+    with st.expander("Parsed structure", expanded=False):
+        st.json(parse(txt))
 
 
 def render() -> None:
@@ -40,14 +61,25 @@ def render() -> None:
 
     st.text_area("Projects (raw text block format)", key=K["projects_text"], height=140)
     st.caption("Example:\nNeuroServe\nFastAPI GPU-ready inference server…\nhttps://github.com/…\n\nRepoSmith\nBootstraps Python projects…\nhttps://github.com/…")
+    _preview(K["projects_text"], parse_projects_blocks, lint_projects_text)
 
     st.text_area("Education (blocks separated by empty lines)", key=K["education_text"], height=120)
     st.caption("Example:\nAI (KI) Development – Mystro GmbH (Wuppertal)\n18.06.2024–30.12.2024 — 1000 hrs\n\nInternship – Yolo GmbH (Wuppertal)\n17.02.2025–14.03.2025")
+    _preview(K["education_text"], parse_education_blocks)
 
     st.text_area("Left Column Sections [Title] + - items", key=K["sections_left_text"], height=120)
     st.caption("Example:\n[Certificates]\n- AWS Cloud Practitioner\n- Scrum Basics\n\n[Hobbies]\n- Running\n- Reading")
+    _preview(K["sections_left_text"], parse_sections_text, lint_sections_text)
 
     st.text_area("Right Column Sections [Title] + - items / paragraphs", key=K["sections_right_text"], height=120)
     st.caption("Example:\n[Profile]\n- Backend developer focused on FastAPI…\n- Experience with LLMs (RAG/Agents)…")
+    _preview(K["sections_right_text"], parse_sections_text, lint_sections_text)
+
+    st.checkbox("Right-to-left by default (Arabic text is detected automatically)", key=K["rtl_mode"])
+    st.checkbox("Fit to one page (shrink text and spacing if needed)", key=K["fit_page"])
+    st.checkbox("Fast web view (linearized PDF, first page shows while loading)", key=K["linearize"])
 
-    st.checkbox("Enable RTL for right-side texts (Arabic)", key=K["rtl_mode"])
+    templates = fetch_templates(st.session_state.get(K["api_base"]) or DEFAULT_API_BASE)
+    if st.session_state.get(K["template"]) not in templates:
+        st.session_state[K["template"]] = templates[0]
+    st.selectbox("Template", templates, key=K["template"])
@@ -3,10 +3,11 @@ from pathlib import Path
 from typing import Any, Dict, List
 from datetime import datetime
 import json
+import requests
 import streamlit as st
 
-from ..state import K, DEFAULT_API_BASE
-from ..api_client import call_generate_form
+from ..state import K, DEFAULT_API_BASE, BACKEND_MODE
+from ..api_client import call_generate_form, call_generate_local, call_generate_profile
 from ..utils import (
     persist_json_atomic, encode_photo_to_b64, decode_photo_from_b64,
     PHOTO_BYTES_KEY, PHOTO_MIME_KEY, PHOTO_NAME_KEY,
@@ -14,9 +15,7 @@ from ..utils import (
 
 BASE_DIR = Path(__file__).resolve().parents[2]
 PROFILES_DIR = BASE_DIR / "profiles"
-OUTPUTS_DIR = BASE_DIR / "outputs"
 PROFILES_DIR.mkdir(exist_ok=True)
-OUTPUTS_DIR.mkdir(exist_ok=True)
 
 def _payload_from_form() -> Dict[str, Any]:
     payload: Dict[str, Any] = {
@@ -34,6 +33,9 @@ def _payload_from_form() -> Dict[str, Any]:
         "sections_left_text": st.session_state.get(K["sections_left_text"], ""),
         "sections_right_text": st.session_state.get(K["sections_right_text"], ""),
         "rtl_mode": bool(st.session_state.get(K["rtl_mode"], False)),
+        "fit_page": bool(st.session_state.get(K["fit_page"], False)),
+        "linearize": bool(st.session_state.get(K["linearize"], False)),
+        "template": st.session_state.get(K["template"]) or "default",
     }
     photo_b64, photo_mime, photo_name = encode_photo_to_b64()
     payload.update({"photo_b64": photo_b64, "photo_mime": photo_mime, "photo_name": photo_name})
@@ -54,6 +56,9 @@ def _apply_payload_to_form(p: Dict[str, Any]) -> None:
     st.session_state[K["sections_left_text"]] = p.get("sections_left_text", "")
     st.session_state[K["sections_right_text"]] = p.get("sections_right_text", "")
     st.session_state[K["rtl_mode"]] = bool(p.get("rtl_mode", False))
+    st.session_state[K["fit_page"]] = bool(p.get("fit_page", False))
+    st.session_state[K["linearize"]] = bool(p.get("linearize", False))
+    st.session_state[K["template"]] = p.get("template") or "default"
     if p.get("photo_b64"):
         decode_photo_from_b64(p.get("photo_b64", ""), p.get("photo_mime"), p.get("photo_name"))
     else:
@@ -76,6 +81,16 @@ def _api_base_value() -> str:
         st.session_state[K["api_base"]] = DEFAULT_API_BASE
     return base.rstrip("/")
 
+def _generate_via_api() -> bytes:
+    sync = st.session_state.setdefault("_server_profile", {})
+    try:
+        return call_generate_profile(_api_base_value(), _payload_from_form(), sync)
+    except requests.HTTPError as e:
+        if e.response is None or e.response.status_code not in (404, 405):
+            raise
+        # Backend without /profiles: send the whole form.
+        return call_generate_form(_api_base_value(), _payload_from_form())
+
 def render() -> None:
     if "pdf_bytes" not in st.session_state:
         st.session_state.pdf_bytes = None
@@ -83,9 +98,12 @@ def render() -> None:
         st.session_state.pdf_filename = "resume.pdf"
 
     st.sidebar.subheader("API Connection")
-    st.sidebar.text_input("API Base URL", key=K["api_base"],
-                          help="Example: http://127.0.0.1:8000 or http://localhost:8000",
-                          placeholder=DEFAULT_API_BASE)
+    if BACKEND_MODE == "inprocess":
+        st.sidebar.caption("Rendering in-process (FRONTEND_BACKEND=inprocess)")
+    else:
+        st.sidebar.text_input("API Base URL", key=K["api_base"],
+                              help="Example: http://127.0.0.1:8000 or http://localhost:8000",
+                              placeholder=DEFAULT_API_BASE)
 
     st.sidebar.header("💾 Save / Load (includes photo)")
     preset_name = st.sidebar.text_input("Preset Name", value="", placeholder="my-profile")
@@ -117,7 +135,11 @@ def render() -> None:
     st.sidebar.header("📄 PDF Generator")
     if st.sidebar.button("🧾 Generate PDF"):
         try:
-            pdf_bytes = call_generate_form(_api_base_value(), _payload_from_form())
+            if BACKEND_MODE == "inprocess":
+                memo = st.session_state.setdefault("_parse_memo", {})
+                pdf_bytes = call_generate_local(_payload_from_form(), st.session_state.get(PHOTO_BYTES_KEY), memo)
+            else:
+                pdf_bytes = _generate_via_api()
             st.session_state.pdf_bytes = pdf_bytes
             ts = datetime.now().strftime("%Y%m%d_%H%M%S")
             st.session_state.pdf_filename = f"resume_{ts}.pdf"
@@ -0,0 +1,43 @@
+"""
+Shared pytest setup: keeps caches, outputs and profiles out of the working tree.
+
+Slow tests (soak runs) are skipped unless ``--run-slow`` is given.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+_TMP = Path(tempfile.mkdtemp(prefix="resume-tests-"))
+os.environ.setdefault("PDF_UTILS_CACHE", str(_TMP / "cache"))
+os.environ.setdefault("API_OUTPUTS", "0")
+os.environ.setdefault("API_OUTPUTS_DIR", str(_TMP / "outputs"))
+os.environ.setdefault("API_PROFILES_DB", str(_TMP / "profiles" / "profiles.sqlite3"))
+os.environ.setdefault("API_SPECS_DIR", str(_TMP / "specs"))
+os.environ.setdefault("API_WARMUP", "0")
+
+
+def pytest_addoption(parser):
+    parser.addoption("--run-slow", action="store_true", default=False, help="run slow soak tests")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: long-running soak test, needs --run-slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip = pytest.mark.skip(reason="needs --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,53 @@
+"""
+Asset bundle invalidation when its source files change.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+
+import pytest
+
+from api.pdf_utils import bundle
+
+
+@pytest.fixture
+def icons(tmp_path, monkeypatch):
+    src = bundle.ICONS_DIR
+    if not any(src.glob("*.png")):
+        pytest.skip("no icons to bundle")
+    dst = tmp_path / "icons"
+    shutil.copytree(src, dst)
+    monkeypatch.setattr(bundle, "ICONS_DIR", dst)
+    return dst
+
+
+def _build(tmp_path):
+    path = tmp_path / "assets.bundle"
+    bundle.build_bundle(path)
+    return path
+
+
+def test_fresh_bundle_loads(tmp_path, icons):
+    b = bundle.AssetBundle(_build(tmp_path))
+    assert sorted(b.header["images"]) == sorted(p.name for p in icons.glob("*.png"))
+
+
+def test_changed_icon_invalidates(tmp_path, icons):
+    path = _build(tmp_path)
+    icon = next(icons.glob("*.png"))
+    st = icon.stat()
+    os.utime(icon, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    with pytest.raises(ValueError, match="icons"):
+        bundle.AssetBundle(path)
+
+
+def test_added_font_invalidates(tmp_path, icons, monkeypatch):
+    from api.pdf_utils import fonts
+
+    path = _build(tmp_path)
+    monkeypatch.setattr(fonts, "find_symbol_font", lambda: ("Added", icons / "added.ttf"))
+    (icons / "added.ttf").write_bytes(b"\0" * 16)
+    with pytest.raises(ValueError, match="fonts"):
+        bundle.AssetBundle(path)
@@ -0,0 +1,96 @@
+"""
+Deterministic mode: identical inputs give identical bytes across runs and processes.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from api.pdf_utils import build_resume_pdf, input_digest
+from api.utils.payload import render_kwargs
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Renders the payload on stdin and prints the PDF's SHA-256.
+CHILD = """
+import hashlib, json, sys
+from api.pdf_utils import build_resume_pdf
+from api.utils.payload import render_kwargs
+for payload in json.load(sys.stdin):
+    print(hashlib.sha256(build_resume_pdf(**render_kwargs(payload), deterministic=True)).hexdigest())
+"""
+
+
+def _photo_b64() -> str:
+    Image = pytest.importorskip("PIL.Image")
+    img = Image.new("RGB", (64, 64), (40, 90, 160))
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+BASE = {
+    "name": "Deterministic Test",
+    "email": "test@example.org",
+    "github": "octocat",
+    "skills_text": "Python, FastAPI, ReportLab",
+    "languages_text": "Deutsch - C1\nالعربية - C2",
+    "projects_text": "Resume API\nRenders PDFs.\nhttps://example.org\n\nمشروع\nوصف المشروع",
+    "education_text": "University\n2010 - 2014",
+    "sections_left_text": "[Hobbies]\n- Chess",
+    "sections_right_text": "[Experience]\n- Developer",
+}
+
+PAYLOADS = [
+    BASE,
+    {**BASE, "template": "classic", "fit_page": "true"},
+    {**BASE, "template": "compact", "rtl_mode": "true", "linearize": "true"},
+]
+
+
+@pytest.fixture(scope="module")
+def payloads():
+    photo = _photo_b64()
+    return [{**p, "photo_b64": photo} for p in PAYLOADS]
+
+
+def _sha(pdf: bytes) -> str:
+    return hashlib.sha256(pdf).hexdigest()
+
+
+def test_identical_across_runs_and_processes(payloads):
+    first = [_sha(build_resume_pdf(**render_kwargs(p), deterministic=True)) for p in payloads]
+    second = [_sha(build_resume_pdf(**render_kwargs(p), deterministic=True)) for p in payloads]
+    assert first == second
+
+    env = {**os.environ, "PYTHONPATH": str(ROOT), "PYTHONHASHSEED": "12345"}
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        input=json.dumps(payloads), capture_output=True, text=True, cwd=ROOT, env=env, check=True,
+    )
+    assert out.stdout.split() == first
+    assert len(set(first)) == len(first)
+
+
+def test_document_id_comes_from_input_digest(payloads):
+    kwargs = render_kwargs(payloads[0])
+    pdf = build_resume_pdf(**kwargs, deterministic=True)
+    m = re.search(rb"/ID\s*\[<([0-9a-f]{32})><([0-9a-f]{32})>\]", pdf)
+    assert m, "trailer /ID not found (ReportLab may no longer honour the preset _ID)"
+    assert m.group(1) == m.group(2) == input_digest(kwargs)[:32].encode()
+
+
+def test_default_mode_is_not_pinned(payloads):
+    kwargs = render_kwargs(payloads[0])
+    pdf = build_resume_pdf(**kwargs)
+    assert input_digest(kwargs)[:32].encode() not in pdf
@@ -0,0 +1,119 @@
+"""
+Structure of linearized PDFs: the parameter dictionary, both cross-reference
+sections and a round trip through independent readers.
+"""
+
+from __future__ import annotations
+
+import io
+import re
+
+import pytest
+
+from api.pdf_utils import build_resume_pdf
+from api.pdf_utils.linearize import linearize_pdf
+
+# Strings that a naive object splitter would mistake for structure.
+TRICKY_URLS = [
+    "https://example.org/stream\nendobj",
+    "https://example.org/a(b/endobj?x=1 0 R",
+    "https://example.org/c)d\\e/stream",
+    "https://example.org/(balanced 12 0 R)/endstream",
+]
+
+KWARGS = {
+    "name": "Linearize (Test) endobj",
+    "email": "test@example.org",
+    "github": "octocat",
+    "skills": ["stream", "endobj", "0 R"],
+    "projects": [(f"Project {i}", "Description with (parens) and 3 0 R", url) for i, url in enumerate(TRICKY_URLS)],
+    "education_items": ["University\n2010 - 2014"],
+}
+
+_XREF_ENTRY = re.compile(rb"(\d{10}) (\d{5}) ([nf]) ?\r?\n")
+
+
+@pytest.fixture(scope="module")
+def pdfs():
+    src = build_resume_pdf(**KWARGS, deterministic=True)
+    return src, linearize_pdf(src)
+
+
+def _params(out: bytes) -> dict:
+    m = re.search(rb"/Linearized 1 /L (\d+) /H \[ (\d+) (\d+) \] /O (\d+) /E (\d+) /N (\d+) /T (\d+)", out[:1024])
+    assert m, "linearization dictionary not found at the start of the file"
+    keys = ("L", "H_off", "H_len", "O", "E", "N", "T")
+    return dict(zip(keys, map(int, m.groups())))
+
+
+def _xref_sections(out: bytes):
+    """Yields (section offset, first object number, [entry offsets]) for each xref section."""
+    for m in re.finditer(rb"(?m)^xref\r?\n(\d+) (\d+)\r?\n", out):
+        first, count = int(m.group(1)), int(m.group(2))
+        pos, entries = m.end(), []
+        for _ in range(count):
+            e = _XREF_ENTRY.match(out, pos)
+            assert e, f"bad xref entry at {pos}"
+            entries.append((int(e.group(1)), e.group(3)))
+            pos = e.end()
+        yield m.start(), first, entries
+
+
+def test_parameters_and_xrefs(pdfs):
+    _, out = pdfs
+    p = _params(out)
+    assert p["L"] == len(out)
+    assert p["N"] == 1
+
+    sections = list(_xref_sections(out))
+    assert len(sections) == 2
+    for _, first, entries in sections:
+        for i, (offset, kind) in enumerate(entries):
+            if kind == b"f":
+                continue
+            num = first + i
+            assert out.startswith(b"%d 0 obj" % num, offset), f"xref offset of object {num} is wrong"
+
+    # /T: the whitespace right before the first entry of the main (last) xref table.
+    main_at = sections[-1][0]
+    t = p["T"]
+    assert main_at < t < main_at + 32
+    assert out[t:t + 1] in b" \r\n" and _XREF_ENTRY.match(out, t + 1)
+
+    # /O: the first page object; /E: the end of the first-page section.
+    page_at = dict(
+        (first + i, off) for _, first, entries in sections for i, (off, kind) in enumerate(entries) if kind == b"n"
+    )[p["O"]]
+    assert re.search(rb"/Type\s*/Page\b", out[page_at:out.index(b"endobj", page_at)])
+    assert p["H_off"] < p["E"] <= main_at
+    assert out[p["H_off"]:].startswith(b"%d 0 obj" % (p["O"] - 1))  # Hint stream precedes page one
+
+    # The first-page xref section is followed by a trailer whose /Prev is the main xref.
+    prev = int(re.search(rb"/Prev (\d+)", out).group(1))
+    assert prev == main_at
+
+
+def test_readers_agree_with_source(pdfs):
+    pypdf = pytest.importorskip("pypdf")
+    src, out = pdfs
+
+    def links(data: bytes):
+        reader = pypdf.PdfReader(io.BytesIO(data), strict=True)
+        assert len(reader.pages) == 1
+        page = reader.pages[0]
+        uris = [a.get_object()["/A"]["/URI"] for a in page.get("/Annots", [])]
+        return uris, page.get_contents().get_data(), reader.trailer["/ID"]
+
+    uris, content, ids = links(out)
+    assert (uris, content, ids) == links(src)
+    for url in TRICKY_URLS:
+        assert url in uris
+
+
+def test_qpdf_accepts_linearization(pdfs):
+    pikepdf = pytest.importorskip("pikepdf")
+    _, out = pdfs
+    with pikepdf.open(io.BytesIO(out)) as pdf:
+        assert pdf.is_linearized
+        assert pdf.check_linearization(stream=io.StringIO())
+        assert not pdf.check_pdf_syntax()
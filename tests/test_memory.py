@@ -0,0 +1,76 @@
+"""
+Memory benchmark of the PDF output path for a photo-heavy resume.
+
+"legacy" reproduces the path before the output changes: ASCII85-encoded
+streams, the canvas saved into a BytesIO and its value copied out.
+"current" is build_resume_pdf as it is now (binary streams, the joined
+buffer returned as-is). ReportLab builds the whole document in memory
+before writing any of it, so there is no incremental output to compare.
+Run with ``-s`` to see the numbers.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import tracemalloc
+
+import pytest
+from reportlab import rl_config
+
+from api.pdf_utils import build_resume_pdf
+from api.pdf_utils.config import USE_ASCII85
+
+
+@pytest.fixture(scope="module")
+def kwargs():
+    Image = pytest.importorskip("PIL.Image")
+    side = 600
+    img = Image.frombytes("RGB", (side, side), os.urandom(side * side * 3))  # Incompressible: a large PDF
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    kw = {"name": "Memory Benchmark", "photo_bytes": buf.getvalue()}
+    build_resume_pdf(**kw)  # Load fonts and caches before measuring.
+    return kw
+
+
+def legacy(kw):
+    old = rl_config.useA85
+    rl_config.useA85 = 1
+    try:
+        buf = io.BytesIO()
+        buf.write(build_resume_pdf(**kw))  # What canvas.save() did with a BytesIO target.
+        return buf.getvalue()
+    finally:
+        rl_config.useA85 = old
+
+
+def current(kw):
+    return build_resume_pdf(**kw)
+
+
+def measure(fn, kw):
+    """Returns (peak traced bytes, PDF size) of one render."""
+    tracemalloc.start()
+    try:
+        pdf = fn(kw)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, len(pdf)
+
+
+def test_output_path_memory(kwargs):
+    stats = {fn.__name__: measure(fn, kwargs) for fn in (legacy, current)}
+    for name, (peak, size) in stats.items():
+        print(f"{name:>8}: peak {peak / 1e6:6.1f} MB, PDF {size / 1e6:.1f} MB")
+
+    (old_peak, old_size), (new_peak, new_size) = stats["legacy"], stats["current"]
+    assert new_size < old_size * 0.85  # ASCII85 adds a quarter to binary streams.
+    assert new_peak < old_peak * 0.5
+
+
+def test_ascii85_is_process_wide():
+    assert rl_config.useA85 == int(USE_ASCII85)
+    build_resume_pdf(name="Settings")
+    assert rl_config.useA85 == int(USE_ASCII85)
@@ -0,0 +1,36 @@
+"""
+ReportLab private state used by TextBatch and compile_icon_forms.
+"""
+
+from __future__ import annotations
+
+import io
+import re
+
+import pytest
+from reportlab.pdfgen.canvas import Canvas
+
+from api.pdf_utils import build_resume_pdf, layout, rlcompat, vector_icons
+
+KWARGS = {"name": "Compat Test", "email": "test@example.org", "github": "octocat", "skills": ["Python", "ReportLab"]}
+
+
+def test_checked_version_has_expected_state():
+    if not rlcompat.CANVAS_STATE_OK:
+        pytest.skip(f"ReportLab {rlcompat.RL_VERSION} is not a checked version")
+    c = Canvas(io.BytesIO())
+    for attr in ("_fontname", "_fontsize", "_leading", "_fillColorObj", "_formsinuse"):
+        assert hasattr(c, attr), attr
+    t = c.beginText()
+    assert (t._fontname, t._fontsize) == (c._fontname, c._fontsize)
+
+
+def test_unchecked_version_renders_without_private_state(monkeypatch):
+    monkeypatch.setattr(layout, "CANVAS_STATE_OK", False)
+    monkeypatch.setattr(vector_icons, "CANVAS_STATE_OK", False)
+    layout.clear_layout_cache()
+    pdf = build_resume_pdf(**KWARGS)
+    layout.clear_layout_cache()
+    assert pdf.startswith(b"%PDF-") and pdf.rstrip().endswith(b"%%EOF")
+    forms = set(re.findall(rb"/FormXob\.(\w+)", pdf))
+    assert forms == {b"icon_mail", b"icon_github"}  # Unreferenced forms are not written.
@@ -0,0 +1,197 @@
+"""
+Soak tests: resident memory must stay flat over thousands of renders.
+
+Run with ``python -m pytest --run-slow tests/test_soak.py``. The tests
+need Linux (/proc) to read resident set sizes. The serve tests run the
+default setup: pre-forked workers, each with its own render process pool.
+Add ``-s`` to see the sampled sizes.
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+PROC = Path("/proc")
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.skipif(not (PROC / "self" / "status").exists(), reason="needs /proc"),
+]
+
+WARMUP = 1000  # Renders before the baseline is taken (caches fill up first).
+RENDERS = 5000
+TOLERANCE_MB = 16
+
+
+def rss_mb(pid: int | str = "self") -> float:
+    """Resident set size of ``pid`` in MiB."""
+    for line in (PROC / str(pid) / "status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) / 1024
+    raise RuntimeError(f"no VmRSS for {pid}")
+
+
+def children_of(ppid: int) -> List[int]:
+    pids = []
+    for d in PROC.iterdir():
+        if d.name.isdigit():
+            try:
+                stat = (d / "stat").read_text()
+            except OSError:
+                continue
+            if int(stat.rsplit(")", 1)[1].split()[1]) == ppid:
+                pids.append(int(d.name))
+    return pids
+
+
+def group_members(pgid: int) -> List[int]:
+    """Live processes in process group ``pgid`` (orphans are reparented but keep it)."""
+    pids = []
+    for d in PROC.iterdir():
+        if d.name.isdigit():
+            try:
+                stat = (d / "stat").read_text().rsplit(")", 1)[1].split()
+            except OSError:
+                continue
+            if int(stat[2]) == pgid and stat[0] != "Z":
+                pids.append(int(d.name))
+    return pids
+
+
+def descendants_of(pid: int) -> List[int]:
+    """All processes below ``pid``: workers and their render pool processes."""
+    out, todo = [], [pid]
+    while todo:
+        kids = children_of(todo.pop())
+        out += kids
+        todo += kids
+    return out
+
+
+def tree_rss_mb(pid: int) -> float:
+    total = 0.0
+    for p in descendants_of(pid):
+        try:
+            total += rss_mb(p)
+        except (OSError, RuntimeError):
+            pass  # Exited meanwhile.
+    return total
+
+
+def fields(i: int) -> Dict[str, str]:
+    """Form fields that vary per request, so caches keep seeing new content."""
+    return {
+        "name": f"Soak Test {i}",
+        "email": f"user{i}@example.org",
+        "skills_text": f"Python, FastAPI, Skill {i % 97}",
+        "languages_text": "Deutsch - C1\nEnglish - B2\nالعربية - C2",
+        "projects_text": f"Project {i}\nDescription line {i}\nhttps://example.org/{i}",
+        "education_text": f"University {i % 13}\n2010 - 2014",
+        "sections_left_text": f"[Hobbies]\n- Hobby {i % 31}",
+        "fit_page": "true" if i % 3 == 0 else "false",
+        "template": ("default", "classic", "compact")[i % 3],
+    }
+
+
+def assert_flat(samples: List[float]) -> None:
+    print(f"RSS samples (MiB): {[round(s, 1) for s in samples]}")
+    base = samples[0]
+    assert max(samples) - base < TOLERANCE_MB, f"RSS grew from {base:.1f} MiB: {[round(s, 1) for s in samples]}"
+
+
+def test_rss_flat_in_process():
+    from api.utils.payload import render_kwargs
+    from api.pdf_utils import build_resume_pdf
+
+    samples = []
+    for i in range(RENDERS):
+        build_resume_pdf(**render_kwargs(fields(i)))
+        if i >= WARMUP and i % 500 == 0:
+            samples.append(rss_mb())
+    assert_flat(samples)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@contextmanager
+def serving(*args: str) -> Iterator[tuple]:
+    """Runs ``python -m api serve`` with the default render executor; yields (master, client)."""
+    httpx = pytest.importorskip("httpx")
+    port = _free_port()
+    env = {k: v for k, v in os.environ.items() if k != "API_RENDER_EXECUTOR"}
+    env["PYTHONPATH"] = str(ROOT)
+    master = subprocess.Popen(
+        [sys.executable, "-m", "api", "serve", "--port", str(port), "--log-level", "warning", *args],
+        cwd=ROOT, env=env, start_new_session=True,
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=30) as client:
+            _wait_ready(client, httpx)
+            yield master, client
+    finally:
+        master.terminate()
+        master.wait(timeout=60)
+    assert not group_members(master.pid), "processes outlived the server"
+
+
+def _wait_ready(client, httpx) -> None:
+    for _ in range(300):
+        try:
+            if client.get("/readyz").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    pytest.fail("server did not become ready")
+
+
+def test_rss_flat_under_serve():
+    with serving("--workers", "2") as (master, client):
+        workers = children_of(master.pid)
+        assert len(workers) == 2
+        assert client.get("/stats").json()["render"]["executor"] == "process"
+        samples = []
+        for i in range(RENDERS):
+            r = client.post("/generate-form", data=fields(i))
+            assert r.status_code == 200, r.text
+            if i >= WARMUP and i % 500 == 0:
+                samples.append(tree_rss_mb(master.pid))
+        # No recycling was configured, so these are the same processes throughout.
+        assert sorted(children_of(master.pid)) == sorted(workers)
+        assert len(descendants_of(master.pid)) > len(workers)  # Pool processes were sampled too.
+    assert_flat(samples)
+
+
+def test_recycling_and_reload_keep_serving():
+    httpx = pytest.importorskip("httpx")
+    with serving("--workers", "2", "--max-requests", "25", "--graceful-timeout", "10") as (master, client):
+        first = set(children_of(master.pid))
+        headers = {"Connection": "close"}  # A recycled worker closes its kept-alive connections.
+        for i in range(150):
+            if i == 75:
+                before = set(children_of(master.pid))
+                master.send_signal(signal.SIGHUP)
+            r = client.post("/generate-form", data=fields(i), headers=headers)
+            assert r.status_code == 200, r.text
+        assert not first & set(children_of(master.pid)), "workers were not recycled"
+        deadline = time.monotonic() + 15
+        while before & set(children_of(master.pid)) and time.monotonic() < deadline:
+            time.sleep(0.2)
+        assert not before & set(children_of(master.pid)), "workers were not replaced on reload"
+        _wait_ready(client, httpx)
+        assert client.post("/generate-form", data=fields(0)).status_code == 200
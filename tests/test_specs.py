@@ -0,0 +1,56 @@
+"""
+Content-addressed resume URLs: specs that can no longer be rendered as registered.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.pdf_utils import resume
+from api.utils import specs
+
+PAYLOAD = {"name": "Spec Test", "email": "test@example.org", "skills": ["Python"]}
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(specs, "SPECS_DIR", tmp_path)
+    with TestClient(app) as c:
+        yield c
+
+
+def _register(client, payload=PAYLOAD) -> str:
+    r = client.post("/resume", json=payload)
+    assert r.status_code == 201
+    return r.json()["hash"]
+
+
+def test_registered_spec_is_served(client):
+    h = _register(client)
+    r = client.get(f"/resume/{h}.pdf")
+    assert r.status_code == 200 and r.content.startswith(b"%PDF-")
+    assert r.headers["etag"] == f'"{h}"'
+
+
+def test_renderer_change_before_first_render_is_gone(client, monkeypatch):
+    h = _register(client)
+    monkeypatch.setattr(resume, "RENDERER_VERSION", resume.RENDERER_VERSION + 1)
+    assert client.get(f"/resume/{h}.pdf").status_code == 410
+    assert not specs.pdf_path(h).exists()
+
+
+def test_cached_pdf_survives_renderer_change(client, monkeypatch):
+    h = _register(client)
+    first = client.get(f"/resume/{h}.pdf").content
+    monkeypatch.setattr(resume, "RENDERER_VERSION", resume.RENDERER_VERSION + 1)
+    assert client.get(f"/resume/{h}.pdf").content == first
+
+
+def test_invalid_stored_spec_is_gone(client):
+    h = _register(client)
+    specs.spec_path(h).write_text(json.dumps({**PAYLOAD, "template": "no-such-template"}))
+    assert client.get(f"/resume/{h}.pdf").status_code == 410
@@ -0,0 +1,223 @@
+"""
+The tokenizer-based parsers must return exactly what the line-by-line parsers
+they replaced returned, and run in linear time on large inputs.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import List, Optional, Tuple
+
+import pytest
+
+from api.utils import parsers
+from api.utils.tokenizer import BLANK, ITEM, LINK, TEXT, TITLE, parse_document, tokenize
+
+try:
+    from hypothesis import given, settings, strategies as st
+except ImportError:  # Optional; the seeded random test below always runs.
+    given = None
+
+
+# --- Reference implementations (api/utils/parsers.py before the tokenizer) ---
+
+def legacy_csv_or_lines(txt: str) -> List[str]:
+    if not txt:
+        return []
+    parts: List[str] = []
+    for line in txt.replace(",", "\n").splitlines():
+        s = line.strip()
+        if s:
+            parts.append(s)
+    return parts
+
+
+def legacy_sections(text: str) -> List[dict]:
+    sections: List[dict] = []
+    cur = {"title": "", "lines": []}
+    for raw in (text or "").splitlines():
+        line = raw.strip()
+        if not line:
+            if cur["title"] and cur["lines"]:
+                sections.append(cur)
+            cur = {"title": "", "lines": []}
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            if cur["title"] and cur["lines"]:
+                sections.append(cur)
+            cur = {"title": line.strip("[]").strip(), "lines": []}
+        elif line.startswith("-"):
+            cur["lines"].append(line[1:].strip())
+    if cur["title"] and cur["lines"]:
+        sections.append(cur)
+    return sections
+
+
+def legacy_simple_list(txt: str) -> List[str]:
+    return [s for s in (line.strip() for line in (txt or "").splitlines()) if s]
+
+
+def legacy_projects_blocks(txt: str) -> List[Tuple[str, str, Optional[str]]]:
+    blocks: List[Tuple[str, str, Optional[str]]] = []
+    cur_title, cur_desc, cur_link = "", [], None
+
+    def flush():
+        nonlocal cur_title, cur_desc, cur_link
+        if cur_title or cur_desc or cur_link:
+            blocks.append((cur_title.strip(), "\n".join(cur_desc).strip(), cur_link))
+        cur_title, cur_desc, cur_link = "", [], None
+
+    for raw in (txt or "").splitlines():
+        line = raw.strip()
+        if not line:
+            flush()
+            continue
+        if not cur_title:
+            cur_title = line
+        elif line.startswith("http://") or line.startswith("https://"):
+            cur_link = line
+        else:
+            cur_desc.append(line)
+    flush()
+    return blocks
+
+
+def legacy_sections_text(txt: str) -> List[dict]:
+    sections: List[dict] = []
+    title: Optional[str] = None
+    lines: List[str] = []
+
+    def flush():
+        nonlocal title, lines
+        if title and lines:
+            sections.append({"title": title, "lines": lines[:]})
+        title, lines = None, []
+
+    for raw in (txt or "").splitlines():
+        s = raw.strip()
+        if not s:
+            flush()
+            continue
+        if s.startswith("[") and s.endswith("]"):
+            flush()
+            title = s[1:-1].strip()
+        elif s[:1] in "-•–":
+            lines.append(s[1:].strip())
+        else:
+            if lines:
+                lines[-1] += " " + s
+            else:
+                title = title or s
+    flush()
+    return sections
+
+
+def legacy_education_blocks(txt: str) -> List[str]:
+    blocks: List[str] = []
+    cur: List[str] = []
+    for raw in (txt or "").splitlines():
+        ln = raw.rstrip()
+        if not ln.strip():
+            if cur:
+                blocks.append("\n".join(cur))
+                cur = []
+        else:
+            cur.append(ln)
+    if cur:
+        blocks.append("\n".join(cur))
+    return blocks
+
+
+PAIRS = [
+    (parsers.parse_csv_or_lines, legacy_csv_or_lines),
+    (parsers.parse_sections, legacy_sections),
+    (parsers.parse_simple_list, legacy_simple_list),
+    (parsers.parse_projects_blocks, legacy_projects_blocks),
+    (parsers.parse_sections_text, legacy_sections_text),
+    (parsers.parse_education_blocks, legacy_education_blocks),
+]
+
+# Lines that hit every branch of the old parsers, including the odd ones.
+FRAGMENTS = [
+    "", " ", "\t", "[Title]", "[ Spaced ]", "[]", "[unclosed", "closed]", "[a]b]",
+    "- item", "-item", "-", "  - indented", "• dot", "– dash", "—em", "* star",
+    "http://x.org", "https://y.org/p", "  https://z", "httpx://no", "plain text",
+    "a, b, c", ",", "Deutsch - B1", "عربي – C2", "x y",
+]
+
+
+def _random_text(rng: random.Random) -> str:
+    lines = [rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 30))]
+    return rng.choice(["\n", "\r\n"]).join(lines) + rng.choice(["", "\n"])
+
+
+def _assert_same(txt: str) -> None:
+    for new, old in PAIRS:
+        assert new(txt) == old(txt), (new.__name__, txt)
+
+
+def test_empty_inputs():
+    for txt in ("", None, "\n\n", "   \n\t"):
+        _assert_same(txt)
+
+
+def test_matches_legacy_parsers_random():
+    rng = random.Random(20260)
+    for _ in range(3000):
+        _assert_same(_random_text(rng))
+
+
+if given is not None:
+
+    @settings(max_examples=500, deadline=None)
+    @given(st.lists(st.one_of(st.sampled_from(FRAGMENTS), st.text(max_size=12)), max_size=40))
+    def test_matches_legacy_parsers_property(lines):
+        _assert_same("\n".join(lines))
+
+
+def test_token_kinds():
+    kinds = [t.kind for t in tokenize("[T]\n- a\nhttps://x\ntext\n\n")]
+    assert kinds == [TITLE, ITEM, LINK, TEXT, BLANK]
+
+
+def test_continuation_lines_are_joined_once():
+    doc = parse_document("[T]\n- head\n" + "more\n" * 3)
+    (item,) = doc.blocks[0].sections[0].items
+    assert item.continuation == ["more"] * 3
+    assert item.text == "head more more more"
+
+
+# --- Linear time on ~4 MB pathological inputs ---
+
+MB = 1 << 20
+
+PATHOLOGICAL = {
+    # One item continued by hundreds of thousands of plain lines: the old
+    # parser grew the item with += on every line.
+    "continuation": (parsers.parse_sections_text, lambda n: "[T]\n- head\n" + "word word\n" * (n // 10)),
+    "project": (parsers.parse_projects_blocks, lambda n: "Title\n" + "description\n" * (n // 12)),
+    "education": (parsers.parse_education_blocks, lambda n: "  school line\n" * (n // 14)),
+    "csv": (parsers.parse_csv_or_lines, lambda n: "skill," * (n // 6)),
+    "titles": (parsers.lint_sections_text, lambda n: "[unclosed\n- x\n" * (n // 14)),
+    "blank": (parsers.parse_sections_text, lambda n: "   \t\n" * (n // 5)),
+}
+
+
+def _best_time(fn, txt: str, rounds: int = 3) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        fn(txt)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+@pytest.mark.parametrize("case", sorted(PATHOLOGICAL))
+def test_linear_time(case):
+    fn, make = PATHOLOGICAL[case]
+    small, large = make(MB), make(4 * MB)
+    assert len(large) >= 4 * MB - 64
+    ratio = _best_time(fn, large, rounds=1) / max(_best_time(fn, small), 1e-6)
+    # Linear is 4x; quadratic would be about 16x. Leave room for timer noise.
+    assert ratio < 8, f"{case}: 4x input took {ratio:.1f}x as long"